@@ -38,6 +38,45 @@ good text editor, while still having very good IDE features for Python.
 
 __version__ = '0.9.0'
 
-from jedi.api import Script, Interpreter, NotFoundError, set_debug_function
-from jedi.api import preload_module, defined_names, names
+import sys
+import types
+
 from jedi import settings
+
+_api_names = ('Script', 'Interpreter', 'NotFoundError', 'set_debug_function',
+              'preload_module', 'defined_names', 'names', 'CancellationToken')
+
+
+class _JediModule(types.ModuleType):
+    """
+    Importing the API means importing the parser and the evaluator, which
+    takes a lot longer than anything else. Therefore the API is only imported
+    on first use.
+    """
+    def __getattr__(self, name):
+        if name in _api_names:
+            from jedi import api
+            return getattr(api, name)
+        raise AttributeError("module 'jedi' has no attribute '%s'" % name)
+
+    def __dir__(self):
+        return sorted(list(self.__dict__) + list(_api_names))
+
+
+if sys.version_info >= (3, 5):
+    sys.modules[__name__].__class__ = _JediModule
+else:
+    # The class of a module cannot be changed, so it's replaced. Keep a
+    # reference to the original module, because Python 2 clears the globals
+    # of deleted modules.
+    _module = _JediModule(__name__)
+    _module.__dict__.update(globals())
+    _module._original_module = sys.modules[__name__]
+    sys.modules[__name__] = _module
+
+if False:
+    # The API is only imported by `_JediModule.__getattr__`, but these imports
+    # keep it visible to static analysis (e.g. |jedi| itself).
+    from jedi.api import Script, Interpreter, NotFoundError, set_debug_function
+    from jedi.api import preload_module, defined_names, names
+    from jedi.api import CancellationToken
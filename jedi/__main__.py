@@ -6,6 +6,9 @@ if len(argv) == 2 and argv[1] == 'repl':
     # don't want to use __main__ only for repl yet, maybe we want to use it for
     # something else. So just use the keyword ``repl`` for now.
     print(join(dirname(abspath(__file__)), 'api', 'replstartup.py'))
+elif len(argv) > 1 and argv[1] == 'serve':
+    from jedi.server import main
+    main(argv[2:])
 elif len(argv) > 1 and argv[1] == 'linter':
     """
     This is a pre-alpha API. You're not supposed to use it at all, except for
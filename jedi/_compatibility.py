@@ -174,6 +174,16 @@ try:
 except ImportError:
     from itertools import izip_longest as zip_longest  # Python 2
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2
+
+try:
+    from urllib.parse import quote, unquote
+except ImportError:
+    from urllib import quote, unquote  # Python 2
+
 
 def no_unicode_pprint(dct):
     """
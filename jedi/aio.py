@@ -0,0 +1,133 @@
+"""
+An :mod:`asyncio` interface for |jedi| (Python 3.4+). The functions have the
+same parameters as :class:`jedi.Script` and return awaitables of the results
+of the corresponding :class:`jedi.Script` methods::
+
+    completions = yield from jedi.aio.completions(source, line, column, path)
+
+The evaluation runs in a single worker thread. Other threads can use |jedi| at
+the same time, but properties of the results that are evaluated lazily (e.g.
+:meth:`jedi.api.classes.BaseDefinition.docstring`) should only be used by one
+thread.
+
+Cancelling an awaitable stops the evaluation through a
+:class:`jedi.CancellationToken`. Equal requests that are running at the same
+time are only evaluated once. Requests for the same buffer are equal if they
+have the same ``version`` (e.g. the version of the document in the editor) or,
+without a version, the same source. The evaluation is only cancelled if all
+of them are cancelled.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from jedi import api
+from jedi import common
+
+_executor = None
+_in_flight = {}
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1)
+    return _executor
+
+
+def shutdown(wait=True):
+    """Stops the worker thread. It's started again by the next request."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait)
+        _executor = None
+
+
+class _Request(object):
+    """An evaluation that is shared by equal requests."""
+    def __init__(self, loop, key, func):
+        self.key = key
+        self.waiters = 0
+        self.token = common.CancellationToken()
+        self.future = loop.run_in_executor(_get_executor(), func, self.token)
+        self.future.add_done_callback(self._finished)
+
+    def _finished(self, future):
+        if _in_flight.get(self.key) is self:
+            del _in_flight[self.key]
+
+    def add_waiter(self, loop):
+        waiter = asyncio.Future(loop=loop)
+        self.waiters += 1
+
+        def set_result(future):
+            if waiter.done():
+                return
+            if future.cancelled():
+                waiter.cancel()
+            elif future.exception() is not None:
+                waiter.set_exception(future.exception())
+            else:
+                waiter.set_result(future.result())
+
+        def cancel(waiter):
+            if waiter.cancelled():
+                self.waiters -= 1
+                if not self.waiters:
+                    self.token.cancel()
+                    self.future.cancel()
+                    self._finished(self.future)
+
+        self.future.add_done_callback(set_result)
+        waiter.add_done_callback(cancel)
+        return waiter
+
+
+def _request(method, source, line, column, path, version, loop, args=()):
+    loop = loop or asyncio.get_event_loop()
+    buffer = source if version is None else version
+    key = loop, method, path, buffer, line, column, args
+
+    def evaluate(token):
+        script = api.Script(source, line, column, path,
+                            cancellation_token=token)
+        return getattr(script, method)(*args)
+
+    try:
+        request = _in_flight[key]
+    except KeyError:
+        request = _in_flight[key] = _Request(loop, key, evaluate)
+    return request.add_waiter(loop)
+
+
+def completions(source, line=None, column=None, path=None, version=None,
+                loop=None):
+    """See :meth:`jedi.Script.completions`."""
+    return _request('completions', source, line, column, path, version, loop)
+
+
+def goto_definitions(source, line=None, column=None, path=None, version=None,
+                     loop=None):
+    """See :meth:`jedi.Script.goto_definitions`."""
+    return _request('goto_definitions', source, line, column, path, version,
+                    loop)
+
+
+def goto_assignments(source, line=None, column=None, path=None, version=None,
+                     loop=None):
+    """See :meth:`jedi.Script.goto_assignments`."""
+    return _request('goto_assignments', source, line, column, path, version,
+                    loop)
+
+
+def usages(source, line=None, column=None, path=None, version=None,
+           loop=None, additional_module_paths=()):
+    """See :meth:`jedi.Script.usages`."""
+    return _request('usages', source, line, column, path, version, loop,
+                    (tuple(additional_module_paths),))
+
+
+def call_signatures(source, line=None, column=None, path=None, version=None,
+                    loop=None):
+    """See :meth:`jedi.Script.call_signatures`."""
+    return _request('call_signatures', source, line, column, path, version,
+                    loop)
@@ -4,12 +4,15 @@ use its methods.
 
 Additionally you can add a debug function with :func:`set_debug_function`.
 
-.. warning:: Please, note that Jedi is **not thread safe**.
+.. note:: Different :class:`Script` objects can be used by different threads at
+   the same time. A single :class:`Script` and the objects it returns should
+   only be used by one thread.
 """
 import re
 import os
 import warnings
 import sys
+import functools
 from itertools import chain
 
 from jedi._compatibility import unicode, builtins
@@ -20,6 +23,7 @@ from jedi.parser.user_context import UserContext, UserContextParser
 from jedi import debug
 from jedi import settings
 from jedi import common
+from jedi.common import CancellationToken
 from jedi import cache
 from jedi.api import keywords
 from jedi.api import classes
@@ -31,7 +35,7 @@ from jedi.evaluate import representation as er
 from jedi.evaluate import compiled
 from jedi.evaluate import imports
 from jedi.evaluate.cache import memoize_default
-from jedi.evaluate.helpers import FakeName, get_module_names
+from jedi.evaluate.helpers import FakeName, get_module_names, call_of_name
 from jedi.evaluate.finder import global_names_dict_generator, filter_definition_names
 from jedi.evaluate import analysis
 
@@ -50,6 +54,22 @@ class NotFoundError(Exception):
     """
 
 
+def _api_call(func):
+    """
+    Every API call starts with complete results, so that
+    :attr:`Script.results_are_partial` only refers to the last call. The
+    indexes that were filled by the call are written once it's done.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._evaluator.results_are_partial = False
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            cache.CallSiteIndex.flush()
+    return wrapper
+
+
 class Script(object):
     """
     A Script is the base for completions, goto or whatever you want to do with
@@ -73,9 +93,14 @@ class Script(object):
     :param source_encoding: The encoding of ``source``, if it is not a
         ``unicode`` object (default ``'utf-8'``).
     :type encoding: str
+    :param cancellation_token: Stops the evaluation when it's cancelled or
+        its timeout expires. The API calls then return the results found so
+        far and :attr:`results_are_partial` is set.
+    :type cancellation_token: :class:`CancellationToken`
     """
     def __init__(self, source=None, line=None, column=None, path=None,
-                 encoding='utf-8', source_path=None, source_encoding=None):
+                 encoding='utf-8', source_path=None, source_encoding=None,
+                 cancellation_token=None):
         if source_path is not None:
             warnings.warn("Use path instead of source_path.", DeprecationWarning)
             path = source_path
@@ -109,7 +134,7 @@ class Script(object):
         self._parser = UserContextParser(self._grammar, self.source, path,
                                          self._pos, self._user_context,
                                          self._parsed_callback)
-        self._evaluator = Evaluator(self._grammar)
+        self._evaluator = Evaluator(self._grammar, cancellation_token)
         debug.speed('init')
 
     def _parsed_callback(self, parser):
@@ -126,9 +151,20 @@ class Script(object):
         warnings.warn("Use path instead of source_path.", DeprecationWarning)
         return self.path
 
+    @property
+    def results_are_partial(self):
+        """
+        True if the evaluation of the last API call was stopped by the
+        ``cancellation_token`` or if types had to be merged, because there
+        were more than :data:`jedi.settings.max_inferred_types`. Its results
+        are incomplete in this case.
+        """
+        return self._evaluator.results_are_partial
+
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, repr(self._orig_path))
 
+    @_api_call
     def completions(self):
         """
         Return :class:`classes.Completion` objects. Those objects contain
@@ -323,6 +359,7 @@ class Script(object):
         stmt.parent = self._parser.user_scope()
         return stmt
 
+    @_api_call
     def goto_definitions(self):
         """
         Return the definitions of a the path under the cursor.  goto function!
@@ -335,13 +372,6 @@ class Script(object):
 
         :rtype: list of :class:`classes.Definition`
         """
-        def resolve_import_paths(scopes):
-            for s in scopes.copy():
-                if isinstance(s, imports.ImportWrapper):
-                    scopes.remove(s)
-                    scopes.update(resolve_import_paths(set(s.follow())))
-            return scopes
-
         goto_path = self._user_context.get_path_under_cursor()
         context = self._user_context.get_context()
         definitions = set()
@@ -365,11 +395,74 @@ class Script(object):
         if not definitions and goto_path:
             definitions = set(self._prepare_goto(goto_path))
 
-        definitions = resolve_import_paths(definitions)
+        definitions = helpers.resolve_import_paths(definitions)
         names = [s.name for s in definitions]
         defs = [classes.Definition(self._evaluator, name) for name in names]
         return helpers.sorted_definitions(set(defs))
 
+    @_api_call
+    def definitions_of_names(self, positions=None):
+        """
+        Return the definitions of many names in the file at once, like
+        :meth:`goto_definitions` does for a single name. The parser and the
+        evaluator are shared by all the names, which is a lot faster than
+        creating a :class:`Script` for every position (e.g. for semantic
+        highlighting). Unlike :meth:`goto_definitions`, it also evaluates the
+        variables of comprehensions and the names in functions that define
+        classes.
+
+        :param positions: ``(line, column)`` tuples of the names. If None, the
+            definitions of all the names in the file are returned.
+        :return: The names mapped to their definitions.
+        :rtype: dict of :class:`classes.Definition` to lists of
+            :class:`classes.Definition`
+        """
+        names = get_module_names(self._parser.module(), all_scopes=True)
+        if positions is not None:
+            names_on_lines = {}
+            for name in names:
+                names_on_lines.setdefault(name.start_pos[0], []).append(name)
+            names = [name for pos in positions
+                     for name in names_on_lines.get(pos[0], [])
+                     if name.start_pos <= pos <= name.end_pos]
+
+        result = {}
+        for name in names:
+            definitions = self._definitions_of_name(name)
+            definitions = helpers.resolve_import_paths(set(definitions))
+            defs = [classes.Definition(self._evaluator, d.name) for d in definitions]
+            name = classes.Definition(self._evaluator, name)
+            result[name] = helpers.sorted_definitions(set(defs))
+        debug.speed('definitions_of_names end')
+        return result
+
+    def _definitions_of_name(self, name):
+        """
+        Evaluates a name of the module like :meth:`goto_definitions` does with
+        the name under the cursor: The names of classes, functions and imports
+        are their definitions and names in brackets (e.g. ``x`` in ``foo[x]``)
+        are evaluated on their own. Attributes are looked up on their objects,
+        even if they are assigned (e.g. ``self.foo = 1``), so all of their
+        assignments are found.
+
+        The only difference is that the name is evaluated in its own scope,
+        while :meth:`goto_definitions` parses the path under the cursor again
+        and evaluates it at the start of the statement. It therefore returns
+        nothing for the variables of comprehensions and for the names in
+        functions that define classes.
+        """
+        definition = name.get_definition()
+        if definition.type in ('classdef', 'funcdef') and definition.name is name:
+            return [self._evaluator.wrap(definition)]
+        elif isinstance(definition, tree.Import):
+            return imports.ImportWrapper(self._evaluator, name).follow()
+        elif tree.is_node(name.parent, 'trailer'):
+            if name.parent.children[0] == '.':
+                return self._evaluator.eval_element(call_of_name(name))
+            return self._evaluator.eval_element(name)
+        return self._evaluator.goto_definition(name)
+
+    @_api_call
     def goto_assignments(self):
         """
         Return the first definition found. Imports and statements aren't
@@ -450,6 +543,7 @@ class Script(object):
             definitions = follow_inexistent_imports(defs)
         return definitions
 
+    @_api_call
     def usages(self, additional_module_paths=()):
         """
         Return :class:`classes.Definition` objects, which contain all
@@ -461,9 +555,7 @@ class Script(object):
 
         :rtype: list of :class:`classes.Definition`
         """
-        temp, settings.dynamic_flow_information = \
-            settings.dynamic_flow_information, False
-        try:
+        with self._evaluator.override_settings(dynamic_flow_information=False):
             user_stmt = self._parser.user_stmt()
             definitions = self._goto(add_import_name=True)
             if not definitions and isinstance(user_stmt, tree.Import):
@@ -491,11 +583,10 @@ class Script(object):
 
             for d in set(definitions):
                 names.append(classes.Definition(self._evaluator, d))
-        finally:
-            settings.dynamic_flow_information = temp
 
         return helpers.sorted_definitions(set(names))
 
+    @_api_call
     def call_signatures(self):
         """
         Return the function object of the call you're currently in.
@@ -520,7 +611,8 @@ class Script(object):
         if stmt is None:
             return []
 
-        with common.scale_speed_settings(settings.scale_call_signatures):
+        with common.scale_speed_settings(self._evaluator,
+                                         settings.scale_call_signatures):
             origins = cache.cache_call_signatures(self._evaluator, stmt,
                                                   self.source, self._pos)
         debug.speed('func_call followed')
@@ -528,6 +620,7 @@ class Script(object):
         return [classes.CallSignature(self._evaluator, o.name, stmt, call_index, key_name)
                 for o in origins if hasattr(o, 'py__call__')]
 
+    @_api_call
     def _analysis(self):
         def check_types(types):
             for typ in types:
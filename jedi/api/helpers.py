@@ -21,6 +21,15 @@ def sorted_definitions(defs):
     return sorted(defs, key=lambda x: (x.module_path or '', x.line or 0, x.column or 0))
 
 
+def resolve_import_paths(scopes):
+    """Replaces the imports in a set of scopes with what they import."""
+    for s in scopes.copy():
+        if isinstance(s, imports.ImportWrapper):
+            scopes.remove(s)
+            scopes.update(resolve_import_paths(set(s.follow())))
+    return scopes
+
+
 def get_on_import_stmt(evaluator, user_context, user_stmt, is_like_search=False):
     """
     Resolve the user statement, if it is an import. Only resolve the
@@ -22,9 +22,10 @@ def add_namespaces_to_parser(evaluator, namespaces, parser_module):
     for namespace in namespaces:
         for key, value in namespace.items():
             # Name lookups in an ast tree work by checking names_dict.
-            # Therefore we just add fake names to that and we're done.
+            # Therefore we just add fake names to that and we're done. They
+            # are positioned at (0, 0), so keep the names sorted.
             arr = parser_module.names_dict.setdefault(key, [])
-            arr.append(LazyName(evaluator, parser_module, key, value))
+            arr.insert(0, LazyName(evaluator, parser_module, key, value))
 
 
 class LazyName(helpers.FakeName):
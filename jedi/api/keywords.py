@@ -1,4 +1,3 @@
-import pydoc
 import keyword
 
 from jedi._compatibility import is_py3
@@ -6,11 +5,6 @@ from jedi import common
 from jedi.evaluate import compiled
 from jedi.evaluate.helpers import FakeName
 from jedi.parser.tree import Leaf
-try:
-    from pydoc_data import topics as pydoc_topics
-except ImportError:
-    # Python 2.6
-    import pydoc_topics
 
 if is_py3:
     keys = keyword.kwlist
@@ -92,6 +86,15 @@ def imitate_pydoc(string):
     It's not possible to get the pydoc's without starting the annoying pager
     stuff.
     """
+    # pydoc is imported here, because it's slow to import and only needed for
+    # the documentation of keywords.
+    import pydoc
+    try:
+        from pydoc_data import topics as pydoc_topics
+    except ImportError:
+        # Python 2.6
+        import pydoc_topics
+
     # str needed because of possible unicode stuff in py2k (pydoc doesn't work
     # with unicode strings)
     string = str(string)
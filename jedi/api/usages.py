@@ -23,11 +23,15 @@ def usages(evaluator, definition_names, mods):
     mods |= set([d.get_parent_until() for d in definition_names])
     definitions = []
     for m in imports.get_modules_containing_name(evaluator, mods, search_name):
+        if evaluator.is_cancelled():
+            break
         try:
             check_names = m.used_names[search_name]
         except KeyError:
             continue
         for name in check_names:
+            if evaluator.is_cancelled():
+                break
 
             result = evaluator.goto(name)
             if [c for c in compare_array(result) if c in compare_definitions]:
@@ -5,23 +5,32 @@ available:
 
 - module caching (`load_parser` and `save_parser`), which uses pickle and is
   really important to assure low load times of modules like ``numpy``.
+- ``hierarchy_cache`` keeps the base classes of classes for other
+  evaluators, validated by the hashes of the modules involved.
 - ``time_cache`` can be used to cache something for just a limited time span,
   which can be useful if there's user interaction and the user cannot react
   faster than a certain time.
-
-This module is one of the reasons why |jedi| is not thread-safe. As you can see
-there are global variables, which are holding the cache information. Some of
-these variables are being cleaned after every API usage.
+- ``SysPathCache`` keeps the ``sys.path`` additions of projects (Django,
+  buildout), validated by file fingerprints.
+- ``NameIndex`` knows which files contain which identifiers.
+- ``CallSiteIndex`` knows which definitions the calls of a module resolve to.
+- ``SnapshotPickling`` stores the introspection results of extension modules.
+- ``FakeModuleBundle`` stores the parsed ``.pym`` files of faked modules.
+
+The caches are global variables, shared by all evaluators and threads. The
+parser cache is guarded by ``parser_lock``, the in-memory caches are
+``LRUCache`` objects with their own lock and the persistent indexes lock
+themselves. Their files are written atomically, so other processes never read
+a partially written file.
 """
 import time
 import os
 import sys
 import json
-import hashlib
 import gc
 import inspect
-import shutil
 import re
+import threading
 try:
     import cPickle as pickle
 except ImportError:
@@ -35,6 +44,90 @@ _time_caches = {}
 
 # for fast_parser, should not be deleted
 parser_cache = {}
+# Held while parsers are loaded, saved or updated.
+parser_lock = threading.RLock()
+
+def md5(data):
+    # hashlib is slow to import and not needed before files are cached.
+    import hashlib
+    return hashlib.md5(data).hexdigest()
+
+
+def _write_atomic(path, write, mode='w'):
+    """
+    Calls ``write`` with a temporary file, that replaces ``path`` afterwards.
+    Other processes therefore never read a partially written file.
+    """
+    import tempfile
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    fd, temp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        if os.name == 'nt' and os.path.exists(path):
+            # `os.rename` doesn't replace files on Windows.
+            os.remove(path)
+        os.rename(temp_path, path)
+    except:
+        with common.ignored(OSError):
+            os.remove(temp_path)
+        raise
+
+
+def _synchronized(method):
+    """Holds the lock of the object while ``method`` is running."""
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LRUCache(object):
+    """
+    A dict-like cache with at most ``max_size`` entries, that can be shared by
+    threads. If it's full, the least recently used half of the entries is
+    removed.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = {}
+        self._tick = 0
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            entry = self._entries[key]
+            self._tick += 1
+            entry[0] = self._tick
+            return entry[1]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                self._remove_least_recently_used()
+            self._tick += 1
+            self._entries[key] = [self._tick, value]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove_least_recently_used(self):
+        ticks = sorted(tick for tick, value in self._entries.values())
+        limit = ticks[len(ticks) // 2]
+        for key, (tick, value) in list(self._entries.items()):
+            if tick < limit:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# The base classes of classes, shared by evaluators, see
+# `jedi.evaluate.representation.Class.py__bases__`.
+hierarchy_cache = LRUCache(10000)
 
 
 class ParserCacheItem(object):
@@ -58,14 +151,16 @@ def clear_time_caches(delete_all=False):
         for cache in _time_caches.values():
             cache.clear()
         parser_cache.clear()
+        hierarchy_cache.clear()
     else:
         # normally just kill the expired entries, not all
         for tc in _time_caches.values():
             # check time_cache for expired entries
             for key, (t, value) in list(tc.items()):
                 if t < time.time():
-                    # delete expired entries
-                    del tc[key]
+                    # delete expired entries, other threads might have
+                    # deleted them already.
+                    tc.pop(key, None)
 
 
 def time_cache(time_add_setting):
@@ -75,6 +170,8 @@ def time_cache(time_add_setting):
     use the function with a callable that returns the key.
     But: This function is only called if the key is not available. After a
     certain amount of time (`time_add_setting`) the cache is invalid.
+    The callable may yield ``False`` after the value, if the value must not be
+    cached.
     """
     def _temp(key_func):
         dct = {}
@@ -92,7 +189,7 @@ def time_cache(time_add_setting):
 
             value = next(generator)
             time_add = getattr(settings, time_add_setting)
-            if key is not None:
+            if key is not None and next(generator, True):
                 dct[key] = time.time() + time_add, value
             return value
         return wrapper
@@ -113,6 +210,9 @@ def cache_call_signatures(evaluator, call, source, user_pos):
     module_path = call.get_parent_until().path
     yield None if module_path is None else (module_path, before_bracket, call.start_pos)
     yield evaluator.eval_element(call)
+    # Call signatures of cancelled evaluations are incomplete and widened
+    # types would not be marked as partial anymore.
+    yield not (evaluator.is_cancelled() or evaluator.results_are_partial)
 
 
 def underscore_memoization(func):
@@ -191,41 +291,68 @@ def invalidate_star_import_cache(path):
         _invalidate_star_import_cache_module(parser_cache_item.parser.module)
 
 
+def _share_parser(parser):
+    """
+    Parsers that are used by other threads than the one that created them are
+    never updated in place again (see `jedi.parser.fast.CachedFastParser`).
+    """
+    ident = getattr(parser, 'thread_ident', None)
+    if ident is not None and ident != threading.current_thread().ident:
+        parser.thread_ident = None
+    return parser
+
+
+def cached_parser_item(path):
+    """
+    Returns the :class:`ParserCacheItem` of a path, whether it's up to date or
+    not, or None.
+    """
+    with parser_lock:
+        try:
+            item = parser_cache[path]
+        except KeyError:
+            return None
+        _share_parser(item.parser)
+        return item
+
+
 def load_parser(path):
     """
     Returns the module or None, if it fails.
     """
-    p_time = os.path.getmtime(path) if path else None
-    try:
-        parser_cache_item = parser_cache[path]
-        if not path or p_time <= parser_cache_item.change_time:
-            return parser_cache_item.parser
-        else:
-            # In case there is already a module cached and this module
-            # has to be reparsed, we also need to invalidate the import
-            # caches.
-            _invalidate_star_import_cache_module(parser_cache_item.parser.module)
-    except KeyError:
-        if settings.use_filesystem_cache:
-            return ParserPickling.load_parser(path, p_time)
+    with parser_lock:
+        p_time = os.path.getmtime(path) if path else None
+        try:
+            parser_cache_item = parser_cache[path]
+            if not path or p_time <= parser_cache_item.change_time:
+                return _share_parser(parser_cache_item.parser)
+            else:
+                # In case there is already a module cached and this module
+                # has to be reparsed, we also need to invalidate the import
+                # caches.
+                _invalidate_star_import_cache_module(parser_cache_item.parser.module)
+        except KeyError:
+            if settings.use_filesystem_cache:
+                return ParserPickling.load_parser(path, p_time)
 
 
 def save_parser(path, parser, pickling=True):
-    try:
-        p_time = None if path is None else os.path.getmtime(path)
-    except OSError:
-        p_time = None
-        pickling = False
+    with parser_lock:
+        try:
+            p_time = None if path is None else os.path.getmtime(path)
+        except OSError:
+            p_time = None
+            pickling = False
 
-    item = ParserCacheItem(parser, p_time)
-    parser_cache[path] = item
-    if settings.use_filesystem_cache and pickling:
-        ParserPickling.save_parser(path, item)
+        item = ParserCacheItem(parser, p_time)
+        parser_cache[path] = item
+        if settings.use_filesystem_cache and pickling:
+            ParserPickling.save_parser(path, item)
 
 
 class ParserPickling(object):
 
-    version = 24
+    version = 29
     """
     Version number (integer) for file system cache.
 
@@ -317,10 +444,11 @@ class ParserPickling(object):
         self.__index = None
 
     def clear_cache(self):
+        import shutil
         shutil.rmtree(self._cache_directory())
 
     def _get_hashed_path(self, path):
-        return self._get_path('%s.pkl' % hashlib.md5(path.encode("utf-8")).hexdigest())
+        return self._get_path('%s.pkl' % md5(path.encode("utf-8")))
 
     def _get_path(self, file):
         dir = self._cache_directory()
@@ -334,3 +462,539 @@ class ParserPickling(object):
 
 # is a singleton
 ParserPickling = ParserPickling()
+
+
+def file_fingerprint(path, hash_content=False):
+    """
+    Returns ``[mtime, md5]`` of a file or directory, ``md5`` is only
+    calculated if ``hash_content`` is set. Raises ``OSError`` if the path
+    doesn't exist.
+    """
+    mtime = os.path.getmtime(path)
+    digest = None
+    if hash_content:
+        digest = _hash_file(path)
+    return [mtime, digest]
+
+
+def _hash_file(path):
+    with open(path, 'rb') as f:
+        return md5(f.read())
+
+
+def fingerprint_is_valid(fingerprint):
+    """
+    Checks a dict of ``path -> file_fingerprint(path)``. A changed mtime is
+    still valid if the content hash didn't change. Paths that only need to
+    exist (or not) are mapped to True (or False).
+    """
+    for path, value in fingerprint.items():
+        if isinstance(value, bool):
+            if os.path.exists(path) != value:
+                return False
+            continue
+        mtime, digest = value
+        try:
+            current = os.path.getmtime(path)
+        except OSError:
+            return False
+        if current != mtime:
+            try:
+                if digest is None or _hash_file(path) != digest:
+                    return False
+            except IOError:
+                return False
+            fingerprint[path] = [current, digest]
+    return True
+
+
+class SysPathCache(object):
+    """
+    Caches the ``sys.path`` additions of a project directory (Django project
+    roots and paths from buildout scripts), which are expensive to find. The
+    entries are shared between all evaluators and are also written to
+    :data:`jedi.settings.cache_directory`, so that other processes can use
+    them.
+
+    Each entry is stored with a fingerprint (see :func:`fingerprint_is_valid`)
+    of the files it was computed from and is discarded once the fingerprint is
+    not valid anymore. The paths are not filtered against the
+    ``sys.path`` of the current process, because other processes might use
+    different interpreters.
+    """
+
+    version = 3
+
+    def __init__(self):
+        self.__entries = None
+        self.__entries_path = None
+        self._lock = threading.RLock()
+
+    @_synchronized
+    def get(self, directory):
+        """Returns the cached paths or None if there's no valid entry."""
+        try:
+            fingerprint, paths = self._entries[directory]
+        except KeyError:
+            return None
+        if not fingerprint_is_valid(fingerprint):
+            del self._entries[directory]
+            return None
+        return list(paths)
+
+    @_synchronized
+    def set(self, directory, fingerprint, paths):
+        self._entries[directory] = fingerprint, list(paths)
+        if settings.use_filesystem_cache:
+            self._flush()
+
+    @property
+    def _entries(self):
+        path = self._get_path()
+        if self.__entries is None or self.__entries_path != path:
+            self.__entries_path = path
+            self.__entries = {}
+            if settings.use_filesystem_cache:
+                try:
+                    with open(path) as f:
+                        data = json.load(f)
+                except (IOError, ValueError):
+                    pass
+                else:
+                    if data.get('version', 0) == self.version:
+                        self.__entries = data['entries']
+        return self.__entries
+
+    def _flush(self):
+        data = {'version': self.version, 'entries': self._entries}
+        _write_atomic(self._get_path(), lambda f: json.dump(data, f))
+
+    @_synchronized
+    def clear_cache(self):
+        self.__entries = None
+        with common.ignored(OSError):
+            os.remove(self._get_path())
+
+    def _get_path(self):
+        return os.path.join(ParserPickling._cache_directory(), 'sys_paths.json')
+
+
+# is a singleton
+SysPathCache = SysPathCache()
+
+
+class NameIndex(object):
+    """
+    An inverted index that maps identifiers to the files they appear in.
+    Searching for usages or for the callers of a function would otherwise need
+    to read every Python file of a project.
+
+    Files are re-indexed once their mtime changes. The index is pickled next
+    to the parser cache.
+    """
+
+    version = 1
+
+    _identifier_re = re.compile(r'[^\W\d]\w*', re.UNICODE)
+
+    def __init__(self):
+        self.__files = None
+        self.__files_path = None
+        self.__paths_by_name = {}
+        self._changed = False
+        self._lock = threading.RLock()
+
+    @_synchronized
+    def filter_paths(self, paths, name, contains=None):
+        """
+        Returns the paths of the files that contain the identifier ``name``,
+        in the order of ``paths``. Files that cannot be read are ignored.
+
+        :param contains: A cheaper check ``contains(path, name)`` for files
+            that are not indexed or changed. Only the files that pass it are
+            indexed, the others are checked again by the next search.
+        """
+        files = self._files
+        for path in paths:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                self._remove(path)
+                continue
+            try:
+                up_to_date = files[path][0] == mtime
+            except KeyError:
+                up_to_date = False
+            if not up_to_date:
+                if contains is not None and not contains(path, name):
+                    self._remove(path)
+                    continue
+                try:
+                    names = self._read_names(path)
+                except IOError:
+                    continue
+                self._remove(path)
+                self._add(path, mtime, names)
+        if self._changed:
+            self._flush()
+
+        containing = self.__paths_by_name.get(name, ())
+        return [p for p in paths if p in containing]
+
+    def _read_names(self, path):
+        with open(path, 'rb') as f:
+            source = common.source_to_unicode(f.read())
+        return frozenset(self._identifier_re.findall(source))
+
+    def _add(self, path, mtime, names):
+        self._files[path] = mtime, names
+        for name in names:
+            self.__paths_by_name.setdefault(name, set()).add(path)
+        self._changed = True
+
+    def _remove(self, path):
+        try:
+            mtime, names = self._files.pop(path)
+        except KeyError:
+            return
+        for name in names:
+            self.__paths_by_name[name].discard(path)
+        self._changed = True
+
+    @property
+    def _files(self):
+        path = self._get_path()
+        if self.__files is None or self.__files_path != path:
+            self.__files_path = path
+            self.__files = {}
+            self.__paths_by_name = {}
+            if settings.use_filesystem_cache:
+                try:
+                    with open(path, 'rb') as f:
+                        data = pickle.load(f)
+                except (IOError, EOFError, pickle.UnpicklingError):
+                    pass
+                else:
+                    if data.get('version', 0) == self.version:
+                        self.__files = data['files']
+                        for file_path, (mtime, names) in self.__files.items():
+                            for name in names:
+                                self.__paths_by_name.setdefault(name, set()) \
+                                    .add(file_path)
+        return self.__files
+
+    def _flush(self):
+        self._changed = False
+        if not settings.use_filesystem_cache:
+            return
+        data = {'version': self.version, 'files': self._files}
+        _write_atomic(self._get_path(),
+                      lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL),
+                      'wb')
+
+    @_synchronized
+    def clear_cache(self):
+        self.__files = None
+        with common.ignored(OSError):
+            os.remove(self._get_path())
+
+    def _get_path(self):
+        return os.path.join(ParserPickling._cache_directory(), 'name_index.pkl')
+
+
+# is a singleton
+NameIndex = NameIndex()
+
+
+class CallSiteIndex(object):
+    """
+    Remembers which definitions the calls of the modules of a project resolve
+    to. The dynamic param search (:mod:`jedi.evaluate.dynamic`) then only
+    needs to evaluate the calls of the function it's looking for and doesn't
+    need to load modules at all, if none of their calls is one of it.
+
+    Definitions are keyed by ``(path, source_hash, start_pos)``. The calls of
+    a module are stored with the hash of its source, therefore changed files
+    and unsaved buffers are indexed again. The calls could also have been
+    resolved through other modules (e.g. ``from b import foo``), the hashes
+    of these modules are stored with them as well, see
+    :meth:`get_dependencies`. Only complete results are stored:
+    Calls that couldn't be resolved (e.g. because the evaluation was
+    cancelled) are evaluated again next time. The index is pickled next to
+    the parser cache by :meth:`flush`.
+    """
+
+    version = 3
+
+    def __init__(self):
+        self.__modules = None
+        self.__modules_path = None
+        self._changed = False
+        self._lock = threading.RLock()
+
+    @_synchronized
+    def get_definitions(self, path, source_hash, call):
+        """
+        Returns the definition keys of a call or None if the call is not
+        indexed. ``call`` is a tuple of the name and its position.
+        """
+        entry = self._get_entry(path, source_hash)
+        if entry is None:
+            return None
+        return entry[0].get(call)
+
+    @_synchronized
+    def get_calls(self, path, source_hash, name):
+        """
+        Returns the calls of ``name`` in a module mapped to their definition
+        keys or None if not all of them are indexed.
+        """
+        entry = self._get_entry(path, source_hash)
+        if entry is None or name not in entry[1]:
+            return None
+        return dict((call, definitions) for call, definitions in entry[0].items()
+                    if call[0] == name)
+
+    @_synchronized
+    def get_dependencies(self, path, source_hash):
+        """
+        Returns the hashes of the modules, that the calls of a module were
+        resolved through, as a dict of paths and hashes or None. The calls are
+        only valid as long as these modules don't change.
+        """
+        entry = self._get_entry(path, source_hash)
+        if entry is None:
+            return None
+        return dict(entry[2])
+
+    @_synchronized
+    def set_definitions(self, path, source_hash, call, definitions,
+                        dependencies):
+        """
+        Stores the definition keys of a call and the ``(path, source_hash)``
+        pairs of the modules it was resolved through. Empty lists are not
+        stored, because they would hide the call from every search.
+
+        Returns False if the other calls of the module were removed, because
+        they were resolved with other versions of these modules.
+        """
+        if not definitions:
+            return True
+        kept = True
+        entry = self._create_entry(path, source_hash)
+        if any(entry[2].get(p, h) != h for p, h in dependencies):
+            self.remove(path)
+            entry = self._create_entry(path, source_hash)
+            kept = False
+        entry[0][call] = definitions
+        entry[2].update(dependencies)
+        self._changed = True
+        return kept
+
+    @_synchronized
+    def set_complete(self, path, source_hash, name):
+        """Marks that all the calls of ``name`` in a module are indexed."""
+        self._create_entry(path, source_hash)[1].add(name)
+        self._changed = True
+
+    @_synchronized
+    def remove(self, path):
+        """Removes the calls of a module."""
+        if self._modules.pop(path, None) is not None:
+            self._changed = True
+
+    def _get_entry(self, path, source_hash):
+        try:
+            entry = self._modules[path]
+        except KeyError:
+            return None
+        if entry[0] != source_hash:
+            return None
+        return entry[1:]
+
+    def _create_entry(self, path, source_hash):
+        entry = self._get_entry(path, source_hash)
+        if entry is None:
+            entry = {}, set(), {}
+            self._modules[path] = (source_hash,) + entry
+        return entry
+
+    @_synchronized
+    def flush(self):
+        """Writes the index, if it was changed."""
+        if not self._changed:
+            return
+        self._changed = False
+        if not settings.use_filesystem_cache:
+            return
+        data = {'version': self.version, 'modules': self._modules}
+        _write_atomic(self._get_path(),
+                      lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL),
+                      'wb')
+
+    @property
+    def _modules(self):
+        path = self._get_path()
+        if self.__modules is None or self.__modules_path != path:
+            self.__modules_path = path
+            self.__modules = {}
+            if settings.use_filesystem_cache:
+                try:
+                    with open(path, 'rb') as f:
+                        data = pickle.load(f)
+                except (IOError, EOFError, pickle.UnpicklingError):
+                    pass
+                else:
+                    if data.get('version', 0) == self.version:
+                        self.__modules = data['modules']
+        return self.__modules
+
+    @_synchronized
+    def clear_cache(self):
+        self.__modules = None
+        self._changed = False
+        with common.ignored(OSError):
+            os.remove(self._get_path())
+
+    def _get_path(self):
+        return os.path.join(ParserPickling._cache_directory(), 'call_sites.pkl')
+
+
+# is a singleton
+CallSiteIndex = CallSiteIndex()
+
+
+class SnapshotPickling(object):
+    """
+    Stores snapshots of compiled extension modules (see
+    :mod:`jedi.evaluate.compiled.snapshot`), so that new processes don't have
+    to import and introspect them again. A snapshot is only valid as long as
+    the extension file has the same size and mtime.
+    """
+
+    version = 1
+
+    def load_snapshot(self, dotted_path, path):
+        """Returns the snapshot data or None if there's no valid snapshot."""
+        try:
+            with open(self._get_path(dotted_path, path), 'rb') as f:
+                try:
+                    gc.disable()
+                    data = pickle.load(f)
+                finally:
+                    gc.enable()
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return None
+        if data.get('version') != self.version \
+                or data['identity'] != self._identity(path):
+            return None
+        debug.dbg('snapshot loaded: %s', path)
+        return data['snapshot']
+
+    def save_snapshot(self, dotted_path, path, snapshot):
+        try:
+            identity = self._identity(path)
+        except OSError:
+            return
+        data = {'version': self.version, 'identity': identity,
+                'snapshot': snapshot}
+        _write_atomic(self._get_path(dotted_path, path),
+                      lambda f: pickle.dump(data, f, pickle.HIGHEST_PROTOCOL),
+                      'wb')
+
+    def _identity(self, path):
+        stat = os.stat(path)
+        return [path, stat.st_mtime, stat.st_size]
+
+    def _get_path(self, dotted_path, path):
+        directory = os.path.join(ParserPickling._cache_directory(), 'snapshots')
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        key = md5(path.encode('utf-8'))
+        return os.path.join(directory, '%s-%s.pkl' % (dotted_path, key))
+
+
+# is a singleton
+SnapshotPickling = SnapshotPickling()
+
+
+class FakeModuleBundle(object):
+    """
+    Stores the parsed ``.pym`` files of :mod:`jedi.evaluate.compiled.fake` in
+    a single file. Every class and function of a ``.pym`` file is pickled
+    separately, so that only the scopes that are actually used have to be
+    unpickled. An entry is only valid as long as its ``.pym`` file has the
+    same size and mtime.
+    """
+
+    version = 1
+
+    def __init__(self):
+        self.__bundle = None
+        self.__bundle_path = None
+        self._lock = threading.RLock()
+
+    @_synchronized
+    def load_module(self, module_name, path):
+        """
+        Returns a dict of the pickled scopes of a ``.pym`` file or None if
+        there's no valid entry.
+        """
+        try:
+            identity, scopes = self._bundle['modules'][module_name]
+        except KeyError:
+            return None
+        try:
+            if identity != self._identity(path):
+                return None
+        except OSError:
+            return None
+        return scopes
+
+    @_synchronized
+    def save_module(self, module_name, path, scopes):
+        try:
+            identity = self._identity(path)
+        except OSError:
+            return
+        bundle = self._bundle
+        bundle['modules'][module_name] = identity, scopes
+        _write_atomic(self._get_path(),
+                      lambda f: pickle.dump(bundle, f, pickle.HIGHEST_PROTOCOL),
+                      'wb')
+
+    @property
+    def _bundle(self):
+        path = self._get_path()
+        if self.__bundle is None or self.__bundle_path != path:
+            self.__bundle_path = path
+            self.__bundle = self._load_bundle(path)
+        return self.__bundle
+
+    def _load_bundle(self, path):
+        version = [self.version, ParserPickling.version]
+        try:
+            with open(path, 'rb') as f:
+                try:
+                    gc.disable()
+                    bundle = pickle.load(f)
+                finally:
+                    gc.enable()
+        except (IOError, EOFError, pickle.UnpicklingError):
+            pass
+        else:
+            if bundle.get('version') == version:
+                debug.dbg('fake module bundle loaded: %s', path)
+                return bundle
+        return {'version': version, 'modules': {}}
+
+    def _identity(self, path):
+        stat = os.stat(path)
+        return [stat.st_mtime, stat.st_size]
+
+    def _get_path(self):
+        return os.path.join(ParserPickling._cache_directory(), 'fake_modules.pkl')
+
+
+# is a singleton
+FakeModuleBundle = FakeModuleBundle()
@@ -1,12 +1,12 @@
 """ A universal module with functions / classes without dependencies. """
 import sys
+import time
 import contextlib
 import functools
 import re
 from ast import literal_eval
 
 from jedi._compatibility import unicode, reraise
-from jedi import settings
 
 
 class UncaughtAttributeError(Exception):
@@ -80,17 +80,35 @@ class PushBackIterator(object):
         return self.current
 
 
+class CancellationToken(object):
+    """
+    Stops the evaluation of an API call, either after ``timeout`` seconds or
+    as soon as :meth:`cancel` is called, e.g. because the user kept typing.
+    The evaluator checks the token regularly and returns the results it found
+    so far.
+    """
+    def __init__(self, timeout=None):
+        self._deadline = None if timeout is None else time.time() + timeout
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def is_cancelled(self):
+        if not self._cancelled and self._deadline is not None \
+                and time.time() >= self._deadline:
+            self._cancelled = True
+        return self._cancelled
+
+
 @contextlib.contextmanager
-def scale_speed_settings(factor):
-    a = settings.max_executions
-    b = settings.max_until_execution_unique
-    settings.max_executions *= factor
-    settings.max_until_execution_unique *= factor
-    try:
+def scale_speed_settings(evaluator, factor):
+    a = evaluator.setting('max_executions')
+    b = evaluator.setting('max_until_execution_unique')
+    with evaluator.override_settings(max_executions=a * factor,
+                                     max_until_execution_unique=b * factor):
         yield
-    finally:
-        settings.max_executions = a
-        settings.max_until_execution_unique = b
 
 
 def indent_block(text, indention='    '):
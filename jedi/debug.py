@@ -1,6 +1,7 @@
 from jedi._compatibility import encoding, is_py3, u
 import inspect
 import os
+import threading
 import time
 
 try:
@@ -33,25 +34,31 @@ enable_notice = False
 # callback, interface: level, str
 debug_function = None
 ignored_modules = ['jedi.evaluate.builtin', 'jedi.parser']
-_debug_indent = -1
-_start_time = time.time()
+
+
+class _State(threading.local):
+    """The indentation and start time of the evaluation in each thread."""
+    def __init__(self):
+        self.debug_indent = -1
+        self.start_time = time.time()
+
+
+_state = _State()
 
 
 def reset_time():
-    global _start_time, _debug_indent
-    _start_time = time.time()
-    _debug_indent = -1
+    _state.start_time = time.time()
+    _state.debug_indent = -1
 
 
 def increase_indent(func):
     """Decorator for makin """
     def wrapper(*args, **kwargs):
-        global _debug_indent
-        _debug_indent += 1
+        _state.debug_indent += 1
         try:
             result = func(*args, **kwargs)
         finally:
-            _debug_indent -= 1
+            _state.debug_indent -= 1
         return result
     return wrapper
 
@@ -62,21 +69,21 @@ def dbg(message, *args):
         frm = inspect.stack()[1]
         mod = inspect.getmodule(frm[0])
         if not (mod.__name__ in ignored_modules):
-            i = ' ' * _debug_indent
+            i = ' ' * _state.debug_indent
             debug_function(NOTICE, i + 'dbg: ' + message % tuple(u(repr(a)) for a in args))
 
 
 def warning(message, *args):
     if debug_function and enable_warning:
-        i = ' ' * _debug_indent
+        i = ' ' * _state.debug_indent
         debug_function(WARNING, i + 'warning: ' + message % tuple(u(repr(a)) for a in args))
 
 
 def speed(name):
     if debug_function and enable_speed:
         now = time.time()
-        i = ' ' * _debug_indent
-        debug_function(SPEED, i + 'speed: ' + '%s %s' % (name, now - _start_time))
+        i = ' ' * _state.debug_indent
+        debug_function(SPEED, i + 'speed: ' + '%s %s' % (name, now - _state.start_time))
 
 
 def print_to_stdout(level, str_out):
@@ -61,10 +61,12 @@ that are not used are just being ignored.
 """
 
 import copy
+import contextlib
 from itertools import chain
 
 from jedi.parser import tree
 from jedi import debug
+from jedi import settings
 from jedi.evaluate import representation as er
 from jedi.evaluate import imports
 from jedi.evaluate import recursion
@@ -79,15 +81,48 @@ from jedi.evaluate import helpers
 
 
 class Evaluator(object):
-    def __init__(self, grammar):
+    def __init__(self, grammar, cancellation_token=None):
         self.grammar = grammar
+        self.cancellation_token = cancellation_token
+        self.results_are_partial = False
         self.memoize_cache = {}  # for memoize decorators
+        # The memoized results that are partial, see `memoize_default`.
+        self.partial_memoized = set()
         # To memorize modules -> equals `sys.modules`.
         self.modules = {}  # like `sys.modules`.
         self.compiled_cache = {}  # see `compiled.create()`
+        # The modules that imports of a module resolved to, see
+        # `imports.Importer.follow`.
+        self.module_imports = {}
         self.recursion_detector = recursion.RecursionDetector()
-        self.execution_recursion_detector = recursion.ExecutionRecursionDetector()
+        self.execution_recursion_detector = recursion.ExecutionRecursionDetector(self)
         self.analysis = []
+        # Settings that are only changed for this evaluator, see
+        # `override_settings`.
+        self._settings = {}
+
+    def setting(self, name):
+        """
+        Returns the value of :mod:`jedi.settings` ``name`` for this evaluator.
+        """
+        try:
+            return self._settings[name]
+        except KeyError:
+            return getattr(settings, name)
+
+    @contextlib.contextmanager
+    def override_settings(self, **kwargs):
+        """
+        Changes settings for this evaluator within a with statement. The
+        global :mod:`jedi.settings` are not touched, because other evaluators
+        might run at the same time.
+        """
+        old = dict(self._settings)
+        self._settings.update(kwargs)
+        try:
+            yield
+        finally:
+            self._settings = old
 
     def wrap(self, element):
         if isinstance(element, tree.Class):
@@ -103,6 +138,18 @@ class Evaluator(object):
         else:
             return element
 
+    def is_cancelled(self):
+        """
+        Checks the :class:`jedi.common.CancellationToken`. Once it's cancelled,
+        the evaluation stops at the next checkpoint and the results are marked
+        as partial.
+        """
+        token = self.cancellation_token
+        if token is not None and token.is_cancelled:
+            self.results_are_partial = True
+            return True
+        return False
+
     def find_types(self, scope, name_str, position=None, search_global=False,
                    is_goto=False):
         """
@@ -131,6 +178,8 @@ class Evaluator(object):
 
         :param stmt: A `tree.ExprStmt`.
         """
+        if self.is_cancelled():
+            return []
         debug.dbg('eval_statement %s (%s)', stmt, seek_name)
         types = self.eval_element(stmt.get_rhs())
 
@@ -159,6 +208,9 @@ class Evaluator(object):
 
     @memoize_default(evaluator_is_first_arg=True)
     def eval_element(self, element):
+        return precedence.limit_types(self, self._eval_element(element))
+
+    def _eval_element(self, element):
         if isinstance(element, iterable.AlreadyEvaluated):
             return list(element)
         elif isinstance(element, iterable.MergedNodes):
@@ -276,6 +328,9 @@ class Evaluator(object):
 
     @debug.increase_indent
     def execute(self, obj, arguments=(), trailer=None):
+        # Instantiating compiled classes is cheap and expected to work.
+        if not isinstance(obj, compiled.CompiledObject) and self.is_cancelled():
+            return []
         if not isinstance(arguments, param.Arguments):
             arguments = param.Arguments(self, arguments, trailer)
 
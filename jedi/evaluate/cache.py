@@ -9,22 +9,29 @@ import inspect
 NO_DEFAULT = object()
 
 
-def memoize_default(default=NO_DEFAULT, evaluator_is_first_arg=False, second_arg_is_evaluator=False):
+def memoize_default(default=NO_DEFAULT, evaluator_is_first_arg=False,
+                    second_arg_is_evaluator=False, cache_partial_results=False):
     """ This is a typical memoization decorator, BUT there is one difference:
     To prevent recursion it sets defaults.
 
     Preventing recursion is in this case the much bigger use than speed. I
     don't think, that there is a big speed difference, but there are many cases
     where recursion could happen (think about a = b; b = a).
+
+    Results that are computed while the evaluation is cancelled may be
+    incomplete and are not cached, unless ``cache_partial_results`` is set.
+    Other partial results (e.g. widened types) are cached and set
+    ``results_are_partial`` of the evaluator again, whenever they are reused.
     """
     def func(function):
         def wrapper(obj, *args, **kwargs):
             if evaluator_is_first_arg:
-                cache = obj.memoize_cache
+                evaluator = obj
             elif second_arg_is_evaluator:  # needed for meta classes
-                cache = args[0].memoize_cache
+                evaluator = args[0]
             else:
-                cache = obj._evaluator.memoize_cache
+                evaluator = obj._evaluator
+            cache = evaluator.memoize_cache
 
             try:
                 memo = cache[function]
@@ -34,14 +41,29 @@ def memoize_default(default=NO_DEFAULT, evaluator_is_first_arg=False, second_arg
 
             key = (obj, args, frozenset(kwargs.items()))
             if key in memo:
+                if (function, key) in evaluator.partial_memoized:
+                    evaluator.results_are_partial = True
                 return memo[key]
             else:
                 if default is not NO_DEFAULT:
                     memo[key] = default
-                rv = function(obj, *args, **kwargs)
-                if inspect.isgenerator(rv):
-                    rv = list(rv)
-                memo[key] = rv
+                # Find out if this result is partial.
+                was_partial = evaluator.results_are_partial
+                evaluator.results_are_partial = False
+                try:
+                    rv = function(obj, *args, **kwargs)
+                    if inspect.isgenerator(rv):
+                        rv = list(rv)
+                finally:
+                    is_partial = evaluator.results_are_partial
+                    evaluator.results_are_partial = was_partial or is_partial
+                if not cache_partial_results and evaluator.is_cancelled():
+                    # The result may be incomplete, it must not be reused.
+                    memo.pop(key, None)
+                else:
+                    memo[key] = rv
+                    if is_partial:
+                        evaluator.partial_memoized.add((function, key))
                 return rv
         return wrapper
     return func
@@ -53,6 +75,8 @@ class CachedMetaClass(type):
     class initializations. Either you do it this way or with decorators, but
     with decorators you lose class access (isinstance, etc).
     """
-    @memoize_default(None, second_arg_is_evaluator=True)
+    # Creating an object doesn't evaluate anything, but the same object has to
+    # be returned every time.
+    @memoize_default(None, second_arg_is_evaluator=True, cache_partial_results=True)
     def __call__(self, *args, **kwargs):
         return super(CachedMetaClass, self).__call__(*args, **kwargs)
@@ -1,6 +1,7 @@
 """
 Imitate the parser representation.
 """
+import imp
 import inspect
 import re
 import sys
@@ -9,8 +10,10 @@ from functools import partial
 
 from jedi._compatibility import builtins as _builtins, unicode
 from jedi import debug
+from jedi import settings
+from jedi import cache
 from jedi.cache import underscore_memoization, memoize_method
-from jedi.evaluate.sys_path import get_sys_path
+from jedi.evaluate.sys_path import get_sys_path, replaced_sys_path
 from jedi.parser.tree import Param, Base, Operator, zero_position_modifier
 from jedi.evaluate.helpers import FakeName
 from . import fake
@@ -88,7 +91,7 @@ class CompiledObject(Base):
     def params(self):
         params_str, ret = self._parse_function_doc()
         tokens = params_str.split(',')
-        if inspect.ismethoddescriptor(self._cls().obj):
+        if self._is_method_descriptor():
             tokens.insert(0, 'self')
         params = []
         for p in tokens:
@@ -101,6 +104,9 @@ class CompiledObject(Base):
     def __repr__(self):
         return '<%s: %s>' % (type(self).__name__, repr(self.obj))
 
+    def _is_method_descriptor(self):
+        return inspect.ismethoddescriptor(self._cls().obj)
+
     @underscore_memoization
     def _parse_function_doc(self):
         if self.doc is None:
@@ -163,7 +169,7 @@ class CompiledObject(Base):
         return [LazyNamesDict(self._cls(), is_instance)]
 
     def get_subscope_by_name(self, name):
-        if name in dir(self._cls().obj):
+        if name in _get_attribute_names(self._cls().obj):
             return CompiledName(self._cls(), name).parent
         else:
             raise KeyError("CompiledObject doesn't have an attribute '%s'." % name)
@@ -257,24 +263,21 @@ class LazyNamesDict(object):
     def __iter__(self):
         return (v[0].value for v in self.values())
 
+    @underscore_memoization
+    def _attributes(self):
+        return _get_attribute_names(self._compiled_obj.obj)
+
     @memoize_method
     def __getitem__(self, name):
-        try:
-            getattr(self._compiled_obj.obj, name)
-        except AttributeError:
+        if name not in self._attributes():
             raise KeyError('%s in %s not found.' % (name, self._compiled_obj))
         return [CompiledName(self._compiled_obj, name)]
 
+    @memoize_method
     def values(self):
         obj = self._compiled_obj.obj
 
-        values = []
-        for name in dir(obj):
-            try:
-                values.append(self[name])
-            except KeyError:
-                # The dir function can be wrong.
-                pass
+        values = [self[name] for name in sorted(self._attributes())]
 
         # dir doesn't include the type names.
         if not inspect.ismodule(obj) and obj != type and not self._is_instance:
@@ -282,6 +285,61 @@ class LazyNamesDict(object):
         return values
 
 
+# Shared by the evaluators of all threads.
+_attribute_names = cache.LRUCache(1000)
+
+
+def _attributes_key(obj):
+    """
+    Changes if attributes are added to or removed from a module or a class
+    (or its bases). It's much cheaper than ``dir``.
+    """
+    objects = inspect.getmro(obj) if inspect.isclass(obj) else (obj,)
+    return tuple(len(getattr(o, '__dict__', ())) for o in objects)
+
+
+def _shared_attribute_names(obj):
+    """Returns the shared names of a class or module, None if outdated."""
+    try:
+        cached_obj, key, names = _attribute_names[id(obj)]
+    except KeyError:
+        return None
+    if cached_obj is not obj or key != _attributes_key(obj):
+        return None
+    return names
+
+
+def _get_attribute_names(obj):
+    """
+    Returns the names of the attributes (``dir``) of an object. The names of
+    classes and modules are shared by all evaluators, because introspecting
+    them again and again (e.g. for every completion) is slow. They are
+    computed again once attributes are added or removed. The values are not
+    shared, attributes can be rebound.
+    """
+    names = _shared_attribute_names(obj)
+    if names is not None:
+        return names
+
+    is_shared = inspect.isclass(obj) or inspect.ismodule(obj)
+    if is_shared:
+        key = _attributes_key(obj)
+    names = set()
+    for name in dir(obj):
+        try:
+            getattr(obj, name)
+        except AttributeError:
+            # The dir function can be wrong.
+            pass
+        else:
+            names.add(name)
+    names = frozenset(names)
+    if is_shared:
+        # Keep a reference to the object, so that its id is not reused.
+        _attribute_names[id(obj)] = obj, key, names
+    return names
+
+
 class CompiledName(FakeName):
     def __init__(self, obj, name):
         super(CompiledName, self).__init__(name)
@@ -341,20 +399,40 @@ def dotted_from_fs_path(fs_path, sys_path=None):
     return _path_re.sub('', fs_path[len(path):].lstrip(os.path.sep)).replace(os.path.sep, '.')
 
 
-def load_module(path=None, name=None):
+def mirror_snapshots_enabled():
+    return settings.use_filesystem_cache \
+        and settings.cache_extension_module_snapshots
+
+
+def _is_extension_module(path):
+    if path is None or not os.path.isfile(path):
+        return False
+    return any(path.endswith(suffix) for suffix, _, typ in imp.get_suffixes()
+               if typ == imp.C_EXTENSION)
+
+
+def load_module(path=None, name=None, sys_path=None):
     if path is not None:
         dotted_path = dotted_from_fs_path(path)
     else:
         dotted_path = name
 
-    sys_path = get_sys_path()
+    sys_path = get_sys_path() if sys_path is None else list(sys_path)
     if dotted_path is None:
         p, _, dotted_path = path.partition(os.path.sep)
         sys_path.insert(0, p)
 
-    temp, sys.path = sys.path, sys_path
+    if (settings.introspect_compiled_modules_in_subprocess
+            or mirror_snapshots_enabled() and _is_extension_module(path)) \
+            and dotted_path not in sys.modules \
+            and not fake.has_faked_module(dotted_path):
+        # Modules that are already imported can be introspected for free.
+        from jedi.evaluate.compiled import mirror
+        return mirror.load_module(dotted_path, sys_path, path)
+
     try:
-        __import__(dotted_path)
+        with replaced_sys_path(sys_path):
+            __import__(dotted_path)
     except RuntimeError:
         if 'PySide' in dotted_path or 'PyQt' in dotted_path:
             # RuntimeError: the PyQt4.QtCore and PyQt5.QtCore modules both wrap
@@ -366,8 +444,6 @@ def load_module(path=None, name=None):
         # If a module is "corrupt" or not really a Python module or whatever.
         debug.warning('Module %s not importable.', path)
         return None
-    finally:
-        sys.path = temp
 
     # Just access the cache after import, because of #59 as well as the very
     # complicated import structure of Python.
@@ -6,13 +6,80 @@ mixing in Python code, the autocompletion should work much better for builtins.
 
 import os
 import inspect
+import threading
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 from jedi._compatibility import is_py3, builtins, unicode
+from jedi import settings
+from jedi import cache
 from jedi.parser import Parser, load_grammar
 from jedi.parser import tree as pt
 from jedi.evaluate.helpers import FakeName
 
 modules = {}
+# The faked scopes are shared by all threads.
+_modules_lock = threading.RLock()
+_documented_functions = set()
+
+
+class FakedModule(object):
+    """
+    The classes and functions of a ``.pym`` file. They are pickled one by one,
+    so that only the scopes that are actually used need to be unpickled.
+    """
+    def __init__(self, pickled_scopes):
+        self._pickled_scopes = pickled_scopes
+        self._scopes = {}
+
+    def get_scope(self, name):
+        with _modules_lock:
+            try:
+                return self._scopes[name]
+            except KeyError:
+                pass
+            try:
+                data = self._pickled_scopes[name]
+            except KeyError:
+                scope = None
+            else:
+                scope = pickle.loads(data)
+            self._scopes[name] = scope
+            return scope
+
+    def set_scope(self, name, scope):
+        self._scopes[name] = scope
+
+
+def _pickle_scopes(module_name, source):
+    grammar = load_grammar('grammar3.4')
+    module = Parser(grammar, unicode(source), module_name).module
+    scopes = {}
+    for scope in module.subscopes:
+        name = str(scope.name)
+        if name not in scopes:
+            # Like `search_scope`, the first definition wins.
+            scope.parent = None
+            scopes[name] = pickle.dumps(scope, pickle.HIGHEST_PROTOCOL)
+    return scopes
+
+
+def _load_pickled_scopes(module_name):
+    path = _faked_module_path(module_name)
+    if settings.use_filesystem_cache:
+        scopes = cache.FakeModuleBundle.load_module(module_name, path)
+        if scopes is not None:
+            return scopes
+
+    with open(path) as f:
+        source = f.read()
+    scopes = _pickle_scopes(module_name, source)
+    if settings.use_filesystem_cache:
+        cache.FakeModuleBundle.save_module(module_name, path, scopes)
+    return scopes
 
 
 def _load_faked_module(module):
@@ -20,31 +87,43 @@ def _load_faked_module(module):
     if module_name == '__builtin__' and not is_py3:
         module_name = 'builtins'
 
-    try:
-        return modules[module_name]
-    except KeyError:
-        path = os.path.dirname(os.path.abspath(__file__))
+    with _modules_lock:
         try:
-            with open(os.path.join(path, 'fake', module_name) + '.pym') as f:
-                source = f.read()
-        except IOError:
-            modules[module_name] = None
-            return
-        grammar = load_grammar('grammar3.4')
-        module = Parser(grammar, unicode(source), module_name).module
-        modules[module_name] = module
-
-        if module_name == 'builtins' and not is_py3:
-            # There are two implementations of `open` for either python 2/3.
-            # -> Rename the python2 version (`look at fake/builtins.pym`).
-            open_func = search_scope(module, 'open')
-            open_func.children[1] = FakeName('open_python3')
-            open_func = search_scope(module, 'open_python2')
-            open_func.children[1] = FakeName('open')
-        return module
+            return modules[module_name]
+        except KeyError:
+            try:
+                scopes = _load_pickled_scopes(module_name)
+            except IOError:
+                modules[module_name] = None
+                return
+            module = FakedModule(scopes)
+            modules[module_name] = module
+
+            if module_name == 'builtins' and not is_py3:
+                # There are two implementations of `open` for either python 2/3.
+                # -> Rename the python2 version (`look at fake/builtins.pym`).
+                open_func = module.get_scope('open')
+                open_func.children[1] = FakeName('open_python3')
+                open_python2 = module.get_scope('open_python2')
+                open_python2.children[1] = FakeName('open')
+                module.set_scope('open', open_python2)
+                module.set_scope('open_python3', open_func)
+                module.set_scope('open_python2', None)
+            return module
+
+
+def _faked_module_path(module_name):
+    path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(path, 'fake', module_name) + '.pym'
+
+
+def has_faked_module(module_name):
+    return os.path.exists(_faked_module_path(module_name))
 
 
 def search_scope(scope, obj_name):
+    if isinstance(scope, FakedModule):
+        return scope.get_scope(obj_name)
     for s in scope.subscopes:
         if str(s.name) == obj_name:
             return s
@@ -104,14 +183,19 @@ def get_faked(module, obj, name=None):
         # We're not interested in classes. What we want is functions.
         return None
     else:
-        # Set the docstr which was previously not set (faked modules don't
-        # contain it).
-        doc = '"""%s"""' % obj.__doc__  # TODO need escapes.
-        suite = result.children[-1]
-        string = pt.String(pt.zero_position_modifier, doc, (0, 0), '')
-        new_line = pt.Whitespace('\n', (0, 0), '')
-        docstr_node = pt.Node('simple_stmt', [string, new_line])
-        suite.children.insert(2, docstr_node)
+        with _modules_lock:
+            if result not in _documented_functions:
+                # Set the docstr which was previously not set (faked modules
+                # don't contain it). The scopes are shared, it's only set once.
+                if name is not None:
+                    obj = getattr(obj, name, None)
+                doc = '"""%s"""' % obj.__doc__  # TODO need escapes.
+                suite = result.children[-1]
+                string = pt.String(pt.zero_position_modifier, doc, (0, 0), '')
+                new_line = pt.Whitespace('\n', (0, 0), '')
+                docstr_node = pt.Node('simple_stmt', [string, new_line])
+                suite.children.insert(2, docstr_node)
+                _documented_functions.add(result)
         return result
 
 
@@ -0,0 +1,380 @@
+"""
+Compiled modules that are represented by snapshots instead of live objects.
+
+Importing an extension module means running arbitrary code in the current
+process. Heavy modules (scipy, PyQt, ...) cost a lot of time and memory and
+might even crash the process. With
+:data:`jedi.settings.introspect_compiled_modules_in_subprocess` such modules
+are imported by a worker process, which sends back a snapshot of the module
+(see :mod:`jedi.evaluate.compiled.snapshot`). The snapshot is then wrapped in
+:class:`MirrorObject`, which behaves like a :class:`CompiledObject`.
+
+With :data:`jedi.settings.cache_extension_module_snapshots`, snapshots of
+extension modules are also stored in the filesystem cache
+(:class:`jedi.cache.SnapshotPickling`), so that other processes don't need to
+import the module at all.
+"""
+import os
+import subprocess
+import sys
+import threading
+
+from jedi._compatibility import unicode
+from jedi import debug
+from jedi import settings
+from jedi import cache
+from jedi.cache import underscore_memoization, memoize_method
+from jedi.evaluate.helpers import FakeName
+from jedi.evaluate import compiled
+from jedi.evaluate.compiled import snapshot as _snapshot
+from jedi.evaluate.sys_path import replaced_sys_path
+
+_modules = {}
+_modules_lock = threading.RLock()
+
+
+class IntrospectionWorker(object):
+    """
+    A process that imports modules and returns their snapshots. The process
+    is started on demand and replaced after :attr:`max_requests` modules,
+    because the imported modules are never freed. Requests of different
+    threads are sent one after another.
+    """
+    max_requests = 50
+
+    def __init__(self):
+        self._process = None
+        self._requests = 0
+        self._lock = threading.RLock()
+
+    def _interpreter(self):
+        if settings.introspection_interpreter:
+            return settings.introspection_interpreter
+        # Embedded interpreters have the executable of their application.
+        name = os.path.basename(sys.executable or '').lower()
+        if name.startswith(('python', 'pypy')):
+            return sys.executable
+        return None
+
+    def _start(self):
+        """Starts the worker process, returns False if that's not possible."""
+        interpreter = self._interpreter()
+        if interpreter is None:
+            return False
+        debug.dbg('Starting the introspection worker with %s.', interpreter)
+        script = os.path.splitext(_snapshot.__file__)[0] + '.py'
+        try:
+            with open(os.devnull, 'w') as devnull:
+                process = subprocess.Popen(
+                    [interpreter, script],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=devnull
+                )
+        except OSError:
+            return False
+        try:
+            # The worker writes a message as soon as it's running.
+            _snapshot._read(process.stdout)
+        except (EOFError, IOError, OSError):
+            process.stdin.close()
+            process.stdout.close()
+            process.wait()
+            return False
+        self._process = process
+        self._requests = 0
+        return True
+
+    def get_snapshot(self, dotted_path, sys_path):
+        """
+        Returns the snapshot of a module or None if it's not importable. If
+        the worker cannot be started, the module is imported by the current
+        process.
+        """
+        with self._lock:
+            if self._process is None or self._requests >= self.max_requests:
+                self.stop()
+                if not self._start():
+                    debug.warning('Cannot start the introspection worker, '
+                                  'importing %s directly.', dotted_path)
+                    return _import_snapshot(dotted_path, sys_path)
+            self._requests += 1
+            try:
+                _snapshot._write(self._process.stdin, (dotted_path, list(sys_path)))
+                return _snapshot._read(self._process.stdout)
+            except (EOFError, IOError, OSError):
+                # The worker crashed while importing the module.
+                debug.warning('Introspection worker died while importing %s.',
+                              dotted_path)
+                self.stop()
+                return None
+
+    def stop(self):
+        with self._lock:
+            if self._process is not None:
+                try:
+                    self._process.stdin.close()
+                    self._process.stdout.close()
+                except (IOError, OSError):
+                    pass
+                self._process.wait()
+                self._process = None
+
+
+# is a singleton
+IntrospectionWorker = IntrospectionWorker()
+
+
+def _import_snapshot(dotted_path, sys_path):
+    with replaced_sys_path(sys_path):
+        return _snapshot.import_snapshot(dotted_path, sys_path)
+
+
+def load_module(dotted_path, sys_path, path=None):
+    """
+    Like :func:`jedi.evaluate.compiled.load_module`, but returns a
+    :class:`MirrorObject` of the module. If ``path`` is the file of an
+    extension module, the snapshot is also stored in the filesystem cache.
+    Returns None if the module is not importable.
+    """
+    with _modules_lock:
+        try:
+            return _modules[dotted_path]
+        except KeyError:
+            pass
+
+        data = None
+        if path is not None and compiled.mirror_snapshots_enabled():
+            data = cache.SnapshotPickling.load_snapshot(dotted_path, path)
+        if data is None:
+            if settings.introspect_compiled_modules_in_subprocess:
+                data = IntrospectionWorker.get_snapshot(dotted_path, sys_path)
+            else:
+                data = _import_snapshot(dotted_path, sys_path)
+            if data is not None and path is not None \
+                    and compiled.mirror_snapshots_enabled():
+                _add_signatures(data)
+                cache.SnapshotPickling.save_snapshot(dotted_path, path, data)
+
+        if data is None:
+            debug.warning('Module %s not importable.', dotted_path)
+            module = None
+        else:
+            module = Snapshot(data, sys_path).create(data['root'])
+        _modules[dotted_path] = module
+        return module
+
+
+def _add_signatures(data):
+    """
+    Parses the docstrings of functions once, so that the params and return
+    values are stored with the snapshot.
+    """
+    for node in data['nodes'].values():
+        if node.get('is_builtin') or node.get('is_method') \
+                or node.get('is_method_descriptor'):
+            node['signature'] = compiled._parse_function_doc(node['doc'])
+
+
+class Snapshot(object):
+    def __init__(self, data, sys_path):
+        self.nodes = data['nodes']
+        self._sys_path = sys_path
+
+    def create(self, key, parent=None):
+        node = self.nodes[key]
+        if 'value' in node:
+            return compiled.CompiledObject(node['value'], parent)
+        elif 'builtin' in node:
+            return compiled.builtin.get_by_name(node['builtin'])
+        elif 'module' in node:
+            module = compiled.load_module(name=node['module'],
+                                          sys_path=self._sys_path)
+            if module is None:
+                return compiled.CompiledObject(None, parent)
+            return module
+        return MirrorObject(self, node, parent)
+
+
+class MirrorObject(compiled.CompiledObject):
+    """
+    A :class:`CompiledObject` that is created from a snapshot instead of a live
+    object, ``obj`` is therefore always None.
+    """
+    def __init__(self, snapshot, node, parent=None):
+        super(MirrorObject, self).__init__(None, parent)
+        self._snapshot = snapshot
+        self._node = node
+
+    @property
+    def py__call__(self):
+        def actual(evaluator, params):
+            if self._node['is_class']:
+                from jedi.evaluate.representation import Instance
+                return [Instance(evaluator, self, params)]
+            else:
+                return list(self._execute_function(evaluator, params))
+
+        if not self._node['callable']:
+            raise AttributeError
+        return actual
+
+    def py__class__(self, evaluator):
+        return self._snapshot.create(self._node['class'], self.parent)
+
+    @property
+    def py__mro__(self):
+        if not self._node['is_class']:
+            raise AttributeError
+        keys = self._node['mro']
+        return lambda evaluator: tuple(self._snapshot.create(key, self.parent)
+                                       for key in keys)
+
+    @property
+    def py__bases__(self):
+        if not self._node['is_class']:
+            raise AttributeError
+        keys = self._node['bases']
+        return lambda evaluator: tuple(self._snapshot.create(key)
+                                       for key in keys)
+
+    def py__bool__(self):
+        return self._node['bool']
+
+    def py__file__(self):
+        if self._node.get('file') is None:
+            raise AttributeError
+        return self._node['file']
+
+    def is_class(self):
+        return self._node['is_class']
+
+    @property
+    def doc(self):
+        return self._node['doc']
+
+    def _parse_function_doc(self):
+        try:
+            return self._node['signature']
+        except KeyError:
+            return super(MirrorObject, self)._parse_function_doc()
+
+    def _is_method_descriptor(self):
+        if self._node['is_instance']:
+            return self._cls()._is_method_descriptor()
+        return self._node['is_method_descriptor']
+
+    def api_type(self):
+        node = self._node
+        if node['is_instance']:
+            return 'instance'
+        elif node['is_class']:
+            return 'class'
+        elif node['is_module']:
+            return 'module'
+        elif node['is_builtin'] or node['is_method'] \
+                or node['is_method_descriptor']:
+            return 'function'
+
+    @property
+    def type(self):
+        node = self._node
+        if node['is_instance']:
+            return self._cls().type
+        elif node['is_class']:
+            return 'classdef'
+        elif node['is_module']:
+            return 'file_input'
+        elif node['is_builtin'] or node['is_method'] \
+                or node['is_method_descriptor']:
+            return 'funcdef'
+
+    @underscore_memoization
+    def _cls(self):
+        if self._node['is_instance']:
+            return self.py__class__(None)
+        return self
+
+    @memoize_method
+    def _names_dict_ensure_one_dict(self, is_instance):
+        cls = self._cls()
+        if cls is not self:
+            return cls._names_dict_ensure_one_dict(is_instance)
+        if 'attrs' not in self._node:
+            # Functions and methods don't have attributes in the snapshot,
+            # use the ones of their type.
+            return self.py__class__(None)._names_dict_ensure_one_dict(True)
+        return [MirrorNamesDict(self, is_instance)]
+
+    def get_subscope_by_name(self, name):
+        names_dict = self._names_dict_ensure_one_dict(False)[0]
+        try:
+            return names_dict[name][0].parent
+        except KeyError:
+            raise KeyError("CompiledObject doesn't have an attribute '%s'." % name)
+
+    def get_index_types(self, evaluator, index_array=()):
+        # Literals are recreated as normal compiled objects, everything else
+        # would need the live object.
+        return []
+
+    @property
+    def name(self):
+        cls = self._cls()
+        if cls is not self:
+            return FakeName(unicode(cls.name), self)
+        if self._node['name'] is None:
+            raise AttributeError
+        return FakeName(self._node['name'], self)
+
+    @property
+    def subscopes(self):
+        # There are no faked scopes for mirrored modules.
+        return []
+
+    def __repr__(self):
+        return '<%s: %s>' % (type(self).__name__, self._node['name'])
+
+
+class MirrorNamesDict(object):
+    """
+    The names_dict of a :class:`MirrorObject`, similar to
+    :class:`compiled.LazyNamesDict`.
+    """
+    def __init__(self, mirror, is_instance):
+        self._mirror = mirror
+        self._is_instance = is_instance
+
+    def __iter__(self):
+        return (v[0].value for v in self.values())
+
+    @memoize_method
+    def __getitem__(self, name):
+        try:
+            key = self._mirror._node['attrs'][name]
+        except KeyError:
+            raise KeyError('%s in %s not found.' % (name, self._mirror))
+        return [MirrorName(self._mirror, name, key)]
+
+    def values(self):
+        node = self._mirror._node
+        values = [self[name] for name in node['attrs']]
+        # dir doesn't include the type names.
+        if not node['is_module'] and not self._is_instance:
+            values += compiled._type_names_dict.values()
+        return values
+
+
+class MirrorName(compiled.CompiledName):
+    def __init__(self, mirror, name, key):
+        super(MirrorName, self).__init__(mirror, name)
+        self._key = key
+
+    @property
+    @underscore_memoization
+    def parent(self):
+        return self._obj._snapshot.create(self._key, self._obj)
+
+    @parent.setter
+    def parent(self, value):
+        pass  # Just ignore this, FakeName tries to overwrite the parent attribute.
@@ -0,0 +1,194 @@
+"""
+Creates snapshots of compiled modules: All the information |jedi| needs about
+the objects of a module (names, kinds, docstrings, classes, bases) as plain
+data, that can be pickled.
+
+This module doesn't import anything from |jedi|, because it is also run as the
+script of the introspection worker process (see
+:mod:`jedi.evaluate.compiled.mirror`). The worker reads requests from stdin and
+writes the snapshots to stdout.
+
+A snapshot is a dict with the keys ``root`` and ``nodes``. ``nodes`` maps
+integer keys to dicts that describe a single object. Objects are referenced
+by their keys. There are a few special nodes:
+
+- ``{'value': 3}`` for literals, that can be recreated in the main process.
+- ``{'builtin': 'int'}`` for objects of the builtins module.
+- ``{'module': 'os.path'}`` for modules other than the root module.
+"""
+import inspect
+import os
+import struct
+import sys
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+try:
+    _literal_types = (int, long, float, complex, str, unicode, bool, type(None))
+except NameError:
+    _literal_types = (int, float, complex, str, bytes, bool, type(None))
+
+
+def _is_class_instance(obj):
+    """Same as :func:`jedi.evaluate.compiled.fake.is_class_instance`."""
+    return not (inspect.isclass(obj) or inspect.ismodule(obj)
+                or inspect.isbuiltin(obj) or inspect.ismethod(obj)
+                or inspect.ismethoddescriptor(obj) or inspect.iscode(obj)
+                or inspect.isgenerator(obj))
+
+
+class _Snapshotter(object):
+    def __init__(self, module):
+        self._module = module
+        self._keys = {}
+        # Keep references, otherwise the ids of temporary objects (e.g. the
+        # results of properties) could be reused.
+        self._objects = []
+        self._to_expand = []
+        self.nodes = {}
+        self.root = self._add(module)
+
+    def create(self):
+        while self._to_expand:
+            obj, node = self._to_expand.pop()
+            node['attrs'] = self._attrs(obj)
+        return {'root': self.root, 'nodes': self.nodes}
+
+    def _add(self, obj):
+        try:
+            return self._keys[id(obj)]
+        except KeyError:
+            pass
+        key = len(self._objects)
+        self._keys[id(obj)] = key
+        self._objects.append(obj)
+        self.nodes[key] = self._describe(obj)
+        return key
+
+    def _describe(self, obj):
+        if type(obj) in _literal_types:
+            return {'value': obj}
+
+        name = getattr(obj, '__name__', None)
+        if not isinstance(name, str):
+            name = None
+        if name is not None and getattr(builtins, name, None) is obj:
+            return {'builtin': name}
+        if inspect.ismodule(obj) and obj is not self._module and name is not None:
+            return {'module': name}
+
+        try:
+            is_true = bool(obj)
+        except Exception:
+            is_true = None
+        node = {
+            'name': name,
+            'doc': inspect.getdoc(obj) or '',
+            'is_class': inspect.isclass(obj),
+            'is_module': inspect.ismodule(obj),
+            'is_builtin': inspect.isbuiltin(obj),
+            'is_method': inspect.ismethod(obj),
+            'is_method_descriptor': inspect.ismethoddescriptor(obj),
+            'is_instance': _is_class_instance(obj),
+            'callable': hasattr(obj, '__call__'),
+            'bool': is_true,
+        }
+        if node['is_module']:
+            node['file'] = getattr(obj, '__file__', None)
+        else:
+            try:
+                cls = obj.__class__
+            except AttributeError:
+                cls = type(None)
+            node['class'] = self._add(cls)
+
+        if node['is_class']:
+            node['bases'] = [self._add(c) for c in obj.__bases__]
+            node['mro'] = [self._add(c) for c in obj.__mro__]
+        if node['is_class'] or node['is_module']:
+            self._to_expand.append((obj, node))
+        return node
+
+    def _attrs(self, obj):
+        attrs = {}
+        for name in dir(obj):
+            try:
+                value = getattr(obj, name)
+            except Exception:
+                # The dir function can be wrong.
+                continue
+            attrs[name] = self._add(value)
+        return attrs
+
+
+def create_snapshot(module):
+    """Returns the snapshot of a module object."""
+    return _Snapshotter(module).create()
+
+
+def import_snapshot(dotted_path, sys_path):
+    """
+    Imports a module with the given ``sys.path`` and returns its snapshot or
+    None if it's not importable.
+    """
+    temp, sys.path = sys.path, sys_path
+    try:
+        __import__(dotted_path)
+    except Exception:
+        return None
+    finally:
+        sys.path = temp
+    return create_snapshot(sys.modules[dotted_path])
+
+
+def _read(stream):
+    header = stream.read(4)
+    if len(header) < 4:
+        raise EOFError
+    length, = struct.unpack('>I', header)
+    return pickle.loads(stream.read(length))
+
+
+def _write(stream, data):
+    data = pickle.dumps(data, 2)
+    stream.write(struct.pack('>I', len(data)) + data)
+    stream.flush()
+
+
+def _serve():
+    # Modules might print stuff or read from stdin, which would break the
+    # protocol. Therefore use copies of the file descriptors and redirect
+    # stdout to stderr.
+    requests = os.fdopen(os.dup(0), 'rb')
+    responses = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    with open(os.devnull) as devnull:
+        os.dup2(devnull.fileno(), 0)
+    sys.stdout = sys.stderr
+
+    # Tell the parent process that the worker is running.
+    _write(responses, None)
+    while True:
+        try:
+            dotted_path, sys_path = _read(requests)
+        except EOFError:
+            return
+        try:
+            snapshot = import_snapshot(dotted_path, sys_path)
+        except Exception:
+            snapshot = None
+        _write(responses, snapshot)
+
+
+if __name__ == '__main__':
+    # The directory of this script is not a sensible start of the sys.path.
+    del sys.path[0]
+    _serve()
@@ -19,16 +19,19 @@ import re
 from itertools import chain
 from textwrap import dedent
 
+from jedi import cache
 from jedi.evaluate.cache import memoize_default
+from jedi.evaluate.helpers import deep_ast_copy
 from jedi.parser import Parser, load_grammar
 from jedi.common import indent_block
 from jedi.evaluate.iterable import Array, FakeSequence, AlreadyEvaluated
 
 
 DOCSTRING_PARAM_PATTERNS = [
-    r'\s*:type\s+%s:\s*([^\n]+)',  # Sphinx
-    r'\s*:param\s+(\w+)\s+%s:[^\n]+',  # Sphinx param with type
-    r'\s*@type\s+%s:\s*([^\n]+)',  # Epydoc
+    re.compile(r'\s*:type\s+(?P<param>\w+):\s*(?P<type>[^\n]+)'),  # Sphinx
+    # Sphinx param with type
+    re.compile(r'\s*:param\s+(?P<type>\w+)\s+(?P<param>\w+):[^\n]+'),
+    re.compile(r'\s*@type\s+(?P<param>\w+):\s*(?P<type>[^\n]+)'),  # Epydoc
 ]
 
 DOCSTRING_RETURN_PATTERNS = [
@@ -38,28 +41,64 @@ DOCSTRING_RETURN_PATTERNS = [
 
 REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
+# Docstrings and type strings are parsed once and shared by all evaluators.
+_docstring_indexes = cache.LRUCache(1000)
+_type_string_functions = cache.LRUCache(1000)
+
 
 try:
     from numpydoc.docscrape import NumpyDocString
 except ImportError:
-    def _search_param_in_numpydocstr(docstr, param_str):
-        return []
+    def _search_params_in_numpydocstr(docstr):
+        return {}
 else:
-    def _search_param_in_numpydocstr(docstr, param_str):
-        """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
-        params = NumpyDocString(docstr)._parsed_data['Parameters']
-        for p_name, p_type, p_descr in params:
-            if p_name == param_str:
-                m = re.match('([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
-                if m:
-                    p_type = m.group(1)
-
-                if p_type.startswith('{'):
-                    types = set(type(x).__name__ for x in literal_eval(p_type))
-                    return list(types)
-                else:
-                    return [p_type]
-        return []
+    def _search_params_in_numpydocstr(docstr):
+        """Search `docstr` (in numpydoc format) for the types of all params."""
+        params = {}
+        parsed = NumpyDocString(docstr)._parsed_data['Parameters']
+        for p_name, p_type, p_descr in parsed:
+            m = re.match('([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
+            if m:
+                p_type = m.group(1)
+
+            if p_type.startswith('{'):
+                types = set(type(x).__name__ for x in literal_eval(p_type))
+                params.setdefault(p_name, list(types))
+            else:
+                params.setdefault(p_name, [p_type])
+        return params
+
+
+class DocstringIndex(object):
+    """
+    The type information of a docstring: The types of the params and the
+    return type, as strings.
+    """
+    def __init__(self, docstr):
+        self.params = {}
+        # look at #40 to see definitions of those params
+        for pattern in DOCSTRING_PARAM_PATTERNS:
+            for match in pattern.finditer(docstr):
+                param_str, type_str = match.group('param', 'type')
+                self.params.setdefault(param_str, [_strip_rst_role(type_str)])
+
+        for param_str, types in _search_params_in_numpydocstr(docstr).items():
+            self.params.setdefault(param_str, types)
+
+        self.return_type = None
+        for pattern in DOCSTRING_RETURN_PATTERNS:
+            match = pattern.search(docstr)
+            if match:
+                self.return_type = _strip_rst_role(match.group(1))
+                break
+
+
+def _docstring_index(docstr):
+    try:
+        return _docstring_indexes[docstr]
+    except KeyError:
+        index = _docstring_indexes[docstr] = DocstringIndex(docstr)
+        return index
 
 
 def _search_param_in_docstr(docstr, param_str):
@@ -79,16 +118,7 @@ def _search_param_in_docstr(docstr, param_str):
     ['int']
 
     """
-    # look at #40 to see definitions of those params
-    patterns = [re.compile(p % re.escape(param_str))
-                for p in DOCSTRING_PARAM_PATTERNS]
-    for pattern in patterns:
-        match = pattern.search(docstr)
-        if match:
-            return [_strip_rst_role(match.group(1))]
-
-    return (_search_param_in_numpydocstr(docstr, param_str) or
-            [])
+    return _docstring_index(docstr).params.get(param_str, [])
 
 
 def _strip_rst_role(type_str):
@@ -113,38 +143,61 @@ def _strip_rst_role(type_str):
         return type_str
 
 
-def _evaluate_for_statement_string(evaluator, string, module):
+def _parse_type_string(string):
+    """
+    Returns the pseudo function that contains the statement of a type string
+    or None. The function is parsed only once and copied for every module.
+    """
+    try:
+        return _type_string_functions[string]
+    except KeyError:
+        pass
+
     code = dedent("""
     def pseudo_docstring_stuff():
         # Create a pseudo function for docstring statements.
     %s
     """)
-    if string is None:
-        return []
-
+    source = string
     for element in re.findall('((?:\w+\.)*\w+)\.', string):
         # Try to import module part in dotted name.
         # (e.g., 'threading' in 'threading.Thread').
-        string = 'import %s\n' % element + string
+        source = 'import %s\n' % element + source
 
     # Take the default grammar here, if we load the Python 2.7 grammar here, it
     # will be impossible to use `...` (Ellipsis) as a token. Docstring types
     # don't need to conform with the current grammar.
-    p = Parser(load_grammar(), code % indent_block(string))
+    p = Parser(load_grammar(), code % indent_block(source))
     try:
-        pseudo_cls = p.module.subscopes[0]
-        # First pick suite, then simple_stmt (-2 for DEDENT) and then the node,
-        # which is also not the last item, because there's a newline.
-        stmt = pseudo_cls.children[-1].children[-2].children[-2]
+        pseudo_func = p.module.subscopes[0]
+        _type_string_statement(pseudo_func)
     except (AttributeError, IndexError):
+        pseudo_func = None
+    _type_string_functions[string] = pseudo_func
+    return pseudo_func
+
+
+def _type_string_statement(pseudo_func):
+    # First pick suite, then simple_stmt (-2 for DEDENT) and then the node,
+    # which is also not the last item, because there's a newline.
+    return pseudo_func.children[-1].children[-2].children[-2]
+
+
+@memoize_default([], evaluator_is_first_arg=True)
+def _evaluate_for_statement_string(evaluator, string, module):
+    if string is None:
+        return []
+    pseudo_func = _parse_type_string(string)
+    if pseudo_func is None:
         return []
 
     # Use the module of the param.
     # TODO this module is not the module of the param in case of a function
     # call. In that case it's the module of the function call.
     # stuffed with content from a function call.
-    pseudo_cls.parent = module
-    return list(_execute_types_in_stmt(evaluator, stmt))
+    pseudo_func = deep_ast_copy(pseudo_func)
+    pseudo_func.parent = module
+    return list(_execute_types_in_stmt(evaluator, _type_string_statement(pseudo_func)))
 
 
 def _execute_types_in_stmt(evaluator, stmt):
@@ -185,11 +238,5 @@ def follow_param(evaluator, param):
 
 @memoize_default(None, evaluator_is_first_arg=True)
 def find_return_types(evaluator, func):
-    def search_return_in_docstr(code):
-        for p in DOCSTRING_RETURN_PATTERNS:
-            match = p.search(code)
-            if match:
-                return _strip_rst_role(match.group(1))
-
-    type_str = search_return_in_docstr(func.raw_doc)
+    type_str = _docstring_index(func.raw_doc).return_type
     return _evaluate_for_statement_string(evaluator, type_str, func.get_parent_until())
@@ -15,15 +15,27 @@ It works as follows:
 - |Jedi| sees a param
 - search for function calls named ``foo``
 - execute these calls and check the input. This work with a ``ParamListener``.
+
+Finding out which function a call refers to is expensive. The results are
+therefore stored in :class:`jedi.cache.CallSiteIndex`, so that calls of other
+functions with the same name are skipped in later searches. Modules whose
+calls are all known to call other functions are not even loaded. The index is
+only used as long as none of the modules, that the calls were resolved
+through, has changed.
 """
+import os
 from itertools import chain
 
 from jedi._compatibility import unicode
 from jedi.parser import tree
 from jedi import settings
 from jedi import debug
+from jedi import cache
+from jedi import common
 from jedi.evaluate.cache import memoize_default
 from jedi.evaluate import imports
+from jedi.evaluate import compiled
+from jedi.evaluate import helpers
 
 
 class ParamListener(object):
@@ -83,6 +95,16 @@ def search_function_call(evaluator, func):
             except KeyError:
                 return []
 
+            module_hash = None
+            indexed = False
+            if module.path is not None and compare_key is not None:
+                module_hash = helpers.module_hash(evaluator, module)
+                indexed = is_indexed(module.path, module_hash)
+            complete = True
+            skipped = False
+            resolved = []
+            definition_modules = [module]
+
             for name in names:
                 parent = name.parent
                 if tree.is_node(parent, 'trailer'):
@@ -97,6 +119,15 @@ def search_function_call(evaluator, func):
                             trailer = t
                             break
                 if trailer is not None:
+                    call = unicode(name), name.start_pos
+                    if indexed and _is_other_call(
+                            cache.CallSiteIndex.get_definitions(
+                                module.path, module_hash, call),
+                            compare_key):
+                        skipped = True
+                        continue
+                    detector = evaluator.execution_recursion_detector
+                    stopped_executions = detector.stopped_executions
                     types = evaluator.goto_definition(name)
 
                     # We have to remove decorators, because they are not the
@@ -112,13 +143,95 @@ def search_function_call(evaluator, func):
                         else:
                             undec.append(escope)
 
+                    keys = [_definition_key(evaluator, d) for d in undec]
+                    keys = [k for k in keys if k is not None]
+                    # Cancelled or stopped evaluations may have missed
+                    # definitions, they must not be indexed.
+                    if keys and module_hash is not None \
+                            and not evaluator.is_cancelled() \
+                            and stopped_executions == detector.stopped_executions:
+                        resolved.append((call, keys))
+                        for d in undec:
+                            m = d.get_parent_until()
+                            if isinstance(m, tree.Module) \
+                                    and m not in definition_modules:
+                                definition_modules.append(m)
+                    else:
+                        complete = False
+
                     if evaluator.wrap(compare) in undec:
                         # Only if we have the correct function we execute
                         # it, otherwise just ignore it.
                         evaluator.eval_trailer(types, trailer)
+            if resolved:
+                dependencies = _dependencies(evaluator, definition_modules)
+                for call, keys in resolved:
+                    if not cache.CallSiteIndex.set_definitions(
+                            module.path, module_hash, call, keys, dependencies) \
+                            and skipped:
+                        # The skipped calls were removed from the index.
+                        complete = False
+            if complete and module_hash is not None:
+                cache.CallSiteIndex.set_complete(module.path, module_hash, func_name)
             return listener.param_possibilities
         return get_posibilities(evaluator, module, func_name)
 
+    def current_hash(path):
+        """
+        The hash of a module as this evaluator would see it, or None if it
+        cannot be read.
+        """
+        try:
+            return hashes[path]
+        except KeyError:
+            pass
+        hashes[path] = None
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        item = cache.cached_parser_item(path)
+        if item is not None and (mtime is None or item.change_time is not None
+                                 and mtime <= item.change_time):
+            # Unsaved buffers are only in the parser cache.
+            hashes[path] = helpers.module_hash(evaluator, item.parser.module)
+        elif mtime is not None:
+            try:
+                with open(path, 'rb') as f:
+                    source = common.source_to_unicode(f.read())
+            except IOError:
+                return None
+            hashes[path] = helpers.source_hash(source)
+        return hashes[path]
+
+    def is_indexed(path, module_hash):
+        """
+        Checks that the modules, that the indexed calls of a module were
+        resolved through, haven't changed. Otherwise the calls are removed
+        from the index.
+        """
+        dependencies = cache.CallSiteIndex.get_dependencies(path, module_hash)
+        if dependencies is None:
+            return False
+        if all(current_hash(p) == h for p, h in dependencies.items()):
+            return True
+        cache.CallSiteIndex.remove(path)
+        return False
+
+    def calls_other_functions(path, module_hash):
+        """
+        Checks the index, if all calls of ``func_name`` in a module are known
+        to call other functions. Such modules don't need to be searched.
+        """
+        calls = cache.CallSiteIndex.get_calls(path, module_hash, func_name)
+        return calls is not None and is_indexed(path, module_hash) \
+            and all(_is_other_call(d, compare_key) for d in calls.values())
+
+    def skip_path(path):
+        module_hash = current_hash(path)
+        return module_hash is not None \
+            and calls_other_functions(path, module_hash)
+
     current_module = func.get_parent_until()
     func_name = unicode(func.name)
     compare = func
@@ -128,6 +241,9 @@ def search_function_call(evaluator, func):
             func_name = unicode(cls.name)
             compare = cls
 
+    compare_key = _definition_key(evaluator, compare)
+    hashes = {}
+
     # add the listener
     listener = ParamListener()
     func.listeners.add(listener)
@@ -135,7 +251,14 @@ def search_function_call(evaluator, func):
     try:
         result = []
         # This is like backtracking: Get the first possible result.
-        for mod in imports.get_modules_containing_name(evaluator, [current_module], func_name):
+        modules = imports.get_modules_containing_name(
+            evaluator, [current_module], func_name,
+            None if compare_key is None else skip_path)
+        for mod in modules:
+            if compare_key is not None and mod.path is not None \
+                    and calls_other_functions(mod.path,
+                                              helpers.module_hash(evaluator, mod)):
+                continue
             result = get_params_for_module(mod)
             if result:
                 break
@@ -144,3 +267,43 @@ def search_function_call(evaluator, func):
         func.listeners.remove(listener)
 
     return result
+
+
+def _definition_key(evaluator, definition):
+    """
+    Returns a key for :class:`jedi.cache.CallSiteIndex` or None if the
+    definition is not part of a Python file.
+    """
+    if isinstance(definition, compiled.CompiledObject):
+        return None
+    module = definition.get_parent_until()
+    if isinstance(module, compiled.CompiledObject) \
+            or getattr(module, 'path', None) is None:
+        return None
+    return module.path, helpers.module_hash(evaluator, module), definition.start_pos
+
+
+def _dependencies(evaluator, modules):
+    """
+    Returns the ``(path, source_hash)`` pairs of the modules, that calls could
+    have been resolved through: The module of the calls, the modules of their
+    definitions and all the modules imported by them.
+    """
+    return [(m.path, helpers.module_hash(evaluator, m))
+            for m in helpers.imported_modules(evaluator, modules)
+            if m.path is not None]
+
+
+def _is_other_call(definitions, compare_key):
+    """
+    Checks the definition keys of an indexed call, if the call is known to
+    call something else than the definition of ``compare_key``.
+    """
+    if not definitions:
+        return False
+    for def_path, def_hash, start_pos in definitions:
+        if def_path == compare_key[0] and (def_hash != compare_key[1]
+                                           or start_pos == compare_key[2]):
+            # Either it's the definition or its module has changed.
+            return False
+    return True
@@ -11,13 +11,13 @@ would check whether a flow has the form of ``if isinstance(a, type_or_tuple)``.
 Unfortunately every other thing is being ignored (e.g. a == '' would be easy to
 check for -> a is a string). There's big potential in these checks.
 """
+from bisect import bisect_left
 from itertools import chain
 
 from jedi._compatibility import unicode, u
 from jedi.parser import tree
 from jedi import debug
 from jedi import common
-from jedi import settings
 from jedi.evaluate import representation as er
 from jedi.evaluate import dynamic
 from jedi.evaluate import compiled
@@ -31,6 +31,25 @@ from jedi.evaluate import helpers
 from jedi.evaluate.cache import memoize_default
 
 
+class _UnknownPosition(Exception):
+    pass
+
+
+class _StartPositions(object):
+    """The start positions of a list of names, as a sequence for ``bisect``."""
+    def __init__(self, names):
+        self._names = names
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        start_pos = self._names[index].start_pos
+        if start_pos[0] is None:
+            raise _UnknownPosition
+        return start_pos
+
+
 def filter_after_position(names, position):
     """
     Removes all names after a certain position. If position is None, just
@@ -48,10 +67,27 @@ def filter_after_position(names, position):
     return names_new
 
 
-def filter_definition_names(names, origin, position=None):
+def _filter_sorted_after_position(names, position):
     """
-    Filter names that are actual definitions in a scope. Names that are just
-    used will be ignored.
+    Does the same as :func:`filter_after_position` for names that are sorted
+    by position, like the names of an identifier in a ``names_dict`` (the
+    parser adds them in the order of the source). Only the names after
+    ``position`` are checked one by one.
+    """
+    if position is None:
+        return names
+    try:
+        index = bisect_left(_StartPositions(names), position)
+    except _UnknownPosition:
+        return filter_after_position(names, position)
+    return names[:index] + filter_after_position(names[index:], position)
+
+
+def _definition_names(names, origin, position=None, reverse=False):
+    """
+    Generates the names of :func:`filter_definition_names`. If ``reverse`` is
+    True, the names need to be sorted by position and the last definition
+    comes first.
     """
     # Just calculate the scope from the first
     stmt = names[0].get_definition()
@@ -59,17 +95,31 @@ def filter_definition_names(names, origin, position=None):
 
     if not (isinstance(scope, er.FunctionExecution)
             and isinstance(scope.base, er.LambdaWrapper)):
-        names = filter_after_position(names, position)
-    names = [name for name in names if name.is_definition()]
+        if reverse:
+            names = _filter_sorted_after_position(names, position)
+        else:
+            names = filter_after_position(names, position)
+    if reverse:
+        names = reversed(names)
+
+    for name in names:
+        if not name.is_definition():
+            continue
+        # Private name mangling (compile.c) disallows access on names
+        # preceeded by two underscores `__` if used outside of the class. Names
+        # that also end with two underscores (e.g. __id__) are not affected.
+        if name.value.startswith('__') and not name.value.endswith('__') \
+                and filter_private_variable(scope, origin):
+            continue
+        yield name
 
-    # Private name mangling (compile.c) disallows access on names
-    # preceeded by two underscores `__` if used outside of the class. Names
-    # that also end with two underscores (e.g. __id__) are not affected.
-    for name in list(names):
-        if name.value.startswith('__') and not name.value.endswith('__'):
-            if filter_private_variable(scope, origin):
-                names.remove(name)
-    return names
+
+def filter_definition_names(names, origin, position=None):
+    """
+    Filter names that are actual definitions in a scope. Names that are just
+    used will be ignored.
+    """
+    return list(_definition_names(names, origin, position))
 
 
 class NameFinder(object):
@@ -122,12 +172,12 @@ class NameFinder(object):
         except KeyError:
             return []
 
-        names = filter_definition_names(names, self.name_str, position)
-
         name_scope = None
         # Only the names defined in the last position are valid definitions.
+        # The definitions are generated lazily, from the last to the first,
+        # so the search stops at the first reachable one.
         last_names = []
-        for name in reversed(sorted(names, key=lambda name: name.start_pos)):
+        for name in _definition_names(names, self.name_str, position, reverse=True):
             stmt = name.get_definition()
             name_scope = self._evaluator.wrap(stmt.get_parent_scope())
 
@@ -384,7 +434,7 @@ def check_flow_information(evaluator, flow, search_name, pos):
 
     ensures that `k` is a string.
     """
-    if not settings.dynamic_flow_information:
+    if not evaluator.setting('dynamic_flow_information'):
         return None
 
     result = []
@@ -409,6 +459,18 @@ def check_flow_information(evaluator, flow, search_name, pos):
 
 
 def _check_isinstance_type(evaluator, element, search_name):
+    # Do a simple get_code comparison. They should just have the same code,
+    # and everything will be all right.
+    call = helpers.call_of_name(search_name)
+    return list(_isinstance_types(evaluator, element, call.get_code()))
+
+
+@memoize_default([], evaluator_is_first_arg=True)
+def _isinstance_types(evaluator, element, code):
+    """
+    The types of an ``isinstance(<code>, classes)`` check. The check is the
+    same for all the names in a flow and is therefore only evaluated once.
+    """
     try:
         assert element.type == 'power'
         # this might be removed if we analyze and, etc
@@ -425,11 +487,8 @@ def _check_isinstance_type(evaluator, element, search_name):
         # Disallow keyword arguments
         assert len(lst) == 2 and lst[0][0] is None and lst[1][0] is None
         name = lst[0][1][0]  # first argument, values, first value
-        # Do a simple get_code comparison. They should just have the same code,
-        # and everything will be all right.
         classes = lst[1][1][0]
-        call = helpers.call_of_name(search_name)
-        assert name.get_code() == call.get_code()
+        assert name.get_code() == code
     except AssertionError:
         return []
 
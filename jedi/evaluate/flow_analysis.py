@@ -1,4 +1,5 @@
 from jedi.parser import tree
+from jedi.evaluate.cache import memoize_default
 
 
 class Status(object):
@@ -55,14 +56,10 @@ def _break_check(evaluator, stmt, base_scope, element_scope):
     reachable = REACHABLE
     if isinstance(element_scope, tree.IfStmt):
         if element_scope.node_after_else(stmt):
-            for check_node in element_scope.check_nodes():
-                reachable = _check_if(evaluator, check_node)
-                if reachable in (REACHABLE, UNSURE):
-                    break
-            reachable = reachable.invert()
+            check_node = None
         else:
-            node = element_scope.node_in_which_check_node(stmt)
-            reachable = _check_if(evaluator, node)
+            check_node = element_scope.node_in_which_check_node(stmt)
+        reachable = _check_if_branch(evaluator, element_scope, check_node)
     elif isinstance(element_scope, (tree.TryStmt, tree.WhileStmt)):
         return UNSURE
 
@@ -75,6 +72,23 @@ def _break_check(evaluator, stmt, base_scope, element_scope):
     return reachable
 
 
+@memoize_default(UNSURE, evaluator_is_first_arg=True)
+def _check_if_branch(evaluator, if_stmt, check_node):
+    """
+    The reachability of a branch of an if statement, the else branch if
+    ``check_node`` is None. It's the same for all the statements in the branch
+    and therefore only checked once.
+    """
+    if check_node is not None:
+        return _check_if(evaluator, check_node)
+
+    for check_node in if_stmt.check_nodes():
+        reachable = _check_if(evaluator, check_node)
+        if reachable in (REACHABLE, UNSURE):
+            break
+    return reachable.invert()
+
+
 def _check_if(evaluator, node):
     types = evaluator.eval_element(node)
     values = set(x.py__bool__() for x in types)
@@ -2,6 +2,8 @@ import copy
 from itertools import chain
 
 from jedi.parser import tree
+from jedi import cache
+from jedi.evaluate.cache import memoize_default
 
 
 def deep_ast_copy(obj, parent=None, new_elements=None):
@@ -40,19 +42,20 @@ def deep_ast_copy(obj, parent=None, new_elements=None):
             new_children.append(new_child)
         new_obj.children = new_children
 
-        # Copy the names_dict (if there is one).
-        try:
-            names_dict = obj.names_dict
-        except AttributeError:
-            pass
-        else:
+        # Copy the names_dict and the self_names_dict of functions (if there
+        # is one).
+        for attr in ('names_dict', 'self_names_dict'):
+            try:
+                names_dict = getattr(obj, attr)
+            except AttributeError:
+                continue
+            new_names_dict = {}
             try:
-                new_obj.names_dict = new_names_dict = {}
+                setattr(new_obj, attr, new_names_dict)
             except AttributeError:  # Impossible to set CompFor.names_dict
-                pass
-            else:
-                for string, names in names_dict.items():
-                    new_names_dict[string] = [new_elements[n] for n in names]
+                continue
+            for string, names in names_dict.items():
+                new_names_dict[string] = [new_elements[n] for n in names]
         return new_obj
 
     if obj.type == 'name':
@@ -71,6 +74,199 @@ def deep_ast_copy(obj, parent=None, new_elements=None):
     return new_obj
 
 
+# Leaves that are not copied, their parents don't matter.
+_shared_leaf_types = 'whitespace', 'operator', 'keyword', 'number', 'string'
+_overlay_classes = {}
+
+
+class TreeOverlay(object):
+    """
+    Lazy copies of the nodes of a subtree (e.g. of an executed function), that
+    point at the original nodes. In contrast to :func:`deep_ast_copy` a node
+    is only created once it's accessed, through the ``children`` of another
+    copy or :meth:`__getitem__`. Evaluating a function therefore only creates
+    the nodes that the evaluation needs.
+
+    The children of ``root`` get ``parent`` as their parent. Their ``parent``,
+    ``children`` and names dicts refer to other copies, everything else is the
+    same as in the original nodes.
+    """
+    def __init__(self, root, parent):
+        self._root = root
+        self._parent = parent
+        self._nodes = {}
+
+    def __getitem__(self, node):
+        """Returns the copy of a node of the subtree."""
+        try:
+            return self._nodes[node]
+        except KeyError:
+            pass
+        parent = node.parent
+        if node.type in _shared_leaf_types or parent is None:
+            return node
+        if parent is self._root:
+            new_parent = self._parent
+        else:
+            new_parent = self[parent]
+            if new_parent is parent:
+                # Not part of the subtree.
+                return node
+        return self._create(node, new_parent)
+
+    def copy_root(self):
+        """
+        Returns a copy of ``root`` itself. A name gets ``parent`` as its
+        parent, other nodes keep the parent of the original.
+        """
+        root = self._root
+        if root.type in _shared_leaf_types:
+            return root
+        try:
+            return self._nodes[root]
+        except KeyError:
+            parent = self._parent if root.type == 'name' else root.parent
+            return self._create(root, parent)
+
+    def children(self, node):
+        """Returns the copies of the children of a node of the subtree."""
+        parent = self._parent if node is self._root else self[node]
+        return [self._child(c, parent) for c in node.children]
+
+    def names_dict(self, names_dict):
+        """Returns the copy of a names dict of a node of the subtree."""
+        return _OverlayNamesDict(self, names_dict)
+
+    def _child(self, node, parent):
+        if node.type in _shared_leaf_types:
+            return node
+        try:
+            return self._nodes[node]
+        except KeyError:
+            return self._create(node, parent)
+
+    def _create(self, node, parent):
+        cls = _overlay_class(type(node))
+        new = cls.__new__(cls)
+        for name in cls._copied_slots:
+            try:
+                setattr(new, name, getattr(node, name))
+            except AttributeError:
+                pass
+        try:
+            new.__dict__.update(node.__dict__)
+        except AttributeError:  # Most nodes only have slots.
+            pass
+        new.parent = parent
+        new._original = node
+        new._overlay = self
+        self._nodes[node] = new
+        return new
+
+
+def _overlay_class(cls):
+    """
+    Returns a subclass of a parser class, whose ``children`` and names dicts
+    are created on access by a :class:`TreeOverlay`.
+    """
+    if '_copied_slots' in cls.__dict__:
+        # The nodes of functions in executions are copies themselves.
+        return cls
+    try:
+        return _overlay_classes[cls]
+    except KeyError:
+        pass
+    slots = set()
+    for c in cls.__mro__:
+        slots.update(getattr(c, '__slots__', ()))
+    lazy = [n for n in ('children', 'names_dict', 'self_names_dict') if n in slots]
+    dct = {
+        '__slots__': ('_original', '_overlay') + tuple('_' + n for n in lazy),
+        '_copied_slots': [n for n in slots if n not in lazy and n != 'parent'],
+    }
+    if 'children' in lazy:
+        dct['children'] = _lazy_property(
+            '_children', lambda self: self._overlay.children(self._original))
+    for name in lazy[1:]:
+        dct[name] = _lazy_property(
+            '_' + name,
+            lambda self, name=name: self._overlay.names_dict(
+                getattr(self._original, name)))
+    new = _overlay_classes[cls] = type(cls.__name__, (cls,), dct)
+    return new
+
+
+def _lazy_property(attribute, create):
+    def getter(self):
+        try:
+            return getattr(self, attribute)
+        except AttributeError:
+            value = create(self)
+            setattr(self, attribute, value)
+            return value
+
+    def setter(self, value):
+        setattr(self, attribute, value)
+    return property(getter, setter)
+
+
+class _OverlayNamesDict(object):
+    """
+    A names dict of a :class:`TreeOverlay`. The lists of names are copied,
+    when they are accessed.
+    """
+    def __init__(self, overlay, names_dict):
+        self._overlay = overlay
+        self._original = names_dict
+        self._names = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._names[key]
+        except KeyError:
+            names = [self._overlay[n] for n in self._original[key]]
+            self._names[key] = names
+            return names
+
+    def __setitem__(self, key, value):
+        self._names[key] = value
+
+    def __contains__(self, key):
+        return key in self._names or key in self._original
+
+    def __iter__(self):
+        for key in self._original:
+            yield key
+        for key in self._names:
+            if key not in self._original:
+                yield key
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
 def call_of_name(name, cut_own_trailer=False):
     """
     Creates a "call" node that consist of all ``trailer`` and ``power``
@@ -117,6 +313,44 @@ def get_module_names(module, all_scopes):
     return chain.from_iterable(dct.values())
 
 
+def source_hash(source):
+    """The hash of the unicode source of a module, see :func:`module_hash`."""
+    return cache.md5(source.encode('utf-8'))
+
+
+@memoize_default(evaluator_is_first_arg=True)
+def module_hash(evaluator, module):
+    """
+    The hash of the source of a module. Modules of the fast parser are updated
+    in place, this is what identifies their content. The fast parser hashes
+    the source while parsing, other modules are hashed here.
+    """
+    hash_ = getattr(module, 'source_hash', None)
+    if hash_ is None:
+        hash_ = source_hash(module.get_code())
+    return hash_
+
+
+def imported_modules(evaluator, modules):
+    """
+    Returns the modules and all the modules that were imported by them
+    (directly or indirectly) in the evaluation so far. Names, e.g. base
+    classes, can only be found through these modules.
+    """
+    result = []
+    todo = list(modules)
+    while todo:
+        module = todo.pop()
+        if module not in result:
+            result.append(module)
+            for imported in evaluator.module_imports.get(evaluator.wrap(module), ()):
+                # Compiled modules don't import anything.
+                base = getattr(imported, 'base', None)
+                if isinstance(base, tree.Module):
+                    todo.append(base)
+    return result
+
+
 class FakeImport(tree.ImportName):
     def __init__(self, name, parent, level=0):
         super(FakeImport, self).__init__([])
@@ -12,6 +12,7 @@ This module also supports import autocompletion, which means to complete
 statements like ``from datetim`` (curser at the end would return ``datetime``).
 """
 import imp
+import mmap
 import os
 import pkgutil
 import sys
@@ -24,9 +25,9 @@ from jedi import cache
 from jedi.parser import fast
 from jedi.parser import tree
 from jedi.evaluate import sys_path
+from jedi.evaluate.sys_path import replaced_sys_path
 from jedi.evaluate import helpers
 from jedi import settings
-from jedi.common import source_to_unicode
 from jedi.evaluate import compiled
 from jedi.evaluate import analysis
 from jedi.evaluate.cache import memoize_default, NO_DEFAULT
@@ -247,9 +248,12 @@ class Importer(object):
 
     @memoize_default(NO_DEFAULT)
     def follow(self):
-        if not self.import_path:
+        if not self.import_path or self._evaluator.is_cancelled():
             return []
-        return self._do_import(self.import_path, self.sys_path_with_modifications())
+        modules = self._do_import(self.import_path, self.sys_path_with_modifications())
+        importing = self._evaluator.wrap(self.module)
+        self._evaluator.module_imports.setdefault(importing, set()).update(modules)
+        return modules
 
     def _do_import(self, import_path, sys_path):
         """
@@ -321,12 +325,9 @@ class Importer(object):
                 debug.dbg('search_module %s in %s', import_parts[-1], self.file_path)
                 # Override the sys.path. It works only good that way.
                 # Injecting the path directly into `find_module` did not work.
-                sys.path, temp = sys_path, sys.path
-                try:
+                with replaced_sys_path(sys_path):
                     module_file, module_path, is_pkg = \
                         find_module(import_parts[-1])
-                finally:
-                    sys.path = temp
             except ImportError:
                 # The module is not a package.
                 _add_error(self._evaluator, import_path[-1])
@@ -461,27 +462,31 @@ def add_module(evaluator, module_name, module):
         evaluator.modules[module_name] = module
 
 
-def get_modules_containing_name(evaluator, mods, name):
+def get_modules_containing_name(evaluator, mods, name, skip_path=None):
     """
     Search a name in the directories of modules.
+
+    :param skip_path: Called with the paths of files that are not loaded yet.
+        If it returns True, the file is not loaded.
     """
     def check_python_file(path):
+        item = cache.cached_parser_item(path)
+        if item is not None:
+            return item.parser.module
+        if path not in containing:
+            return None
+        if skip_path is not None and skip_path(path):
+            return None
         try:
-            return cache.parser_cache[path].parser.module
-        except KeyError:
-            try:
-                return check_fs(path)
-            except IOError:
-                return None
+            return check_fs(path)
+        except IOError:
+            return None
 
     def check_fs(path):
-        with open(path, 'rb') as f:
-            source = source_to_unicode(f.read())
-            if name in source:
-                module_name = os.path.basename(path)[:-3]  # Remove `.py`.
-                module = _load_module(evaluator, path, source)
-                add_module(evaluator, module_name, module)
-                return module
+        module_name = os.path.basename(path)[:-3]  # Remove `.py`.
+        module = _load_module(evaluator, path)
+        add_module(evaluator, module_name, module)
+        return module
 
     # skip non python modules
     mods = set(m for m in mods if not isinstance(m, compiled.CompiledObject))
@@ -490,18 +495,80 @@ def get_modules_containing_name(evaluator, mods, name):
         mod_paths.add(m.path)
         yield m
 
-    if settings.dynamic_params_for_other_modules:
+    if evaluator.setting('dynamic_params_for_other_modules'):
         paths = set(settings.additional_dynamic_modules)
         for p in mod_paths:
             if p is not None:
                 d = os.path.dirname(p)
-                for entry in os.listdir(d):
+                try:
+                    entries = os.listdir(d)
+                except OSError:
+                    # The file of the module might not be saved yet.
+                    continue
+                for entry in entries:
                     if entry not in mod_paths:
                         if entry.endswith('.py'):
                             paths.add(d + os.path.sep + entry)
 
-        for p in sorted(paths):
-            # make testing easier, sort it - same results on every interpreter
+        # make testing easier, sort it - same results on every interpreter
+        paths = sorted(paths)
+        # Files that are not parsed yet are only loaded if they contain the
+        # name. Without a filesystem cache, building the name index is not
+        # worth it and the files are searched directly. Otherwise only the
+        # files that contain the name are indexed.
+        unparsed = [p for p in paths if p not in cache.parser_cache]
+        if settings.use_filesystem_cache:
+            containing = set(cache.NameIndex.filter_paths(
+                unparsed, name, _file_contains_name))
+        else:
+            containing = set(p for p in unparsed if _file_contains_name(p, name))
+        for p in paths:
             c = check_python_file(p)
             if c is not None and c not in mods and not isinstance(c, compiled.CompiledObject):
                 yield c
+
+
+def _is_identifier_byte(byte):
+    # Non-ASCII bytes may be part of identifiers in Python 3.
+    return byte.isalnum() or byte == b'_' or byte >= b'\x80'
+
+
+def _file_contains_name(path, name):
+    """
+    Checks if the identifier ``name`` appears in a file, without reading and
+    decoding the whole file: The file is memory mapped and searched for the
+    encoded name.
+    """
+    try:
+        needle = name.encode('ascii')
+    except UnicodeEncodeError:
+        # Non-ASCII names depend on the encoding of the file.
+        try:
+            with open(path, 'rb') as f:
+                return name in common.source_to_unicode(f.read())
+        except IOError:
+            return False
+
+    try:
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                return False
+    except (IOError, OSError):
+        return False
+
+    try:
+        start = 0
+        while True:
+            index = mapped.find(needle, start)
+            if index == -1:
+                return False
+            end = index + len(needle)
+            if not (index and _is_identifier_byte(mapped[index - 1:index])
+                    or _is_identifier_byte(mapped[end:end + 1])):
+                return True
+            start = index + 1
+    finally:
+        mapped.close()
@@ -146,7 +146,8 @@ class Comprehension(IterableWrapper):
                 break
             last = last.children[-1]
 
-        return helpers.deep_ast_copy(comprehension.children[0], parent=last_comp)
+        overlay = helpers.TreeOverlay(comprehension.children[0], last_comp)
+        return overlay.copy_root()
 
     def get_exact_index_types(self, index):
         return [self._evaluator.eval_element(self.eval_node())[index]]
@@ -476,20 +477,17 @@ def _check_array_additions(evaluator, compare_array, module, is_list):
             return node
         return node.get_parent_until(er.FunctionExecution)
 
-    temp_param_add, settings.dynamic_params_for_other_modules = \
-        settings.dynamic_params_for_other_modules, False
-
     search_names = ['append', 'extend', 'insert'] if is_list else ['add', 'update']
     comp_arr_parent = get_execution_parent(compare_array)
 
+    possible_names = _possible_mutations(evaluator, module, compare_array)
     added_types = []
-    for add_name in search_names:
-        try:
-            possible_names = module.used_names[add_name]
-        except KeyError:
-            continue
-        else:
+    # Following the params of functions in other modules is too expensive here.
+    with evaluator.override_settings(dynamic_params_for_other_modules=False):
+        for add_name in search_names:
             for name in possible_names:
+                if name.value != add_name:
+                    continue
                 # Check if the original scope is an execution. If it is, one
                 # can search for the same statement, that is in the module
                 # dict. Executions are somewhat special in jedi, since they
@@ -530,11 +528,54 @@ def _check_array_additions(evaluator, compare_array, module, is_list):
                     added_types += check_additions(execution_trailer.children[1], add_name)
 
                 evaluator.recursion_detector.pop_stmt()
-    # reset settings
-    settings.dynamic_params_for_other_modules = temp_param_add
     return added_types
 
 
+def _possible_mutations(evaluator, module, array):
+    """
+    Returns the names of the calls (``append``, ``add``, ...) in a module that
+    might add something to ``array``. Calls on names that are only assigned
+    to other array literals (``foo = []``) are skipped.
+    """
+    mutations = module.array_mutations
+    # ``list()`` and ``set()`` instances are never literals.
+    array_pos = array.atom.start_pos if isinstance(array, Array) else None
+    names = []
+    for key in mutations:
+        if key is not None:
+            positions = _literal_assignments(evaluator, module, key)
+            if positions is not None and array_pos not in positions:
+                continue
+        names += mutations[key]
+    return sorted(names, key=lambda name: name.start_pos)
+
+
+@memoize_default(evaluator_is_first_arg=True)
+def _literal_assignments(evaluator, module, name_str):
+    """
+    Returns the positions of the literals that are assigned to a name (in the
+    whole module) or None if the name is also defined in other ways.
+    """
+    try:
+        names = module.used_names[name_str]
+    except KeyError:
+        return None
+    positions = set()
+    for name in names:
+        if not name.is_definition():
+            continue
+        stmt = name.get_definition()
+        if stmt.type != 'expr_stmt' or len(stmt.children) != 3 \
+                or stmt.children[0] is not name or stmt.children[1] != '=':
+            return None
+        rhs = stmt.children[2]
+        if not (rhs.type in ('number', 'string') or rhs.type == 'atom'
+                and rhs.children[0] in ('[', '{')):
+            return None
+        positions.add(rhs.start_pos)
+    return positions or None
+
+
 def check_array_instances(evaluator, instance):
     """Used for set() and list() instances."""
     if not settings.dynamic_array_additions:
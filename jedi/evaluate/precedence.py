@@ -6,8 +6,10 @@ import operator
 from jedi._compatibility import unicode
 from jedi.parser import tree
 from jedi import debug
+from jedi import settings
 from jedi.evaluate.compiled import (CompiledObject, create, builtin,
-                                    keyword_from_value, true_obj, false_obj)
+                                    keyword_from_value, true_obj, false_obj,
+                                    object_obj)
 from jedi.evaluate import analysis
 
 # Maps Python syntax to the operator module.
@@ -79,9 +81,77 @@ def calculate(evaluator, left_result, operator, right_result):
             for left in left_result:
                 for right in right_result:
                     result += _element_calculate(evaluator, left, operator, right)
+    return limit_types(evaluator, result)
+
+
+def _unique(types):
+    seen = set()
+    result = []
+    for typ in types:
+        if id(typ) not in seen:
+            seen.add(id(typ))
+            result.append(typ)
     return result
 
 
+def _common_base(evaluator, types):
+    """
+    Returns the first class in the MROs of the classes of all ``types`` or
+    ``object``, if not all of them are instances.
+    """
+    from jedi.evaluate import representation as er
+    mros = []
+    for typ in types:
+        if not isinstance(typ, er.Instance):
+            return object_obj
+        mros.append(typ.base.py__mro__(evaluator))
+    for cls in mros[0]:
+        if all(cls in mro for mro in mros[1:]):
+            return cls
+    return object_obj
+
+
+def limit_types(evaluator, types):
+    """
+    Limits the number of evaluated types to
+    :data:`jedi.settings.max_inferred_types`. If there are more, duplicates
+    are removed and the types are widened: Literals become instances of their
+    types (``1`` -> ``int()``) and only one instance of a class is kept. The
+    types that still don't fit are replaced by an instance of their common
+    base class and the results are marked as partial.
+
+    Smaller lists are not changed, because duplicates are meaningful for the
+    iterations of for loops (e.g. ``for c in 'aa': s += c``).
+    """
+    from jedi.evaluate import representation as er
+    max_types = settings.max_inferred_types
+    if len(types) <= max_types:
+        return types
+    types = _unique(types)
+    if len(types) <= max_types:
+        return types
+
+    widened = []
+    classes = set()
+    for typ in types:
+        if is_literal(typ):
+            cls = builtin.get_by_name(typ.name.get_code())
+            typ = evaluator.execute(cls)[0]
+        if isinstance(typ, er.Instance):
+            if typ.base in classes:
+                continue
+            classes.add(typ.base)
+        widened.append(typ)
+    widened = _unique(widened)
+    if len(widened) > max_types:
+        rest = widened[max_types - 1:]
+        base = _common_base(evaluator, rest)
+        debug.warning('Too many types, widening %s to %s', rest, base)
+        widened = widened[:max_types - 1] + evaluator.execute(base)
+        evaluator.results_are_partial = True
+    return widened
+
+
 def factor_calculate(evaluator, types, operator):
     """
     Calculates `+`, `-`, `~` and `not` prefixes.
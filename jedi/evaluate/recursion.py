@@ -3,12 +3,11 @@ Recursions are the recipe of |jedi| to conquer Python code. However, someone
 must stop recursions going mad. Some settings are here to make |jedi| stop at
 the right time. You can read more about them :ref:`here <settings-recursion>`.
 
-Next to :mod:`jedi.evaluate.cache` this module also makes |jedi| not
-thread-safe. Why?  ``execution_recursion_decorator`` uses class variables to
-count the function calls.
+The detectors count the statements and function calls of a single
+:class:`jedi.evaluate.Evaluator`, so evaluators in different threads don't
+interfere with each other.
 """
 from jedi import debug
-from jedi import settings
 from jedi.evaluate import compiled
 from jedi.evaluate import iterable
 
@@ -34,31 +33,33 @@ class RecursionDetector(object):
     def __init__(self):
         self.top = None
         self.current = None
+        # The active statements by module and position. A statement can only
+        # be active once, therefore no need to walk the stack for checks.
+        self._active = {}
 
     def push_stmt(self, stmt):
-        self.current = _RecursionNode(stmt, self.current)
-        check = self._check_recursion()
-        if check:
-            debug.warning('catched stmt recursion: %s against %s @%s', stmt,
-                          check.stmt, stmt.start_pos)
-            self.pop_stmt()
-            return True
-        return False
+        node = _RecursionNode(stmt, self.current)
+        self.current = node
+        if node.is_ignored:
+            return False
+        try:
+            check = self._active[node.key]
+        except KeyError:
+            self._active[node.key] = node
+            return False
+        debug.warning('catched stmt recursion: %s against %s @%s', stmt,
+                      check.stmt, stmt.start_pos)
+        self.current = node.parent
+        return True
 
     def pop_stmt(self):
-        if self.current is not None:
+        node = self.current
+        if node is not None:
             # I don't know how current can be None, but sometimes it happens
             # with Python3.
-            self.current = self.current.parent
-
-    def _check_recursion(self):
-        test = self.current
-        while True:
-            test = test.parent
-            if self.current == test:
-                return test
-            if not test:
-                return False
+            self.current = node.parent
+            if not node.is_ignored:
+                self._active.pop(node.key, None)
 
     def node_statements(self):
         result = []
@@ -74,6 +75,7 @@ class _RecursionNode(object):
     def __init__(self, stmt, parent):
         self.script = stmt.get_parent_until()
         self.position = stmt.start_pos
+        self.key = self.script, self.position
         self.parent = parent
         self.stmt = stmt
 
@@ -82,14 +84,6 @@ class _RecursionNode(object):
         # simple.
         self.is_ignored = self.script == compiled.builtin
 
-    def __eq__(self, other):
-        if not other:
-            return None
-
-        return self.script == other.script \
-            and self.position == other.position \
-            and not self.is_ignored and not other.is_ignored
-
 
 def execution_recursion_decorator(func):
     def run(execution, **kwargs):
@@ -109,11 +103,17 @@ class ExecutionRecursionDetector(object):
     Catches recursions of executions.
     It is designed like a Singelton. Only one instance should exist.
     """
-    def __init__(self):
+    def __init__(self, evaluator):
+        self._evaluator = evaluator
         self.recursion_level = 0
         self.parent_execution_funcs = []
+        # How often the funcs are in `parent_execution_funcs`.
+        self._parent_counts = {}
         self.execution_funcs = set()
         self.execution_count = 0
+        # How often executions were stopped, because too many functions were
+        # executed. Results that were evaluated meanwhile may be incomplete.
+        self.stopped_executions = 0
 
     def __call__(self, execution):
         debug.dbg('Execution recursions: %s', execution, self.recursion_level,
@@ -126,18 +126,22 @@ class ExecutionRecursionDetector(object):
         return result
 
     def pop_execution(cls):
-        cls.parent_execution_funcs.pop()
+        base = cls.parent_execution_funcs.pop()
+        cls._parent_counts[base] -= 1
         cls.recursion_level -= 1
 
     def push_execution(cls, execution):
-        in_par_execution_funcs = execution.base in cls.parent_execution_funcs
+        in_par_execution_funcs = cls._parent_counts.get(execution.base, 0) > 0
         in_execution_funcs = execution.base in cls.execution_funcs
         cls.recursion_level += 1
         cls.execution_count += 1
         cls.execution_funcs.add(execution.base)
         cls.parent_execution_funcs.append(execution.base)
+        cls._parent_counts[execution.base] = \
+            cls._parent_counts.get(execution.base, 0) + 1
 
-        if cls.execution_count > settings.max_executions:
+        if cls.execution_count > cls._evaluator.setting('max_executions'):
+            cls.stopped_executions += 1
             return True
 
         if isinstance(execution.base, (iterable.Array, iterable.Generator)):
@@ -147,11 +151,12 @@ class ExecutionRecursionDetector(object):
             return False
 
         if in_par_execution_funcs:
-            if cls.recursion_level > settings.max_function_recursion_level:
+            if cls.recursion_level > cls._evaluator.setting('max_function_recursion_level'):
                 return True
         if in_execution_funcs and \
-                len(cls.execution_funcs) > settings.max_until_execution_unique:
+                len(cls.execution_funcs) > cls._evaluator.setting('max_until_execution_unique'):
             return True
-        if cls.execution_count > settings.max_executions_without_builtins:
+        if cls.execution_count > cls._evaluator.setting('max_executions_without_builtins'):
+            cls.stopped_executions += 1
             return True
         return False
@@ -38,6 +38,7 @@ from jedi._compatibility import use_metaclass, unicode, Python3Method
 from jedi.parser import tree
 from jedi import debug
 from jedi import common
+from jedi import cache
 from jedi.cache import underscore_memoization, cache_star_import
 from jedi.evaluate.cache import memoize_default, CachedMetaClass, NO_DEFAULT
 from jedi.evaluate import compiled
@@ -121,28 +122,15 @@ class Instance(use_metaclass(CachedMetaClass, Executed)):
         func = get_instance_el(self._evaluator, self, func, True)
         return FunctionExecution(self._evaluator, func, self.var_args)
 
-    def _get_func_self_name(self, func):
-        """
-        Returns the name of the first param in a class method (which is
-        normally self.
-        """
-        try:
-            return str(func.params[0].name)
-        except IndexError:
-            return None
-
     def _self_names_dict(self, add_mro=True):
         names = {}
-        # This loop adds the names of the self object, copies them and removes
-        # the self.
+        # This loop adds the names of the self object, which are searched by
+        # the parser (see ``tree.Function.self_names_dict``).
         for sub in self.base.subscopes:
-            if isinstance(sub, tree.Class):
-                continue
-            # Get the self name, if there's one.
-            self_name = self._get_func_self_name(sub)
-            if self_name is None:
+            if isinstance(sub, tree.Class) or not sub.self_names_dict:
                 continue
 
+            execution = None
             if sub.name.value == '__init__' and not self.is_generated:
                 # ``__init__`` is special because the params need are injected
                 # this way. Therefore an execution is necessary.
@@ -150,18 +138,13 @@ class Instance(use_metaclass(CachedMetaClass, Executed)):
                     # __init__ decorators should generally just be ignored,
                     # because to follow them and their self variables is too
                     # complicated.
-                    sub = self._get_method_execution(sub)
-            for name_list in sub.names_dict.values():
+                    execution = self._get_method_execution(sub)
+            for key, name_list in sub.self_names_dict.items():
+                arr = names.setdefault(key, [])
                 for name in name_list:
-                    if name.value == self_name and name.prev_sibling() is None:
-                        trailer = name.next_sibling()
-                        if tree.is_node(trailer, 'trailer') \
-                                and len(trailer.children) == 2 \
-                                and trailer.children[0] == '.':
-                            name = trailer.children[1]  # After dot.
-                            if name.is_definition():
-                                arr = names.setdefault(name.value, [])
-                                arr.append(get_instance_el(self._evaluator, self, name))
+                    if execution is not None:
+                        name = execution.copied_name(name)
+                    arr.append(get_instance_el(self._evaluator, self, name))
         return names
 
     def get_subscope_by_name(self, name):
@@ -450,8 +433,14 @@ class Class(use_metaclass(CachedMetaClass, Wrapper)):
     def py__bases__(self, evaluator):
         arglist = self.base.get_super_arglist()
         if arglist:
-            args = param.Arguments(self._evaluator, arglist)
-            return list(chain.from_iterable(args.eval_args()))
+            bases = _cached_bases(self._evaluator, self.base)
+            if bases is None:
+                detector = self._evaluator.execution_recursion_detector
+                stopped_executions = detector.stopped_executions
+                args = param.Arguments(self._evaluator, arglist)
+                bases = list(chain.from_iterable(args.eval_args()))
+                _cache_bases(self._evaluator, self.base, bases, stopped_executions)
+            return bases
         else:
             return [compiled.object_obj]
 
@@ -496,6 +485,87 @@ class Class(use_metaclass(CachedMetaClass, Wrapper)):
         return "<e%s of %s>" % (type(self).__name__, self.base)
 
 
+def _attached_module(node):
+    """
+    Returns the module of a parser node or None, if the node is not part of a
+    module (anymore), e.g. because it has been replaced by the fast parser or
+    it's a copy of a function execution.
+    """
+    while not isinstance(node, tree.Module):
+        parent = node.parent
+        if parent is None or node not in parent.children:
+            return None
+        node = parent
+    return node
+
+
+def _cached_bases(evaluator, cls):
+    """
+    Returns the bases of a ``tree.Class`` from :data:`jedi.cache.hierarchy_cache`
+    or None, if they are not cached or if one of the modules has changed.
+    """
+    module = _attached_module(cls)
+    if module is None:
+        return None
+    try:
+        modules, bases = cache.hierarchy_cache[module.path, cls.start_pos]
+    except KeyError:
+        return None
+
+    for module, module_hash in modules:
+        item = cache.cached_parser_item(module.path)
+        if item is None:
+            return None
+        if item.parser.module is not module \
+                or helpers.module_hash(evaluator, module) != module_hash:
+            return None
+        if module.path is not None and item.change_time is not None:
+            # The file might have changed without being parsed again yet.
+            try:
+                if os.path.getmtime(module.path) > item.change_time:
+                    return None
+            except OSError:
+                return None
+    for base in bases:
+        if isinstance(base, tree.Class) and _attached_module(base) is None:
+            return None
+    debug.dbg('Cached bases of %s: %s', cls, bases)
+    return [evaluator.wrap(base) for base in bases]
+
+
+def _cache_bases(evaluator, cls, bases, stopped_executions):
+    """
+    Stores the bases of a ``tree.Class`` for other evaluators. Only classes and
+    compiled objects are stored, the results of calls could depend on
+    anything. The bases are valid as long as none of the modules, that could
+    have been followed to find them, changes.
+    """
+    module = _attached_module(cls)
+    detector = evaluator.execution_recursion_detector
+    if module is None or not bases or evaluator.is_cancelled() \
+            or detector.stopped_executions != stopped_executions:
+        # Don't store bases that might be incomplete.
+        return
+    modules = [module]
+    nodes = []
+    for base in bases:
+        if isinstance(base, Class) and isinstance(base.base, tree.Class):
+            base_module = _attached_module(base.base)
+            if base_module is None:
+                return
+            if base_module not in modules:
+                modules.append(base_module)
+            nodes.append(base.base)
+        elif isinstance(base, compiled.CompiledObject):
+            nodes.append(base)
+        else:
+            return
+
+    modules = helpers.imported_modules(evaluator, modules)
+    hashes = [(m, helpers.module_hash(evaluator, m)) for m in modules]
+    cache.hierarchy_cache[module.path, cls.start_pos] = hashes, nodes
+
+
 class Function(use_metaclass(CachedMetaClass, Wrapper)):
     """
     Needed because of decorators. Decorators are evaluated here.
@@ -572,9 +642,40 @@ class Function(use_metaclass(CachedMetaClass, Wrapper)):
     def py__call__(self, evaluator, params):
         if self.base.is_generator():
             return [iterable.Generator(evaluator, self, params)]
+        elif isinstance(self, Function) and not isinstance(self, LambdaWrapper) \
+                and not self.listeners and not self._uses_params():
+            # The arguments don't matter, all the calls share one execution.
+            return self._get_independent_return_types()
         else:
             return FunctionExecution(evaluator, self, params).get_return_types()
 
+    @memoize_default()
+    def _uses_params(self):
+        """
+        A summary of the function: Returns True if the return types might
+        depend on the params, i.e. if the body of the function refers to one
+        of them.
+        """
+        names = set(unicode(p.name) for p in self.base_func.params)
+        # These access the params without naming them.
+        names |= set(['locals', 'vars', 'super'])
+
+        def check(node):
+            try:
+                children = node.children
+            except AttributeError:
+                return isinstance(node, tree.Name) and node.value in names
+            return any(check(child) for child in children)
+
+        # Everything after the parameters, the fast parser might add nested
+        # scopes after the suite.
+        return any(check(child) for child in self.base_func.children[3:])
+
+    @memoize_default(default=())
+    def _get_independent_return_types(self):
+        arguments = param.Arguments(self._evaluator, ())
+        return FunctionExecution(self._evaluator, self, arguments).get_return_types()
+
     def __getattr__(self, name):
         return getattr(self.base_func, name)
 
@@ -603,10 +704,11 @@ class FunctionExecution(Executed):
 
     def __init__(self, evaluator, base, *args, **kwargs):
         super(FunctionExecution, self).__init__(evaluator, base, *args, **kwargs)
-        self._copy_dict = {}
-        new_func = helpers.deep_ast_copy(base.base_func, self, self._copy_dict)
-        self.children = new_func.children
-        self.names_dict = new_func.names_dict
+        # The nodes of the execution are only created when they're needed.
+        func = base.base_func
+        self._overlay = helpers.TreeOverlay(func, self)
+        self.children = self._overlay.children(func)
+        self.names_dict = self._overlay.names_dict(func.names_dict)
 
     @memoize_default(default=())
     @recursion.execution_recursion_decorator
@@ -662,33 +764,15 @@ class FunctionExecution(Executed):
     def name_for_position(self, position):
         return tree.Function.name_for_position(self, position)
 
-    def _copy_list(self, lst):
-        """
-        Copies a list attribute of a parser Function. Copying is very
-        expensive, because it is something like `copy.deepcopy`. However, these
-        copied objects can be used for the executions, as if they were in the
-        execution.
-        """
-        objects = []
-        for element in lst:
-            self._scope_copy(element.parent)
-            copied = helpers.deep_ast_copy(element, self._copy_dict)
-            objects.append(copied)
-        return objects
+    def copied_name(self, name):
+        """Returns the copy of a name of the executed function."""
+        return self._overlay[name]
 
     def __getattr__(self, name):
         if name not in ['start_pos', 'end_pos', 'imports', 'name', 'type']:
             raise AttributeError('Tried to access %s: %s. Why?' % (name, self))
         return getattr(self.base, name)
 
-    def _scope_copy(self, scope):
-        raise NotImplementedError
-        """ Copies a scope (e.g. `if foo:`) in an execution """
-        if scope != self.base.base_func:
-            # Just make sure the parents been copied.
-            self._scope_copy(scope.parent)
-            helpers.deep_ast_copy(scope, self._copy_dict)
-
     @common.safe_property
     @memoize_default([])
     def returns(self):
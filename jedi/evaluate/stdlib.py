@@ -16,10 +16,16 @@ from jedi.evaluate import iterable
 from jedi.parser import Parser
 from jedi.parser import tree
 from jedi import debug
+from jedi import cache
 from jedi.evaluate import precedence
 from jedi.evaluate import param
 
 
+# The classes of namedtuples, shared by all evaluators, see
+# `collections_namedtuple`.
+_namedtuple_classes = cache.LRUCache(1000)
+
+
 class NotInStdLib(LookupError):
     pass
 
@@ -191,7 +197,8 @@ def collections_namedtuple(evaluator, obj, params):
     Implementation of the namedtuple function.
 
     This has to be done by processing the namedtuple class template and
-    evaluating the result.
+    evaluating the result. The generated classes are cached by their name and
+    fields.
 
     .. note:: |jedi| only supports namedtuples on Python >2.6.
 
@@ -213,19 +220,24 @@ def collections_namedtuple(evaluator, obj, params):
     else:
         return []
 
-    # Build source
-    source = collections._class_template.format(
-        typename=name,
-        field_names=fields,
-        num_fields=len(fields),
-        arg_list=', '.join(fields),
-        repr_fmt=', '.join(collections._repr_template.format(name=name) for name in fields),
-        field_defs='\n'.join(collections._field_template.format(index=index, name=name)
-                             for index, name in enumerate(fields))
-    )
-
-    # Parse source
-    generated_class = Parser(evaluator.grammar, unicode(source)).module.subscopes[0]
+    key = evaluator.grammar, name, tuple(fields)
+    try:
+        generated_class = _namedtuple_classes[key]
+    except KeyError:
+        # Build source
+        source = collections._class_template.format(
+            typename=name,
+            field_names=fields,
+            num_fields=len(fields),
+            arg_list=', '.join(fields),
+            repr_fmt=', '.join(collections._repr_template.format(name=name) for name in fields),
+            field_defs='\n'.join(collections._field_template.format(index=index, name=name)
+                                 for index, name in enumerate(fields))
+        )
+
+        # Parse source
+        generated_class = Parser(evaluator.grammar, unicode(source)).module.subscopes[0]
+        _namedtuple_classes[key] = generated_class
     return [er.Class(evaluator, generated_class)]
 
 
@@ -1,6 +1,9 @@
+import contextlib
 import glob
 import os
 import sys
+import threading
+import types
 
 from jedi._compatibility import exec_function, unicode
 from jedi.parser import tree
@@ -10,6 +13,23 @@ from jedi import debug
 from jedi import common
 from jedi import cache
 
+# Held while ``sys.path`` is used or replaced, see `replaced_sys_path`.
+_sys_path_lock = threading.RLock()
+
+
+@contextlib.contextmanager
+def replaced_sys_path(paths):
+    """
+    Replaces ``sys.path`` with ``paths`` within a with statement. Other
+    threads using |jedi| wait until the original ``sys.path`` is restored.
+    """
+    with _sys_path_lock:
+        temp, sys.path = sys.path, paths
+        try:
+            yield
+        finally:
+            sys.path = temp
+
 
 def get_sys_path():
     def check_virtual_env(sys_path):
@@ -27,8 +47,9 @@ def get_sys_path():
             with open(egg_link) as fd:
                 sys_path.insert(0, fd.readline().rstrip())
 
-    check_virtual_env(sys.path)
-    return [p for p in sys.path if p != ""]
+    with _sys_path_lock:
+        check_virtual_env(sys.path)
+        return [p for p in sys.path if p != ""]
 
 
 def _get_venv_sitepackages(venv):
@@ -40,9 +61,32 @@ def _get_venv_sitepackages(venv):
     return p
 
 
+def _module_relative_os(module_dir):
+    """
+    Returns a copy of the ``os`` module, that resolves relative paths against
+    ``module_dir`` instead of the current working directory of the process.
+    """
+    def abspath(path):
+        return os.path.normpath(os.path.join(module_dir, path))
+
+    path_module = types.ModuleType(os.path.__name__)
+    path_module.__dict__.update(os.path.__dict__)
+    path_module.abspath = abspath
+    os_module = types.ModuleType(os.__name__)
+    os_module.__dict__.update(os.__dict__)
+    os_module.path = path_module
+    os_module.getcwd = lambda: module_dir
+    return os_module
+
+
 def _execute_code(module_path, code):
-    c = "import os; from os.path import *; result=%s"
-    variables = {'__file__': module_path}
+    c = "result=%s"
+    os_module = _module_relative_os(os.path.dirname(module_path))
+    # Equivalent to ``import os; from os.path import *``.
+    variables = dict((name, value) for name, value
+                     in os_module.path.__dict__.items()
+                     if not name.startswith('_'))
+    variables.update(__file__=module_path, os=os_module)
     try:
         exec_function(c % code, variables)
     except Exception:
@@ -51,7 +95,7 @@ def _execute_code(module_path, code):
         try:
             res = variables['result']
             if isinstance(res, str):
-                return [os.path.abspath(res)]
+                return [os_module.path.abspath(res)]
         except KeyError:
             pass
     return []
@@ -150,20 +194,57 @@ def sys_path_with_modifications(evaluator, module):
         # normal path.
         return list(get_sys_path())
 
-    curdir = os.path.abspath(os.curdir)
-    with common.ignored(OSError):
-        os.chdir(os.path.dirname(module.path))
+    result = _check_module(evaluator, module)
+    return result + _get_project_paths(evaluator, module.path)
 
-    buildout_script_paths = set()
 
-    result = _check_module(evaluator, module)
-    result += _detect_django_path(module.path)
-    for buildout_script in _get_buildout_scripts(module.path):
+def _get_project_paths(evaluator, module_path):
+    """
+    Returns the Django and buildout paths for the directory of a module.
+    Detecting them means walking all parent directories and parsing buildout
+    scripts, therefore the result is cached in :data:`cache.SysPathCache`.
+    """
+    directory = os.path.dirname(module_path)
+    paths = cache.SysPathCache.get(directory)
+    if paths is None:
+        fingerprint, paths = _find_project_paths(evaluator, module_path)
+        cache.SysPathCache.set(directory, fingerprint, paths)
+
+    # The normal sys.path is part of the result of `_check_module` anyway.
+    # The cache is shared by processes with different interpreters and
+    # virtualenvs, therefore the paths are filtered after reading them.
+    default_sys_path = set(get_sys_path())
+    return [p for p in paths if p not in default_sys_path]
+
+
+def _find_project_paths(evaluator, module_path):
+    """
+    Returns the fingerprint and the paths of a project. The result only
+    depends on which ``manage.py``, ``buildout.cfg`` and ``bin`` files exist
+    and on the content of the buildout scripts. Other changes of the
+    directories (e.g. files that editors save atomically) don't matter.
+    """
+    # Take the fingerprint before looking at the files, so that changes in
+    # between invalidate the entry.
+    fingerprint = {}
+    for parent in traverse_parents(module_path):
+        for filename in ('manage.py', 'buildout.cfg'):
+            path = os.path.join(parent, filename)
+            fingerprint[path] = os.path.exists(path)
+    buildout_root = _get_parent_dir_with_file(module_path, 'buildout.cfg')
+    if buildout_root is not None:
+        bin_path = os.path.join(buildout_root, 'bin')
+        fingerprint[bin_path] = os.path.exists(bin_path)
+
+    paths = _detect_django_path(module_path)
+    for buildout_script in _get_buildout_scripts(module_path):
+        with common.ignored(OSError, IOError):
+            fingerprint[buildout_script] = \
+                cache.file_fingerprint(buildout_script, hash_content=True)
         for path in _get_paths_from_buildout_script(evaluator, buildout_script):
-            buildout_script_paths.add(path)
-    # cleanup, back to old directory
-    os.chdir(curdir)
-    return list(result) + list(buildout_script_paths)
+            if path not in paths:
+                paths.append(path)
+    return fingerprint, paths
 
 
 def _get_paths_from_buildout_script(evaluator, buildout_script):
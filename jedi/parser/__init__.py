@@ -163,10 +163,39 @@ class Parser(object):
         if added_newline:
             self.remove_last_newline()
         self.module.used_names = self._used_names
+        self.module.array_mutations = self._index_array_mutations()
         self.module.path = module_path
         self.module.global_names = self._global_names
         self.module.error_statement_stacks = self._error_statement_stacks
 
+    def _index_array_mutations(self):
+        """
+        Indexes the calls that might add something to lists and sets, e.g.
+        ``foo.append(1)``, by the name they are called on (``foo``). Calls on
+        other expressions are indexed under None. Used by
+        :func:`jedi.evaluate.iterable.check_array_additions`.
+        """
+        mutations = {}
+        for add_name in ('append', 'extend', 'insert', 'add', 'update'):
+            for name in self._used_names.get(add_name, []):
+                trailer = name.parent
+                if trailer.type != 'trailer' or trailer.children[0] != '.':
+                    continue
+                power = trailer.parent
+                index = power.children.index(trailer)
+                try:
+                    execution_trailer = power.children[index + 1]
+                except IndexError:
+                    continue
+                if execution_trailer.type != 'trailer' \
+                        or execution_trailer.children[0] != '(' \
+                        or execution_trailer.children[1] == ')':
+                    continue
+                base = power.children[index - 1]
+                key = base.value if index == 1 and base.type == 'name' else None
+                mutations.setdefault(key, []).append(name)
+        return mutations
+
     def convert_node(self, grammar, type, children):
         """
         Convert raw node information to a Node instance.
@@ -198,6 +227,8 @@ class Parser(object):
                 arr = self._scope_names_stack[-1].setdefault(n.value, [])
                 arr.append(n)
             new_node.names_dict = scope_names
+            if isinstance(new_node, pt.Function):
+                new_node.self_names_dict = new_node.search_self_names()
         elif isinstance(new_node, pt.CompFor):
             # The name definitions of comprehenions shouldn't be part of the
             # current scope. They are part of the comprehension scope.
@@ -4,6 +4,7 @@ anything changes, it only reparses the changed parts. But because it's not
 finished (and still not working as I want), I won't document it any further.
 """
 import re
+import threading
 from itertools import chain
 
 from jedi._compatibility import use_metaclass
@@ -27,6 +28,7 @@ class FastModule(tree.Module):
         self.reset_caches()
         self.names_dict = {}
         self.path = module_path
+        self.source_hash = None
 
     def reset_caches(self):
         self.modules = []
@@ -34,12 +36,21 @@ class FastModule(tree.Module):
             del self._used_names  # Remove the used names cache.
         except AttributeError:
             pass  # It was never used.
+        try:
+            del self._array_mutations
+        except AttributeError:
+            pass
 
     @property
     @cache.underscore_memoization
     def used_names(self):
         return MergedNamesDict([m.used_names for m in self.modules])
 
+    @property
+    @cache.underscore_memoization
+    def array_mutations(self):
+        return MergedNamesDict([m.array_mutations for m in self.modules])
+
     @property
     def global_names(self):
         return [name for m in self.modules for name in m.global_names]
@@ -66,6 +77,10 @@ class FastModule(tree.Module):
     def used_names(self, value):
         pass
 
+    @array_mutations.setter
+    def array_mutations(self, value):
+        pass
+
 
 class MergedNamesDict(object):
     def __init__(self, dicts):
@@ -77,6 +92,10 @@ class MergedNamesDict(object):
     def __getitem__(self, value):
         return list(chain.from_iterable(dct.get(value, []) for dct in self.dicts))
 
+    def get(self, value, default=None):
+        # The dicts of nested parser nodes can be merged dicts themselves.
+        return self[value] or default
+
     def __setitem__(self, key, value):
         for d in self.dicts:
             if key in d:
@@ -103,18 +122,32 @@ class MergedNamesDict(object):
 
 
 class CachedFastParser(type):
-    """ This is a metaclass for caching `FastParser`. """
+    """
+    This is a metaclass for caching `FastParser`. Only the thread that created
+    a parser updates it, because other threads might still use its module.
+    Parsers that other threads got from the cache (e.g. through an import) are
+    shared and not updated in place by anyone anymore, their ``thread_ident``
+    is None.
+
+    This has a cost: The source of a module that is parsed by a different
+    thread (or again after it was shared) is parsed completely, none of the
+    parser nodes are reused. Editors should therefore send the requests of a
+    buffer from the same thread. Thread pools that use a different thread for
+    every request get the speed of the normal `Parser`.
+    """
     def __call__(self, grammar, source, module_path=None):
         if not settings.fast_parser:
             return Parser(grammar, source, module_path)
 
-        pi = cache.parser_cache.get(module_path, None)
-        if pi is None or isinstance(pi.parser, Parser):
-            p = super(CachedFastParser, self).__call__(grammar, source, module_path)
-        else:
-            p = pi.parser  # pi is a `cache.ParserCacheItem`
-            p.update(source)
-        return p
+        with cache.parser_lock:
+            pi = cache.parser_cache.get(module_path, None)
+            if pi is None or isinstance(pi.parser, Parser) \
+                    or pi.parser.thread_ident != threading.current_thread().ident:
+                p = super(CachedFastParser, self).__call__(grammar, source, module_path)
+            else:
+                p = pi.parser  # pi is a `cache.ParserCacheItem`
+                p.update(source)
+            return p
 
 
 class ParserNode(object):
@@ -175,6 +208,8 @@ class ParserNode(object):
             scope.names_dict = scope.names_dict.dicts[0]
         except AttributeError:
             pass
+        else:
+            self._update_self_names()
 
     def close(self):
         """
@@ -187,6 +222,13 @@ class ParserNode(object):
             # Need to insert the own node as well.
             dcts.insert(0, self._content_scope.names_dict)
             self._content_scope.names_dict = MergedNamesDict(dcts)
+            self._update_self_names()
+
+    def _update_self_names(self):
+        # The ``self.foo`` names of a function might be in other nodes.
+        scope = self._content_scope
+        if isinstance(scope, tree.Function):
+            scope.self_names_dict = scope.search_self_names()
 
     def parent_until_indent(self, indent=None):
         if (indent is None or self._indent >= indent) and self.parent is not None:
@@ -246,9 +288,20 @@ class FastParser(use_metaclass(CachedFastParser)):
         # set values like `tree.Module`.
         self._grammar = grammar
         self.module_path = module_path
+        self.thread_ident = threading.current_thread().ident
         self._reset_caches()
         self.update(source)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['thread_ident']
+        return state
+
+    def __setstate__(self, state):
+        # Parsers loaded from the disk belong to the thread that loads them.
+        self.__dict__.update(state)
+        self.thread_ident = threading.current_thread().ident
+
     def _reset_caches(self):
         self.module = FastModule(self.module_path)
         self.current_node = ParserNode(self.module, self, '')
@@ -266,6 +319,8 @@ class FastParser(use_metaclass(CachedFastParser)):
             # FastParser is cached, be careful with exceptions.
             self._reset_caches()
             raise
+        # The module is updated in place, the hash identifies its content.
+        self.module.source_hash = cache.md5(source.encode('utf-8'))
 
     def _split_parts(self, source):
         """
@@ -591,8 +591,8 @@ class Module(Scope):
     Depending on the underlying parser this may be a full module or just a part
     of a module.
     """
-    __slots__ = ('path', 'global_names', 'used_names', '_name',
-                 'error_statement_stacks')
+    __slots__ = ('path', 'global_names', 'used_names', 'array_mutations',
+                 '_name', 'error_statement_stacks')
     type = 'file_input'
 
     def __init__(self, children):
@@ -753,7 +753,7 @@ class Function(ClassOrFunc):
     """
     Used to store the parsed contents of a python function.
     """
-    __slots__ = ('listeners',)
+    __slots__ = ('listeners', 'self_names_dict')
     type = 'funcdef'
 
     def __init__(self, children):
@@ -778,6 +778,29 @@ class Function(ClassOrFunc):
     def is_generator(self):
         return bool(self.yields)
 
+    def search_self_names(self):
+        """
+        Searches the attribute assignments on the first param (``self.foo =
+        1``) and returns them in a dict like ``names_dict``. The parser stores
+        the result as ``self_names_dict``, so that instances don't need to
+        search the whole function.
+        """
+        dct = {}
+        try:
+            self_name = self.params[0].name.value
+            names = self.names_dict[self_name]
+        except (IndexError, KeyError):
+            return dct
+        for name in names:
+            if name.prev_sibling() is None:
+                trailer = name.next_sibling()
+                if is_node(trailer, 'trailer') and len(trailer.children) == 2 \
+                        and trailer.children[0] == '.':
+                    name = trailer.children[1]  # After dot.
+                    if name.is_definition():
+                        dct.setdefault(name.value, []).append(name)
+        return dct
+
     def annotation(self):
         try:
             return self.children[6]  # 6th element: def foo(...) -> bar
@@ -280,9 +280,10 @@ class UserContextParser(object):
     def _parser(self):
         cache.invalidate_star_import_cache(self._path)
         if self._use_fast_parser:
-            parser = FastParser(self._grammar, self._source, self._path)
-            # Don't pickle that module, because the main module is changing quickly
-            cache.save_parser(self._path, parser, pickling=False)
+            with cache.parser_lock:
+                parser = FastParser(self._grammar, self._source, self._path)
+                # Don't pickle that module, because the main module is changing quickly
+                cache.save_parser(self._path, parser, pickling=False)
         else:
             parser = Parser(self._grammar, self._source, self._path)
         self._parser_done_callback(parser)
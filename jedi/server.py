@@ -0,0 +1,470 @@
+"""
+A language server for |jedi|. ``python -m jedi serve`` speaks JSON-RPC (a
+subset of the `Language Server Protocol
+<https://microsoft.github.io/language-server-protocol/>`_) over stdin/stdout,
+``python -m jedi serve --socket PATH`` listens on a Unix socket instead.
+
+Since the server is a long running process, the caches of |jedi| that are shared
+by all evaluators (parsers, indexes, introspected compiled modules) stay warm
+between requests. Every request still creates its own :class:`jedi.Script`,
+the evaluator caches are not kept. The documents of the client are kept in
+memory and updated by the deltas of ``textDocument/didChange``.
+
+Supported requests:
+
+- ``initialize``, ``shutdown``
+- ``textDocument/completion``, ``textDocument/definition``,
+  ``textDocument/hover``, ``textDocument/references``,
+  ``textDocument/signatureHelp``
+
+Supported notifications: ``initialized``, ``exit``, ``$/cancelRequest``,
+``textDocument/didOpen``, ``textDocument/didChange``,
+``textDocument/didClose`` and ``textDocument/didSave``.
+
+The requests are evaluated one after the other. Messages are read in a
+separate thread though, so that ``$/cancelRequest`` can stop a running request
+(see :class:`jedi.CancellationToken`), which then returns the results found so
+far. Requests that are cancelled before they run are answered with a
+``RequestCancelled`` error. The timeout of a request starts when it runs, not
+while it's waiting for other requests.
+
+If the client passes ``{"timing": true}`` as ``initializationOptions``, every
+response is followed by a ``$/timing`` notification with the ``id``, the
+``method`` and the ``time`` it took in seconds.
+
+Positions are zero based as in the protocol, but the characters of a line are
+counted as code points, not as UTF-16 code units.
+"""
+import json
+import numbers
+import os
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from jedi._compatibility import queue, quote, unquote, unicode
+from jedi import common
+from jedi import debug
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+REQUEST_CANCELLED = -32800
+
+# https://microsoft.github.io/language-server-protocol/ -> CompletionItemKind
+_completion_kinds = {
+    'module': 9,
+    'class': 7,
+    'instance': 6,
+    'function': 3,
+    'param': 6,
+    'import': 9,
+    'keyword': 14,
+    'statement': 6,
+}
+
+
+def read_message(stream):
+    """
+    Reads a message with a ``Content-Length`` header from a binary stream.
+    Returns None at the end of the stream.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is not None:
+                break
+            continue
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            length = int(value)
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body.decode('utf-8'))
+
+
+def write_message(stream, message):
+    body = json.dumps(message).encode('utf-8')
+    header = 'Content-Length: %s\r\n\r\n' % len(body)
+    stream.write(header.encode('ascii') + body)
+    stream.flush()
+
+
+def uri_to_path(uri):
+    if uri.startswith('file://'):
+        return unquote(uri[len('file://'):])
+    return uri
+
+
+def path_to_uri(path):
+    return 'file://' + quote(path.replace(os.sep, '/'))
+
+
+class Document(object):
+    def __init__(self, uri, text, version=None):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.text = text
+        self.version = version
+
+    def apply_change(self, change):
+        """Applies a ``TextDocumentContentChangeEvent``."""
+        if 'range' not in change:
+            self.text = change['text']
+            return
+        start = self._offset(change['range']['start'])
+        end = self._offset(change['range']['end'])
+        self.text = self.text[:start] + change['text'] + self.text[end:]
+
+    def _offset(self, position):
+        lines = self.text.split('\n')
+        line = min(position['line'], len(lines) - 1)
+        offset = sum(len(l) + 1 for l in lines[:line])
+        return offset + min(position['character'], len(lines[line]))
+
+
+class ResponseError(Exception):
+    def __init__(self, code, message):
+        super(ResponseError, self).__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _is_valid_id(id):
+    """JSON-RPC ids are strings, numbers or null."""
+    return id is None or isinstance(id, (numbers.Real, str, unicode)) \
+        and not isinstance(id, bool)
+
+
+class Server(object):
+    """
+    Answers the messages of a single client, that are read from the binary
+    stream ``reader``. The responses are written to ``writer``.
+
+    :param timeout: Requests are cancelled after that many seconds.
+    """
+    def __init__(self, reader, writer, timeout=None):
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._documents = {}
+        self._messages = queue.Queue()
+        self._tokens = {}
+        self._lock = threading.Lock()
+        self._report_timing = False
+        self._exit = False
+
+    def serve(self):
+        """
+        Handles messages until the stream ends or the client sends ``exit``.
+        Returns True in the latter case.
+        """
+        thread = threading.Thread(target=self._read_messages)
+        thread.daemon = True
+        thread.start()
+        while not self._exit:
+            message = self._messages.get()
+            if message is None:
+                break
+            self.handle(message)
+        return self._exit
+
+    def _read_messages(self):
+        while True:
+            try:
+                message = read_message(self._reader)
+            except ValueError:
+                self._send({'jsonrpc': '2.0', 'id': None, 'error': {
+                    'code': PARSE_ERROR, 'message': 'Invalid JSON.'}})
+                continue
+            except (IOError, OSError):
+                message = None
+            if message is None:
+                self._messages.put(None)
+                return
+            try:
+                self.receive(message)
+            except Exception:
+                # A bad message must not stop the reader.
+                debug.warning('Message %s failed: %s', message,
+                              traceback.format_exc())
+                self._send_error(None, INTERNAL_ERROR, traceback.format_exc())
+
+    def receive(self, message):
+        """
+        Called for each message as soon as it's read, even if a request is
+        running. Cancels requests or queues the message for :meth:`handle`.
+        """
+        if not isinstance(message, dict):
+            message = {}
+        if message.get('method') == '$/cancelRequest':
+            params = message.get('params')
+            id = params.get('id') if isinstance(params, dict) else None
+            if _is_valid_id(id):
+                with self._lock:
+                    token = self._tokens.get(id)
+                if token is not None:
+                    token.cancel()
+            return
+        if 'id' in message and not _is_valid_id(message['id']):
+            self._send_error(None, INVALID_REQUEST,
+                             'The id must be a string, a number or null.')
+            return
+        if 'id' in message and 'method' in message:
+            with self._lock:
+                duplicate = message['id'] in self._tokens
+                if not duplicate:
+                    # The timeout only starts when the request is handled.
+                    self._tokens[message['id']] = common.CancellationToken()
+            if duplicate:
+                self._send_error(message['id'], INVALID_REQUEST,
+                                 'Duplicate request id.')
+                return
+        self._messages.put(message)
+
+    def handle(self, message):
+        """Evaluates a request or notification and writes the response."""
+        method = message.get('method')
+        params = message.get('params') or {}
+        if 'id' not in message:
+            if method is None:
+                self._send_error(None, INVALID_REQUEST, 'Invalid request.')
+                return
+            try:
+                self._call(method, params, None)
+            except Exception:
+                debug.warning('Notification %s failed: %s', method,
+                              traceback.format_exc())
+            return
+
+        id = message['id']
+        with self._lock:
+            token = self._tokens.get(id)
+        if method is None or token is None:
+            self._send_error(id, INVALID_REQUEST, 'Invalid request.')
+            return
+
+        start = time.time()
+        try:
+            if token.is_cancelled:
+                raise ResponseError(REQUEST_CANCELLED, 'Request cancelled.')
+            if self._timeout is not None:
+                waiting_token = token
+                token = common.CancellationToken(self._timeout)
+                with self._lock:
+                    self._tokens[id] = token
+                # It might have been cancelled in the meantime.
+                if waiting_token.is_cancelled:
+                    token.cancel()
+            result = self._call(method, params, token)
+        except ResponseError as e:
+            self._send_error(id, e.code, e.message)
+        except Exception:
+            self._send_error(id, INTERNAL_ERROR, traceback.format_exc())
+        else:
+            self._send({'jsonrpc': '2.0', 'id': id, 'result': result})
+        finally:
+            with self._lock:
+                del self._tokens[id]
+
+        if self._report_timing:
+            self._send({'jsonrpc': '2.0', 'method': '$/timing', 'params': {
+                'id': id, 'method': method, 'time': time.time() - start}})
+
+    def _call(self, method, params, token):
+        try:
+            func = self._methods[method]
+        except KeyError:
+            if method.startswith('$/'):
+                # These are optional for servers.
+                return None
+            raise ResponseError(METHOD_NOT_FOUND, 'Unknown method %s.' % method)
+        return func(self, params, token)
+
+    def _send(self, message):
+        with self._lock:
+            write_message(self._writer, message)
+
+    def _send_error(self, id, code, message):
+        self._send({'jsonrpc': '2.0', 'id': id,
+                    'error': {'code': code, 'message': message}})
+
+    def _script(self, params, token):
+        from jedi import api
+
+        try:
+            document = self._documents[params['textDocument']['uri']]
+            line = params['position']['line'] + 1
+            column = params['position']['character']
+        except (KeyError, TypeError):
+            raise ResponseError(INVALID_PARAMS, 'Unknown document or position.')
+        try:
+            return api.Script(document.text, line, column, document.path,
+                              cancellation_token=token)
+        except ValueError as e:
+            raise ResponseError(INVALID_PARAMS, str(e))
+
+    def _location(self, definition):
+        if definition.module_path is None or definition.line is None:
+            return None
+        start = {'line': definition.line - 1, 'character': definition.column}
+        end = dict(start, character=definition.column + len(definition.name))
+        return {'uri': path_to_uri(definition.module_path),
+                'range': {'start': start, 'end': end}}
+
+    def initialize(self, params, token):
+        options = params.get('initializationOptions') or {}
+        self._report_timing = bool(options.get('timing'))
+        return {'capabilities': {
+            'textDocumentSync': 2,  # Incremental
+            'completionProvider': {'triggerCharacters': ['.']},
+            'definitionProvider': True,
+            'hoverProvider': True,
+            'referencesProvider': True,
+            'signatureHelpProvider': {'triggerCharacters': ['(', ',']},
+        }}
+
+    def shutdown(self, params, token):
+        return None
+
+    def exit(self, params, token):
+        self._exit = True
+
+    def did_open(self, params, token):
+        item = params['textDocument']
+        self._documents[item['uri']] = \
+            Document(item['uri'], item['text'], item.get('version'))
+
+    def did_change(self, params, token):
+        document = self._documents[params['textDocument']['uri']]
+        for change in params['contentChanges']:
+            document.apply_change(change)
+        document.version = params['textDocument'].get('version')
+
+    def did_close(self, params, token):
+        self._documents.pop(params['textDocument']['uri'], None)
+
+    def ignore(self, params, token):
+        pass
+
+    def completion(self, params, token):
+        script = self._script(params, token)
+        items = [{
+            'label': c.name,
+            'kind': _completion_kinds.get(c.type, 1),
+            'detail': c.description,
+            'insertText': c.name,
+        } for c in script.completions()]
+        return {'isIncomplete': script.results_are_partial, 'items': items}
+
+    def definition(self, params, token):
+        definitions = self._script(params, token).goto_definitions()
+        locations = (self._location(d) for d in definitions)
+        return [l for l in locations if l is not None]
+
+    def hover(self, params, token):
+        for definition in self._script(params, token).goto_definitions():
+            doc = definition.docstring()
+            if doc:
+                return {'contents': unicode(doc)}
+        return None
+
+    def references(self, params, token):
+        usages = self._script(params, token).usages()
+        locations = (self._location(d) for d in usages)
+        return [l for l in locations if l is not None]
+
+    def signature_help(self, params, token):
+        signatures = self._script(params, token).call_signatures()
+        if not signatures:
+            return None
+        return {
+            'signatures': [{
+                'label': '%s(%s)' % (s.name, ', '.join(p.description for p in s.params)),
+                'parameters': [{'label': p.description} for p in s.params],
+            } for s in signatures],
+            'activeSignature': 0,
+            'activeParameter': signatures[0].index,
+        }
+
+    _methods = {
+        'initialize': initialize,
+        'initialized': ignore,
+        'shutdown': shutdown,
+        'exit': exit,
+        'textDocument/didOpen': did_open,
+        'textDocument/didChange': did_change,
+        'textDocument/didClose': did_close,
+        'textDocument/didSave': ignore,
+        'textDocument/completion': completion,
+        'textDocument/definition': definition,
+        'textDocument/hover': hover,
+        'textDocument/references': references,
+        'textDocument/signatureHelp': signature_help,
+    }
+
+
+def serve_stdio(timeout=None):
+    # Modules might print stuff, which would break the protocol. Therefore
+    # use copies of the file descriptors and redirect stdout to stderr.
+    reader = os.fdopen(os.dup(0), 'rb')
+    writer = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    Server(reader, writer, timeout).serve()
+
+
+def serve_unix_socket(path, timeout=None):
+    """Serves one client after the other, until a client sends ``exit``."""
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server_socket.bind(path)
+        server_socket.listen(1)
+        while True:
+            connection, _ = server_socket.accept()
+            reader = connection.makefile('rb')
+            writer = connection.makefile('wb')
+            try:
+                if Server(reader, writer, timeout).serve():
+                    return
+            finally:
+                reader.close()
+                writer.close()
+                connection.close()
+    finally:
+        server_socket.close()
+        os.remove(path)
+
+
+def main(args):
+    """The entry point of ``python -m jedi serve``."""
+    options = {}
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg == '--debug':
+            from jedi import api
+            api.set_debug_function(debug.print_to_stdout)
+        elif arg in ('--socket', '--timeout') and args:
+            options[arg] = args.pop(0)
+        else:
+            sys.stderr.write('Usage: python -m jedi serve [--socket PATH] '
+                             '[--timeout SECONDS] [--debug]\n')
+            sys.exit(2)
+
+    timeout = options.get('--timeout')
+    if timeout is not None:
+        timeout = float(timeout)
+    if '--socket' in options:
+        serve_unix_socket(options['--socket'], timeout)
+    else:
+        serve_stdio(timeout)
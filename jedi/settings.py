@@ -26,6 +26,7 @@ Filesystem cache
 
 .. autodata:: cache_directory
 .. autodata:: use_filesystem_cache
+.. autodata:: cache_extension_module_snapshots
 
 
 Parser
@@ -42,6 +43,7 @@ Dynamic stuff
 .. autodata:: dynamic_params_for_other_modules
 .. autodata:: additional_dynamic_modules
 .. autodata:: auto_import_modules
+.. autodata:: introspect_compiled_modules_in_subprocess
 
 
 .. _settings-recursion:
@@ -63,6 +65,7 @@ definitely worse in some cases. But a completion should also be fast.
 .. autodata:: max_function_recursion_level
 .. autodata:: max_executions_without_builtins
 .. autodata:: max_executions
+.. autodata:: max_inferred_types
 .. autodata:: scale_call_signatures
 
 
@@ -75,7 +78,7 @@ Caching
 
 """
 import os
-import platform
+import sys
 
 # ----------------
 # completion output settings
@@ -114,10 +117,10 @@ use_filesystem_cache = True
 Use filesystem cache to save once parsed files with pickle.
 """
 
-if platform.system().lower() == 'windows':
+if sys.platform == 'win32':
     _cache_directory = os.path.join(os.getenv('APPDATA') or '~', 'Jedi',
                                     'Jedi')
-elif platform.system().lower() == 'darwin':
+elif sys.platform == 'darwin':
     _cache_directory = os.path.join('~', 'Library', 'Caches', 'Jedi')
 else:
     _cache_directory = os.path.join(os.getenv('XDG_CACHE_HOME') or '~/.cache',
@@ -132,6 +135,14 @@ On Linux, if environment variable ``$XDG_CACHE_HOME`` is set,
 ``$XDG_CACHE_HOME/jedi`` is used instead of the default one.
 """
 
+cache_extension_module_snapshots = False
+"""
+Store snapshots of compiled extension modules in the filesystem cache, so that
+other processes don't need to import them. Mirrored modules don't support
+indexing (e.g. ``module.some_list[0]``) of objects that are not literals.
+Needs :data:`use_filesystem_cache`.
+"""
+
 # ----------------
 # parser
 # ----------------
@@ -183,6 +194,23 @@ This improves autocompletion for libraries that use ``setattr`` or
 ``globals()`` modifications a lot.
 """
 
+introspect_compiled_modules_in_subprocess = False
+"""
+Compiled modules (and :data:`auto_import_modules`) are imported in a separate
+worker process instead of the current one. This keeps the memory of heavy
+modules out of long running processes and protects them from crashes. Modules
+that are already imported are still introspected directly.
+"""
+
+introspection_interpreter = None
+"""
+The Python interpreter that runs the worker process of
+:data:`introspect_compiled_modules_in_subprocess`. By default it's
+``sys.executable``, if that's a Python interpreter. Embedded interpreters (e.g.
+in Vim) need to set it. If the worker cannot be started, modules are
+introspected in the current process.
+"""
+
 # ----------------
 # recursions
 # ----------------
@@ -214,6 +242,15 @@ max_executions = 250
 A maximum amount of time, the completion may use.
 """
 
+max_inferred_types = 30
+"""
+The maximum number of types of an evaluated expression. If there are more
+(e.g. long ``a + b + c`` chains with many possible types), literals are
+replaced by their types and instances of the same class are merged. Types
+that still don't fit are merged into an instance of their common base class
+and the results of the API call are marked as partial.
+"""
+
 scale_call_signatures = 0.1
 """
 Because call_signatures is normally used on every single key hit, it has
@@ -304,3 +304,31 @@ def third():
     return list(b)
 #? 
 third()[0]
+
+# -----------------
+# arrays that are only assigned to other literals
+# -----------------
+
+other = []
+other.append(1.0)
+literal = ['']
+literal.append(1)
+
+#? str() int()
+literal[10]
+#? float()
+other[10]
+
+# -----------------
+# additions in closures
+# -----------------
+
+def closure_additions(a):
+    arr = []
+    def add():
+        arr.append(a)
+    add()
+    return arr
+
+#? float()
+closure_additions(1.0)[0]
@@ -192,6 +192,19 @@ def a():
     #? int()
     l
 
+
+def outer(a):
+    def middle(b):
+        def inner():
+            return a, b
+        return inner()
+    return middle(1)
+
+#? str()
+outer('')[0]
+#? int()
+outer('')[1]
+
 # -----------------
 # *args
 # -----------------
@@ -72,3 +72,19 @@ class Test():
             self.testing
             #? Test()
             self
+
+
+# -----------------
+# The same check for different names
+# -----------------
+
+def same_check(a, b):
+    if isinstance(a, int):
+        #? int()
+        a
+        #? str()
+        b
+        #? int()
+        a
+
+same_check(1.0, '')
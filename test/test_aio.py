@@ -0,0 +1,71 @@
+"""
+Tests of ``jedi.aio``.
+"""
+import sys
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.skipif('sys.version_info < (3, 4)')
+
+if sys.version_info >= (3, 4):
+    import asyncio
+    from jedi import aio
+
+
+@pytest.fixture()
+def loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+    return loop
+
+
+@pytest.fixture()
+def blocked_worker(request):
+    """Keeps the worker busy, so that requests are not started."""
+    event = threading.Event()
+    aio._get_executor().submit(event.wait)
+    request.addfinalizer(event.set)
+    return event
+
+
+def test_completions(loop):
+    source = 'import os\nos.pa'
+    completions = loop.run_until_complete(aio.completions(source, 2, 5, loop=loop))
+    assert 'path' in [c.name for c in completions]
+
+    definitions = loop.run_until_complete(
+        aio.goto_definitions(source + 'th', 2, 4, loop=loop))
+    assert 'posixpath' in [d.name for d in definitions]
+    assert not aio._in_flight
+
+
+def test_coalesce_requests(loop):
+    first = aio.goto_assignments('x = 1\nx', loop=loop)
+    second = aio.goto_assignments('x = 1\nx', loop=loop)
+    other_version = aio.goto_assignments('x = 1\nx', version=2, loop=loop)
+    assert len(aio._in_flight) == 2
+    results = loop.run_until_complete(asyncio.gather(first, second, other_version))
+    assert results[0] is results[1]
+    assert results[0] is not results[2]
+    assert [d.line for d in results[2]] == [1]
+
+
+def test_cancel_request(loop, blocked_worker):
+    first = aio.completions('import os\nos.', loop=loop)
+    second = aio.completions('import os\nos.', loop=loop)
+    request, = aio._in_flight.values()
+
+    # Other requests still need the result.
+    first.cancel()
+    loop.run_until_complete(asyncio.sleep(0))
+    assert not request.token.is_cancelled
+    second.cancel()
+    loop.run_until_complete(asyncio.sleep(0))
+    assert request.token.is_cancelled
+    assert not aio._in_flight
+
+    blocked_worker.set()
+    result = loop.run_until_complete(aio.call_signatures('abs(', loop=loop))
+    assert [s.name for s in result] == ['abs']
+    assert second.cancelled()
@@ -2,6 +2,7 @@
 Test all things related to the ``jedi.api`` module.
 """
 
+import os
 from textwrap import dedent
 
 from jedi import api
@@ -140,6 +141,117 @@ def test_goto_definition_not_multiple():
     assert len(api.Script(s).goto_definitions()) == 1
 
 
+def test_completion_of_interleaved_definitions():
+    def completions(source, line, column):
+        names = [c.name for c in api.Script(source, line, column).completions()]
+        return [n for n in names if n in ('aaa', 'bbb')]
+
+    assert completions('aaa = 1\nbbb = 2\n\naaa = 4\n', 3, 0) == ['aaa', 'bbb']
+    source = 'def f():\n    aaa = 1\n    bbb = 2\n    \n    aaa = 4\n'
+    assert completions(source, 4, 4) == ['aaa', 'bbb']
+
+
 def test_usage_description():
     descs = [u.description for u in api.Script("foo = ''; foo").usages()]
     assert set(descs) == set(["foo = ''", 'foo'])
+
+
+def test_cancellation_token():
+    source = dedent('''
+    def f():
+        return 1
+    x = f()
+    x''')
+    script = api.Script(source)
+    assert [d.name for d in script.goto_definitions()] == ['int']
+    assert not script.results_are_partial
+
+    token = api.CancellationToken()
+    token.cancel()
+    script = api.Script(source, cancellation_token=token)
+    assert script.goto_definitions() == []
+    assert script.results_are_partial
+    # Completions of names that don't need evaluation are still returned.
+    script = api.Script(source + '\nf', cancellation_token=token)
+    assert 'f' in [c.name for c in script.completions()]
+    # Only the definition itself is found.
+    assert [u.line for u in script.usages()] == [2]
+
+    token = api.CancellationToken(timeout=0)
+    assert token.is_cancelled
+    assert not api.CancellationToken(timeout=60).is_cancelled
+
+
+def test_cancelled_results_are_not_reused():
+    source = 'def f():\n    return 1\nx = f()\nx'
+    token = api.CancellationToken()
+    token.cancel()
+    script = api.Script(source, cancellation_token=token)
+    assert script.goto_definitions() == []
+    assert script.results_are_partial
+
+    # The next call evaluates again and isn't partial anymore.
+    script._evaluator.cancellation_token = None
+    assert [d.name for d in script.goto_definitions()] == ['int']
+    assert not script.results_are_partial
+
+
+def test_definitions_of_names():
+    source = dedent('''
+    import json
+    class A():
+        def f(self, x):
+            return [x]
+    a = A().f(1.0)
+    json.dumps(a[0])''')
+    def descriptions(definitions):
+        return [(d.description, d.line, d.column) for d in definitions]
+
+    script = api.Script(source)
+    definitions = script.definitions_of_names()
+    by_position = dict(((name.line, name.column), [d.name for d in defs])
+                       for name, defs in definitions.items())
+    assert by_position[2, 7] == ['json']
+    assert by_position[3, 6] == ['A']
+    assert by_position[4, 8] == ['f']
+    assert by_position[5, 16] == ['float']
+    assert by_position[7, 5] == ['dumps']
+    assert by_position[7, 11] == ['list']
+    # The same as calling `goto_definitions` for every name.
+    for name, defs in definitions.items():
+        single = api.Script(source, name.line, name.column).goto_definitions()
+        assert descriptions(defs) == descriptions(single)
+
+    definitions = script.definitions_of_names([(6, 4), (7, 7), (7, 11)])
+    assert sorted((name.name, [d.name for d in defs])
+                  for name, defs in definitions.items()) == \
+        [('A', ['A']), ('a', ['list']), ('dumps', ['dumps'])]
+
+
+def test_definitions_of_names_like_goto_definitions():
+    """
+    All the names of a file have the same definitions as with
+    ``goto_definitions``, except in functions that define classes.
+    """
+    def in_function_with_classes(node):
+        while node is not None:
+            if node.type == 'funcdef' and \
+                    any(s.type == 'classdef' for s in node.subscopes):
+                return True
+            node = node.parent
+        return False
+
+    def descriptions(definitions):
+        return sorted(d.description for d in definitions)
+
+    path = os.path.join(os.path.dirname(__file__), '..', 'completion', 'classes.py')
+    with open(path) as f:
+        source = f.read()
+    definitions = api.Script(source, path=path).definitions_of_names()
+    assert len(definitions) > 400
+    for name, defs in definitions.items():
+        if in_function_with_classes(name._name):
+            continue
+        column = name.column + len(name.name)
+        single = api.Script(source, name.line, column, path).goto_definitions()
+        assert (name.line, descriptions(defs)) == (name.line, descriptions(single))
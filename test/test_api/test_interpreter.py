@@ -90,3 +90,11 @@ class TestInterpreterAPI(TestCase):
         foo = Foo()
         self.check_interpreter_complete('foo.bar', locals(), ['bar'])
         self.check_interpreter_complete('foo.bar.baz', locals(), [])
+
+    def test_rebound_module_attribute(self):
+        import types
+        m = types.ModuleType('jedi_rebound_module')
+        for value, name in [(1, 'int'), ('', 'str')]:
+            m.a = value
+            defs = jedi.Interpreter('m.a', [locals()]).goto_definitions()
+            self.assertEqual([d.name for d in defs], [name])
@@ -2,17 +2,20 @@
 Test all things related to the ``jedi.cache`` module.
 """
 
+import os
 import time
 
 import pytest
 
 import jedi
 from jedi import settings, cache
-from jedi.cache import ParserCacheItem, ParserPickling
+from jedi.cache import ParserCacheItem, ParserPickling, NameIndex, CallSiteIndex
 
 
 ParserPicklingCls = type(ParserPickling)
 ParserPickling = ParserPicklingCls()
+NameIndexCls = type(NameIndex)
+CallSiteIndexCls = type(CallSiteIndex)
 
 
 def test_modulepickling_change_cache_dir(monkeypatch, tmpdir):
@@ -107,3 +110,168 @@ def test_cache_call_signatures():
 def test_cache_line_split_issues():
     """Should still work even if there's a newline."""
     assert jedi.Script('int(\n').call_signatures()[0].name == 'int'
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_name_index(tmpdir):
+    foo = tmpdir.join('foo.py')
+    foo.write('def foobar(): pass\nfoobar()\n')
+    bar = tmpdir.join('bar.py')
+    bar.write('import foo\nfoo.foobar()\n')
+    paths = [str(bar), str(foo), str(tmpdir.join('missing.py'))]
+
+    index = NameIndexCls()
+    assert index.filter_paths(paths, 'foobar') == [str(bar), str(foo)]
+    # Only whole identifiers match.
+    assert index.filter_paths(paths, 'foob') == []
+    assert index.filter_paths(paths, 'import') == [str(bar)]
+
+    # Changed files are reindexed.
+    bar.write('import foo\n')
+    bar.setmtime(bar.mtime() + 10)
+    assert index.filter_paths(paths, 'foobar') == [str(foo)]
+
+    # The index is written to the cache directory.
+    assert NameIndexCls()._files[str(foo)][1] == index._files[str(foo)][1]
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_name_index_with_contains(tmpdir):
+    from jedi.evaluate.imports import _file_contains_name
+    foo = tmpdir.join('foo.py')
+    foo.write('def foobar(): pass\n')
+    bar = tmpdir.join('bar.py')
+    bar.write('import foo\n')
+    paths = [str(bar), str(foo)]
+
+    index = NameIndexCls()
+    assert index.filter_paths(paths, 'foobar', _file_contains_name) == [str(foo)]
+    # Only the files that contain the name are indexed.
+    assert list(index._files) == [str(foo)]
+    assert index.filter_paths(paths, 'foobar', _file_contains_name) == [str(foo)]
+
+    foo.write('def other(): pass\n')
+    foo.setmtime(foo.mtime() + 10)
+    assert index.filter_paths(paths, 'foobar', _file_contains_name) == []
+    assert not index._files
+
+
+def test_lru_cache():
+    lru = cache.LRUCache(4)
+    for i in range(4):
+        lru[i] = str(i)
+    assert lru[0] == '0'
+    lru[4] = '4'
+    # The least recently used half is removed, 0 was used lately.
+    assert len(lru) == 3
+    assert lru[0] == '0' and lru[4] == '4'
+    with pytest.raises(KeyError):
+        lru[1]
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_call_site_index(tmpdir, monkeypatch):
+    monkeypatch.setattr(cache, 'CallSiteIndex', CallSiteIndexCls())
+    source = ('class A():\n    def foo(self, x):\n        pass\n'
+              'class B():\n    def foo(self, x):\n        x\n'
+              'A().foo(1)\nB().foo("")\n')
+    path = str(tmpdir.join('mod.py'))
+
+    def check():
+        defs = jedi.Script(source, 6, 9, path).goto_definitions()
+        assert [d.name for d in defs] == ['str']
+
+    check()
+    modules = cache.CallSiteIndex._modules
+    source_hash, calls, complete_names, dependencies = modules[path]
+    assert dependencies == {path: source_hash}
+    assert complete_names == set(['foo'])
+    assert sorted(c[2] for c in calls[('foo', (7, 4))]) == [(2, 4)]
+    assert sorted(c[2] for c in calls[('foo', (8, 4))]) == [(5, 4)]
+
+    # The call of A.foo is skipped now.
+    from jedi.evaluate import Evaluator
+    evaluated = []
+    goto_definition = Evaluator.goto_definition
+
+    def goto_definition_spy(evaluator, name):
+        evaluated.append(name.start_pos)
+        return goto_definition(evaluator, name)
+    monkeypatch.setattr(Evaluator, 'goto_definition', goto_definition_spy)
+    check()
+    assert (7, 4) not in evaluated and (8, 4) in evaluated
+
+    # The index is written to the cache directory.
+    assert CallSiteIndexCls()._modules[path][0] == source_hash
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_call_site_index_after_cancellation(tmpdir, monkeypatch):
+    monkeypatch.setattr(cache, 'CallSiteIndex', CallSiteIndexCls())
+    source = ('class A():\n    def foo(self, x):\n        x\n'
+              'a = A()\na.foo(1.0)\n')
+    path = str(tmpdir.join('mod.py'))
+
+    token = jedi.api.CancellationToken()
+    token.cancel()
+    script = jedi.Script(source, 3, 9, path, cancellation_token=token)
+    assert script.goto_definitions() == []
+    assert cache.CallSiteIndex._modules == {}
+
+    defs = jedi.Script(source, 3, 9, path).goto_definitions()
+    assert [d.name for d in defs] == ['float']
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_call_site_index_skips_modules(tmpdir, monkeypatch):
+    monkeypatch.setattr(cache, 'CallSiteIndex', CallSiteIndexCls())
+    main = tmpdir.join('main.py')
+    main.write('def foo(x):\n    x\n')
+    other = tmpdir.join('a_other.py')
+    other.write('def foo(x):\n    pass\nfoo(1.0)\n')
+    tmpdir.join('b_caller.py').write('from main import foo\nfoo(1)\n')
+
+    def check():
+        defs = jedi.Script(main.read(), 2, 5, str(main)).goto_definitions()
+        assert [d.name for d in defs] == ['int']
+
+    check()
+    assert cache.CallSiteIndex.get_calls(
+        str(other), cache.CallSiteIndex._modules[str(other)][0], 'foo')
+
+    # `a_other.py` is not loaded anymore, its call is known to call another
+    # function.
+    from jedi.evaluate import imports
+    loaded = []
+    load_module = imports._load_module
+
+    def load_module_spy(evaluator, path=None, *args, **kwargs):
+        loaded.append(path)
+        return load_module(evaluator, path, *args, **kwargs)
+    monkeypatch.setattr(imports, '_load_module', load_module_spy)
+    cache.parser_cache.pop(str(other))
+    check()
+    assert str(other) not in loaded
+
+
+@pytest.mark.usefixtures("isolated_jedi_cache")
+def test_call_site_index_checks_other_modules(tmpdir, monkeypatch):
+    """Calls are resolved again if a module they were resolved through
+    changes."""
+    monkeypatch.setattr(cache, 'CallSiteIndex', CallSiteIndexCls())
+    main = tmpdir.join('main.py')
+    main.write('def foo(x):\n    x\n')
+    reexport = tmpdir.join('b_reexport.py')
+    reexport.write('def foo(x):\n    pass\n')
+    tmpdir.join('c_caller.py').write('from b_reexport import foo\nfoo(1)\n')
+
+    def infer():
+        defs = jedi.Script(main.read(), 2, 5, str(main)).goto_definitions()
+        return [d.name for d in defs]
+
+    assert infer() == []
+    reexport.write('from main import foo\n')
+    # Make sure that the mtime changes.
+    mtime = os.path.getmtime(str(reexport)) + 10
+    os.utime(str(reexport), (mtime, mtime))
+    assert infer() == ['int']
@@ -1,14 +1,19 @@
 import os
 from textwrap import dedent
 
+from jedi import cache, settings
 from jedi._compatibility import u
 from jedi.evaluate.sys_path import (_get_parent_dir_with_file,
                                     _get_buildout_scripts,
                                     sys_path_with_modifications,
-                                    _check_module)
+                                    _check_module,
+                                    _get_project_paths,
+                                    _execute_code)
 from jedi.evaluate import Evaluator
+from jedi.evaluate import sys_path
 from jedi.parser import Parser, load_grammar
 
+from .. import helpers
 from ..helpers import cwd_at
 
 
@@ -87,3 +92,82 @@ def test_path_from_sys_path_assignment():
     paths = _check_module(Evaluator(grammar), p.module)
     assert 1 not in paths
     assert '/home/test/.buildout/eggs/important_package.egg' in paths
+
+
+def test_sys_path_with_modifications_does_not_chdir(monkeypatch):
+    def chdir(path):
+        raise AssertionError('os.chdir(%r) was called' % path)
+
+    monkeypatch.setattr(os, 'chdir', chdir)
+    grammar = load_grammar()
+    p = Parser(grammar, u('import os'))
+    p.module.path = os.path.join(helpers.test_dir, 'test_evaluate',
+                                 'buildout_project', 'src', 'proj_name',
+                                 'module_name.py')
+    paths = sys_path_with_modifications(Evaluator(grammar), p.module)
+    assert '/tmp/.buildout/eggs/important_package.egg' in paths
+
+
+def test_project_paths_cache(monkeypatch, tmpdir):
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir.mkdir('cache')))
+    tmpdir = tmpdir.mkdir('project')
+    tmpdir.join('buildout.cfg').write('')
+    script = tmpdir.mkdir('bin').join('app')
+    script.write("#!/usr/bin/python\nimport sys\nsys.path.append('/tmp/first')\n")
+    module_path = str(tmpdir.mkdir('src').join('module.py'))
+
+    def project_paths():
+        return _get_project_paths(Evaluator(load_grammar()), module_path)
+
+    assert project_paths() == ['/tmp/first']
+    cached = cache.SysPathCache.get(str(tmpdir.join('src')))
+    assert '/tmp/first' in cached
+
+    # Other files in the project (e.g. atomic saves of editors) don't matter.
+    src = tmpdir.join('src')
+    src.join('other.py').write('')
+    src.setmtime(src.mtime() + 10)
+    tmpdir.setmtime(tmpdir.mtime() + 10)
+    assert cache.SysPathCache.get(str(src)) == cached
+
+    # Changing the script invalidates the entry.
+    script.write("#!/usr/bin/python\nimport sys\nsys.path.append('/tmp/second')\n")
+    script.setmtime(script.mtime() + 10)
+    assert project_paths() == ['/tmp/second']
+
+    # As well as new Django projects.
+    tmpdir.join('manage.py').write('')
+    assert cache.SysPathCache.get(str(src)) is None
+    assert project_paths() == [str(tmpdir), '/tmp/second']
+
+
+def test_project_paths_cache_is_not_filtered(monkeypatch, tmpdir):
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir.mkdir('cache')))
+    tmpdir = tmpdir.mkdir('project')
+    tmpdir.join('buildout.cfg').write('')
+    tmpdir.mkdir('bin').join('app').write(
+        "#!/usr/bin/python\nimport sys\nsys.path.append('/tmp/first')\n")
+    module_path = str(tmpdir.mkdir('src').join('module.py'))
+
+    def project_paths():
+        return _get_project_paths(Evaluator(load_grammar()), module_path)
+
+    # A process with `/tmp/first` in its sys.path.
+    get_sys_path = sys_path.get_sys_path
+    monkeypatch.setattr(sys_path, 'get_sys_path',
+                        lambda: get_sys_path() + ['/tmp/first'])
+    assert project_paths() == []
+    assert '/tmp/first' in cache.SysPathCache.get(str(tmpdir.join('src')))
+
+    monkeypatch.setattr(sys_path, 'get_sys_path', get_sys_path)
+    assert project_paths() == ['/tmp/first']
+
+
+def test_execute_code_relative_to_module():
+    module_path = os.path.join(os.sep + 'some', 'dir', 'module.py')
+    assert _execute_code(module_path, "'../lib'") == \
+        [os.path.join(os.sep + 'some', 'lib')]
+    assert _execute_code(module_path, "abspath('lib')") == \
+        [os.path.join(os.sep + 'some', 'dir', 'lib')]
+    assert _execute_code(module_path, "os.path.abspath(os.getcwd())") == \
+        [os.path.join(os.sep + 'some', 'dir')]
@@ -1,9 +1,11 @@
 from jedi._compatibility import builtins, is_py3
 from jedi.parser import load_grammar
 from jedi.parser.tree import Function
-from jedi.evaluate import compiled, representation
+from jedi.evaluate import compiled, representation, precedence
 from jedi.evaluate import Evaluator
 from jedi import Script
+from jedi import settings
+from jedi import cache
 
 
 def test_simple():
@@ -65,3 +67,99 @@ def test_string_literals():
     else:
         assert typ('b""') == 'str'
         assert typ('u""') == 'unicode'
+
+
+def test_attribute_names():
+    class Foo(object):
+        bar = 1
+
+    obj = compiled.CompiledObject(Foo)
+    assert obj.get_subscope_by_name('bar').obj == 1
+    # The names are shared by all compiled objects of a class.
+    assert compiled._get_attribute_names(Foo) is compiled._attribute_names[id(Foo)][2]
+    names_dict = compiled.CompiledObject(Foo).names_dict
+    assert names_dict['bar'][0].parent.obj == 1
+    assert 'bar' in [n[0].value for n in names_dict.values()]
+
+    # Names are computed again, if attributes are added.
+    Foo.baz = ''
+    assert compiled.CompiledObject(Foo).get_subscope_by_name('baz').obj == ''
+    module = type(compiled)('jedi_attribute_module')
+    compiled._get_attribute_names(module)
+    module.new = 1.0
+    assert 'new' in compiled.CompiledObject(module).names_dict
+
+    # Rebound attributes have their current value.
+    module.new = ''
+    assert compiled.CompiledObject(module).get_subscope_by_name('new').obj == ''
+
+
+def test_attribute_names_are_bounded(monkeypatch):
+    monkeypatch.setattr(compiled, '_attribute_names', cache.LRUCache(2))
+    for cls in (int, str, float):
+        compiled._get_attribute_names(cls)
+    assert len(compiled._attribute_names) == 2
+    assert compiled._shared_attribute_names(float) is not None
+
+
+def test_fake_module_bundle(monkeypatch, tmpdir):
+    from jedi import settings, cache
+    from jedi.evaluate.compiled import fake
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir))
+    monkeypatch.setattr(fake, 'modules', {})
+
+    faked = fake._load_faked_module(builtins)
+    assert fake.search_scope(faked, 'str').type == 'classdef'
+    # Only the requested scopes are unpickled.
+    assert list(faked._scopes) == ['str']
+
+    path = fake._faked_module_path('builtins')
+    bundle = type(cache.FakeModuleBundle)()
+    scopes = bundle.load_module('builtins', path)
+    assert sorted(scopes) == sorted(faked._pickled_scopes)
+
+    # The entries are invalidated if the `.pym` file changes.
+    pym = tmpdir.join('foo.pym')
+    pym.write('def foo(): pass')
+    bundle.save_module('foo', str(pym), fake._pickle_scopes('foo', pym.read()))
+    assert list(bundle.load_module('foo', str(pym))) == ['foo']
+    pym.write('def foo(): return 1')
+    assert bundle.load_module('foo', str(pym)) is None
+
+
+def test_faked_docstring():
+    from jedi.evaluate.compiled import fake
+    func = fake.get_faked(builtins, list, 'pop')
+    assert func is fake.get_faked(builtins, list, 'pop')
+    # The docstring is only added once to the shared scope.
+    docstrings = [c for c in func.children[-1].children
+                  if c.type == 'simple_stmt' and c.children[0].type == 'string']
+    assert len(docstrings) == 1
+    assert func.raw_doc == list.pop.__doc__
+
+
+def test_limit_types(monkeypatch):
+    """Too many literals are widened to instances of their classes."""
+    e = Evaluator(load_grammar())
+    monkeypatch.setattr(settings, 'max_inferred_types', 5)
+    types = [compiled.create(e, i) for i in range(10)]
+    types += [compiled.create(e, str(i)) for i in range(10)]
+    limited = precedence.limit_types(e, types)
+    assert [str(t.name) for t in limited] == ['int', 'str']
+    assert precedence.limit_types(e, types[:5]) == types[:5]
+    assert not e.results_are_partial
+
+
+def test_limit_types_to_common_base(monkeypatch):
+    """Types that don't fit are widened to their common base class."""
+    monkeypatch.setattr(settings, 'max_inferred_types', 3)
+    source = 'class Base(object): pass\n'
+    source += ''.join('class C%s(Base): pass\n' % i for i in range(5))
+    source += 'for x in [%s]:\n    x' % ', '.join('C%s()' % i for i in range(5))
+    script = Script(source)
+    names = [d.name for d in script.goto_definitions()]
+    assert names == ['Base', 'C0', 'C1']
+    assert script.results_are_partial
+    # Reused results are still partial.
+    assert [d.name for d in script.goto_definitions()] == names
+    assert script.results_are_partial
@@ -4,6 +4,7 @@ Testing of docstring related issues and especially ``jedi.docstrings``.
 
 from textwrap import dedent
 import jedi
+from jedi.evaluate import docstrings
 from ..helpers import unittest
 
 try:
@@ -105,6 +106,30 @@ class TestDocstring(unittest.TestCase):
         assert '__init__' in names
         assert 'mro' not in names  # Exists only for types.
 
+    def test_docstring_index(self):
+        docstr = ':type a: str\n:param int b: text\n:type a: int\n:rtype: list'
+        index = docstrings._docstring_index(docstr)
+        assert index is docstrings._docstring_index(docstr)
+        assert index.params == {'a': ['str'], 'b': ['int']}
+        assert index.return_type == 'list'
+
+    def test_type_string_in_different_modules(self):
+        # The parsed type strings are shared, but the names are still looked
+        # up in the module of the docstring.
+        s = dedent("""
+            class A():
+                def %s(self): pass
+
+            def func(arg):
+                '''
+                :type arg: A
+                '''
+                arg.""")
+        for method in ('foo', 'bar'):
+            names = [c.name for c in jedi.Script(s % method).completions()]
+            assert method in names
+            assert len([n for n in names if n in ('foo', 'bar')]) == 1
+
     @unittest.skipIf(numpydoc_unavailable, 'numpydoc module is unavailable')
     def test_numpydoc_docstring(self):
         s = dedent('''
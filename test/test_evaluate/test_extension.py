@@ -2,6 +2,7 @@
 Test compiled module
 """
 import os
+import sys
 
 import jedi
 from ..helpers import cwd_at
@@ -55,3 +56,107 @@ def test_init_extension_module():
 
     s = jedi.Script('from init_extension_module import foo\nfoo', path='not_existing.py')
     assert ['foo'] == [c.name for c in s.completions()]
+
+
+@pytest.fixture
+def introspect_in_subprocess(monkeypatch):
+    from jedi import settings
+    monkeypatch.setattr(settings, 'introspect_compiled_modules_in_subprocess', True)
+    # `_ctypes` would be introspected directly if it was imported.
+    monkeypatch.delitem(sys.modules, '_ctypes', raising=False)
+
+
+@pytest.mark.usefixtures('introspect_in_subprocess')
+def test_subprocess_completions():
+    s = jedi.Script('import _ctypes; _ctypes.')
+    names = [c.name for c in s.completions()]
+    assert len(names) >= 15
+    assert 'dlopen' in names
+    assert '_ctypes' not in sys.modules
+
+    s = jedi.Script('import _ctypes; _ctypes.dlopen(')
+    sigs = s.call_signatures()
+    assert len(sigs) == 1
+    assert [p.name for p in sigs[0].params] == ['name', 'flag']
+
+    defs = jedi.Script('import _ctypes; _ctypes.Array').goto_definitions()
+    assert [d.type for d in defs] == ['class']
+
+
+@pytest.mark.usefixtures('introspect_in_subprocess')
+def test_subprocess_worker_crash(tmpdir):
+    from jedi.evaluate.compiled import mirror
+    tmpdir.join('crashing_module.py').write('import os\nos._exit(1)\n')
+    tmpdir.join('working_module.py').write('foo = 3\n')
+    sys_path = [str(tmpdir)]
+    assert mirror.load_module('crashing_module', sys_path) is None
+    module = mirror.load_module('working_module', sys_path)
+    assert module.get_subscope_by_name('foo').obj == 3
+
+
+@pytest.mark.usefixtures('introspect_in_subprocess')
+def test_subprocess_worker_not_startable(monkeypatch, tmpdir):
+    from jedi import settings
+    from jedi.evaluate.compiled import mirror
+    monkeypatch.setattr(settings, 'introspection_interpreter',
+                        str(tmpdir.join('missing_python')))
+    monkeypatch.setattr(mirror, '_modules', {})
+    mirror.IntrospectionWorker.stop()
+    tmpdir.join('working_module.py').write('foo = 3\n')
+    # The module is imported by this process instead.
+    module = mirror.load_module('working_module', [str(tmpdir)])
+    assert module.get_subscope_by_name('foo').obj == 3
+    assert 'working_module' in sys.modules
+    del sys.modules['working_module']
+
+
+@pytest.mark.usefixtures('isolated_jedi_cache')
+def test_persistent_snapshot(monkeypatch):
+    import _ctypes
+    from jedi import settings
+    from jedi.evaluate import compiled
+    from jedi.evaluate.compiled import mirror
+    path = _ctypes.__file__
+    monkeypatch.setattr(mirror, '_modules', {})
+    monkeypatch.delitem(sys.modules, '_ctypes')
+
+    # Snapshots are not used by default.
+    module = compiled.load_module(path)
+    assert not isinstance(module, mirror.MirrorObject)
+
+    monkeypatch.setattr(settings, 'cache_extension_module_snapshots', True)
+    monkeypatch.delitem(sys.modules, '_ctypes')
+    module = compiled.load_module(path)
+    assert isinstance(module, mirror.MirrorObject)
+    assert 'dlopen' in module.names_dict
+
+    # A new process would load the snapshot without importing the module.
+    monkeypatch.setattr(mirror, '_modules', {})
+    monkeypatch.delitem(sys.modules, '_ctypes')
+    module = compiled.load_module(path)
+    assert '_ctypes' not in sys.modules
+    dlopen = module.get_subscope_by_name('dlopen')
+    assert dlopen._node['signature'] == compiled._parse_function_doc(dlopen.doc)
+
+
+@pytest.mark.usefixtures('isolated_jedi_cache')
+def test_snapshot_invalidation(tmpdir):
+    from jedi.cache import SnapshotPickling
+    extension = tmpdir.join('foo.so')
+    extension.write('')
+    snapshot = {'root': 0, 'nodes': {0: {'value': 1}}}
+    SnapshotPickling.save_snapshot('foo', str(extension), snapshot)
+    assert SnapshotPickling.load_snapshot('foo', str(extension)) == snapshot
+
+    extension.write('changed')
+    assert SnapshotPickling.load_snapshot('foo', str(extension)) is None
+
+
+def test_snapshot_modules_use_sys_path(monkeypatch, tmpdir):
+    from jedi.evaluate.compiled import mirror
+    tmpdir.join('jedi_snapshot_module.py').write('foo = 1\n')
+    monkeypatch.delitem(sys.modules, 'jedi_snapshot_module', raising=False)
+    data = {'root': 0, 'nodes': {0: {'module': 'jedi_snapshot_module'}}}
+    module = mirror.Snapshot(data, [str(tmpdir)]).create(0)
+    assert module.obj is sys.modules['jedi_snapshot_module']
+    del sys.modules['jedi_snapshot_module']
@@ -57,3 +57,19 @@ def test_flask_ext(script, name):
 def test_not_importable_file():
     src = 'import not_importable_file as x; x.'
     assert not jedi.Script(src, path='example.py').completions()
+
+
+def test_file_contains_name(tmpdir):
+    from jedi.evaluate.imports import _file_contains_name
+    f = tmpdir.join('module.py')
+    f.write_binary(b'# -*- coding: utf-8 -*-\nfoobar = 1\nbar_baz(\xc3\xa4bar)\n')
+    assert _file_contains_name(str(f), 'foobar')
+    assert _file_contains_name(str(f), 'bar_baz')
+    assert not _file_contains_name(str(f), 'foo')
+    assert not _file_contains_name(str(f), 'bar')
+    assert not _file_contains_name(str(f), 'baz')
+
+    empty = tmpdir.join('empty.py')
+    empty.write('')
+    assert not _file_contains_name(str(empty), 'foo')
+    assert not _file_contains_name(str(tmpdir.join('missing.py')), 'foo')
@@ -1,6 +1,7 @@
 from textwrap import dedent
 
 from jedi import Script
+from jedi.evaluate import representation as er
 
 
 def get_definition_and_evaluator(source):
@@ -34,3 +35,89 @@ def test_class_mro():
     cls, evaluator = get_definition_and_evaluator(s)
     mro = cls.py__mro__(evaluator)
     assert [str(c.name) for c in mro] == ['X', 'object']
+
+
+def test_parameter_independent_function():
+    s = """
+    def x(a, b=3):
+        def inner(c):
+            return c
+        return str()
+    def y(a):
+        def inner():
+            return a
+        return inner()
+    x"""
+    func, evaluator = get_definition_and_evaluator(s)
+    assert not func._uses_params()
+    # All the executions share the return types.
+    first = evaluator.execute_evaluated(func, 1)
+    assert first == evaluator.execute_evaluated(func, '')
+    assert first[0] is evaluator.execute(func)[0]
+
+    func = evaluator.wrap(func.get_parent_until().subscopes[1])
+    assert func._uses_params()
+
+
+def test_class_hierarchy_cache():
+    s = """
+    class A(object):
+        pass
+    class B(A):
+        pass
+    B"""
+    cls, evaluator = get_definition_and_evaluator(s)
+    assert [str(c.name) for c in cls.py__mro__(evaluator)] == ['B', 'A', 'object']
+
+    # Another evaluator uses the cached bases.
+    cls, evaluator = get_definition_and_evaluator(s)
+    assert er._cached_bases(evaluator, cls.base) is not None
+    assert [str(c.name) for c in cls.py__mro__(evaluator)] == ['B', 'A', 'object']
+
+    # The bases are evaluated again if a module changes.
+    s = s.replace('class A(object):', 'class A(str):')
+    cls, evaluator = get_definition_and_evaluator(s)
+    assert er._cached_bases(evaluator, cls.base) is None
+    assert [str(c.name) for c in cls.py__mro__(evaluator)] == ['B', 'A', 'str', 'object']
+
+
+def test_class_hierarchy_cache_of_reexports(tmpdir):
+    tmpdir.join('b.py').write(dedent("""
+    class Base1(object):
+        def one(self): pass
+    class Base2(object):
+        def two(self): pass
+    """))
+    a = tmpdir.join('a.py')
+    a.write('from b import Base1 as Base\n')
+    source = 'from a import Base\nclass C(Base): pass\nC().'
+    path = str(tmpdir.join('main.py'))
+
+    def completions():
+        return [c.name for c in Script(source, path=path).completions()]
+
+    assert 'one' in completions()
+    assert 'one' in completions()
+    a.write('from b import Base2 as Base\n')
+    a.setmtime(a.mtime() + 10)
+    names = completions()
+    assert 'two' in names and 'one' not in names
+
+
+def test_function_execution_copies_lazily():
+    s = """
+    def x():
+        a = [1, 2, 3]
+        for i in a:
+            if i:
+                a.append(str(i))
+        return 1.0
+    x"""
+    func, evaluator = get_definition_and_evaluator(s)
+    execution = er.FunctionExecution(evaluator, func)
+    return_stmt = execution.returns[0]
+    assert return_stmt.get_parent_until(er.FunctionExecution) is execution
+    assert [t.name.value for t in execution.get_return_types()] == ['float']
+    # Only the nodes that are needed are copied, ``str(i)`` isn't.
+    str_call = func.base_func.names_dict['str'][0].parent
+    assert str_call not in execution._overlay._nodes
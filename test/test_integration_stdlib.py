@@ -39,3 +39,25 @@ def test_namedtuple_list():
         assert completions == set()
     else:
         assert completions == set(['legs', 'length', 'large'])
+
+
+def test_namedtuple_class_cache():
+    source = "import collections\n" + \
+             "Point = collections.namedtuple('Point', 'x y')\n" + \
+             "Point"
+    if not is_py26:
+        first, = Script(source).goto_definitions()
+        second, = Script(source).goto_definitions()
+        # The generated class is only parsed once.
+        assert first._definition.base is second._definition.base
+
+
+def test_namedtuple_class_cache_is_bounded(monkeypatch):
+    from jedi import cache
+    from jedi.evaluate import stdlib
+    monkeypatch.setattr(stdlib, '_namedtuple_classes', cache.LRUCache(2))
+    for name in 'ABCDE':
+        source = "import collections\n" + \
+                 "%s = collections.namedtuple('%s', 'x y')\n%s" % (name, name, name)
+        assert Script(source).goto_definitions()
+    assert len(stdlib._namedtuple_classes) <= 2
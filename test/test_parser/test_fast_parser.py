@@ -438,3 +438,38 @@ def test_string_literals():
 
     script = jedi.Script(dedent(source))
     assert script.completions()
+
+
+def test_self_names_after_nested_scopes():
+    """
+    The ``self.foo`` names of a function can be in other parser nodes.
+    """
+    src = dedent("""
+    class A:
+        def __init__(self):
+            self.a = 1
+            def f():
+                pass
+            self.b = 1
+    """)
+    func = FastParser(load_grammar(), u(src)).module.subscopes[0].subscopes[0]
+    assert sorted(func.self_names_dict) == ['a', 'b']
+
+
+def test_self_names_with_nested_merged_dicts():
+    """
+    Closing nested parser nodes can merge the names of a function twice.
+    """
+    src = dedent("""
+    def f(a,
+                        b):
+        def func(function):
+            def wrapper(obj):
+                    if obj:
+                            obj.a = 1
+            return wrapper
+        return func
+    """)
+    module = FastParser(load_grammar(), u(src)).module
+    wrapper = module.subscopes[0].subscopes[0].subscopes[0]
+    assert [n.value for n in wrapper.names_dict['obj']] == ['obj', 'obj', 'obj']
@@ -213,3 +213,18 @@ def test_backslash_dos_style():
     grammar = load_grammar()
     m = Parser(grammar, u('\\\r\n')).module
     assert m
+
+
+def test_array_mutations():
+    src = u('a = []\na.append(1)\na.b.extend(x)\nc.add()\nd.update\nset().add(2)\n')
+    m = Parser(load_grammar(), src).module
+    mutations = dict((key, [n.start_pos for n in names])
+                     for key, names in m.array_mutations.items())
+    assert mutations == {'a': [(2, 2)], None: [(3, 4), (6, 6)]}
+
+
+def test_self_names_dict():
+    src = u('def f(self, x):\n self.a = x\n self.b.c = 1\n x.d = 1\n self.a += 1\n')
+    func = Parser(load_grammar(), src).module.subscopes[0]
+    assert [(key, [n.start_pos for n in names])
+            for key, names in func.self_names_dict.items()] == [('a', [(2, 6), (5, 6)])]
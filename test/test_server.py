@@ -0,0 +1,162 @@
+"""
+Tests of ``python -m jedi serve``. The sessions in ``test/server_sessions``
+are replayed against a server process: ``send`` steps are written to the
+server, ``expect`` steps are compared with the next message of the server.
+
+Expected messages only need to contain a subset of the keys of the actual
+messages. ``{"$contains": [...]}`` matches lists that contain all the given
+items in any order.
+"""
+import glob
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import jedi
+from jedi import server
+from jedi.server import read_message, write_message
+
+
+SESSION_DIR = os.path.join(os.path.dirname(__file__), 'server_sessions')
+
+
+def matches(expected, actual):
+    if isinstance(expected, dict):
+        if '$contains' in expected:
+            return isinstance(actual, list) and all(
+                any(matches(e, a) for a in actual) for e in expected['$contains'])
+        return isinstance(actual, dict) and all(
+            key in actual and matches(value, actual[key])
+            for key, value in expected.items())
+    elif isinstance(expected, list):
+        return isinstance(actual, list) and len(expected) == len(actual) \
+            and all(matches(e, a) for e, a in zip(expected, actual))
+    return expected == actual
+
+
+@pytest.mark.parametrize('session', sorted(glob.glob(os.path.join(SESSION_DIR, '*.json'))))
+def test_session(session):
+    with open(session) as f:
+        steps = json.load(f)
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(jedi.__file__))
+    process = subprocess.Popen([sys.executable, '-m', 'jedi', 'serve'],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               env=env)
+    # A server that hangs is killed, reading from it and waiting for it fail
+    # then. `Popen.wait` has no timeout in Python 2.
+    watchdog = threading.Timer(60, process.kill)
+    watchdog.start()
+    try:
+        for step in steps:
+            if 'send' in step:
+                write_message(process.stdin, step['send'])
+            else:
+                message = read_message(process.stdout)
+                assert matches(step['expect'], message), message
+        # The server stops after `exit`.
+        assert process.wait() == 0
+    finally:
+        watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def _responses(writer):
+    reader = io.BytesIO(writer.getvalue())
+    return list(iter(lambda: read_message(reader), None))
+
+
+def test_cancel_request():
+    writer = io.BytesIO()
+    s = server.Server(io.BytesIO(), writer)
+    s.receive({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+        'textDocument': {'uri': 'file:///example.py', 'text': 'import os\nos.'}}})
+    completion = {'jsonrpc': '2.0', 'id': 1, 'method': 'textDocument/completion',
+                  'params': {'textDocument': {'uri': 'file:///example.py'},
+                             'position': {'line': 1, 'character': 3}}}
+    s.receive(completion)
+    # The request is cancelled, before it is evaluated.
+    s.receive({'jsonrpc': '2.0', 'method': '$/cancelRequest', 'params': {'id': 1}})
+    for _ in range(2):
+        s.handle(s._messages.get())
+
+    completion['id'] = 2
+    s.receive(completion)
+    s.handle(s._messages.get())
+
+    cancelled, response = _responses(writer)
+    assert cancelled == {'jsonrpc': '2.0', 'id': 1, 'error': {
+        'code': server.REQUEST_CANCELLED, 'message': 'Request cancelled.'}}
+    assert response['id'] == 2
+    assert 'path' in [item['label'] for item in response['result']['items']]
+
+
+def test_timeout_starts_when_handled():
+    writer = io.BytesIO()
+    s = server.Server(io.BytesIO(), writer, timeout=1)
+    s.receive({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+        'textDocument': {'uri': 'file:///example.py', 'text': 'import os\nos.'}}})
+    s.receive({'jsonrpc': '2.0', 'id': 1, 'method': 'textDocument/completion',
+               'params': {'textDocument': {'uri': 'file:///example.py'},
+                          'position': {'line': 1, 'character': 3}}})
+    # Waiting in the queue doesn't count against the timeout.
+    time.sleep(1.1)
+    for _ in range(2):
+        s.handle(s._messages.get())
+
+    response, = _responses(writer)
+    assert 'path' in [item['label'] for item in response['result']['items']]
+
+
+def test_duplicate_request_ids():
+    writer = io.BytesIO()
+    s = server.Server(io.BytesIO(), writer)
+    shutdown = {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'}
+    s.receive(shutdown)
+    s.receive(shutdown)
+    s.handle(s._messages.get())
+    assert s._messages.empty()
+
+    duplicate, response = _responses(writer)
+    assert duplicate['error']['code'] == server.INVALID_REQUEST
+    assert response == {'jsonrpc': '2.0', 'id': 1, 'result': None}
+
+
+def test_invalid_request_ids():
+    reader = io.BytesIO()
+    for message in [{'jsonrpc': '2.0', 'id': [1], 'method': 'shutdown'},
+                    {'jsonrpc': '2.0', 'method': '$/cancelRequest',
+                     'params': {'id': {}}},
+                    {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'},
+                    {'jsonrpc': '2.0', 'method': 'exit'}]:
+        write_message(reader, message)
+    reader.seek(0)
+    writer = io.BytesIO()
+    assert server.Server(reader, writer).serve()
+
+    invalid, response = _responses(writer)
+    assert invalid['id'] is None
+    assert invalid['error']['code'] == server.INVALID_REQUEST
+    assert response == {'jsonrpc': '2.0', 'id': 1, 'result': None}
+
+
+def test_incremental_changes():
+    document = server.Document('file:///example.py', 'a = 1\nb = 2\n')
+    document.apply_change({'range': {'start': {'line': 1, 'character': 0},
+                                     'end': {'line': 1, 'character': 1}},
+                           'text': 'bb'})
+    document.apply_change({'range': {'start': {'line': 0, 'character': 5},
+                                     'end': {'line': 1, 'character': 0}},
+                           'text': '0; '})
+    assert document.text == 'a = 10; bb = 2\n'
+    document.apply_change({'text': 'c'})
+    assert document.text == 'c'
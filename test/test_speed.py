@@ -5,6 +5,8 @@ should.
 
 import time
 import functools
+import subprocess
+import sys
 
 from .helpers import TestCase, cwd_at
 import jedi
@@ -51,3 +53,40 @@ class TestSpeed(TestCase):
         with open('speed/precedence.py') as f:
             line = len(f.read().splitlines())
         assert jedi.Script(line=line, path='speed/precedence.py').goto_definitions()
+
+    @_check_speed(0.5)
+    def test_chained_attribute_access(self):
+        """
+        Long inference chains shouldn't make recursion checks slow.
+        """
+        s = 'class A(object):\n    def f(self):\n        return self\na0 = A()\n'
+        s += ''.join('a%s = a%s.f()\n' % (i, i - 1) for i in range(1, 60))
+        s += 'a59.f'
+        assert [c.name for c in jedi.Script(s).completions()] == ['f']
+
+    @_check_speed(0.5)
+    def test_redefined_names(self):
+        """
+        Names that are redefined a lot shouldn't be filtered and sorted for
+        every lookup.
+        """
+        s = ''.join('x = %s\n' % i for i in range(500)) + 'x'
+        defs = jedi.Script(s).goto_assignments()
+        assert [d.line for d in defs] == [500]
+
+    def test_import_speed(self):
+        """
+        ``import jedi`` shouldn't do any work that is only needed later on,
+        e.g. importing modules like ``pydoc``.
+        """
+        code = ('import sys, time; t = time.time(); import jedi; '
+                'print(time.time() - t); '
+                'print(" ".join(sorted(sys.modules)))')
+        process = subprocess.Popen([sys.executable, '-c', code],
+                                   stdout=subprocess.PIPE)
+        output = process.communicate()[0]
+        import_time, modules = output.decode().splitlines()
+        assert float(import_time) < 0.5
+        modules = modules.split()
+        for module in ('pydoc', 'platform', 'hashlib', 'shutil', 'jedi.api'):
+            assert module not in modules
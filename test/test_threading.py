@@ -0,0 +1,170 @@
+"""
+Tests of :class:`jedi.Script` objects that are used by different threads at
+the same time.
+"""
+import pickle
+import threading
+
+from jedi import Script
+from jedi import cache
+from jedi import settings
+from jedi._compatibility import u
+from jedi.parser import load_grammar
+from jedi.parser.fast import FastParser
+
+
+SOURCE = '''\
+import os
+import json
+from collections import defaultdict
+
+
+def func(a, b=3):
+    """:type a: str"""
+    return a.upper()
+
+lst = []
+lst.append(1.0)
+counts = defaultdict(list)
+result = func('x')
+'''
+
+QUERIES = [
+    ('completions', SOURCE + 'os.ge', None),
+    ('completions', SOURCE + 'json.lo', None),
+    ('completions', SOURCE + 'lst[0].rea', None),
+    ('goto_definitions', SOURCE + 'lst[0]', None),
+    ('goto_definitions', SOURCE + 'counts', None),
+    ('goto_assignments', SOURCE + 'func', None),
+    ('usages', SOURCE + 'func', None),
+    ('call_signatures', SOURCE + 'func(1, ', None),
+    ('completions', 'import datetime\ndatetime.date.tod', None),
+    # Scripts of the same file in different threads.
+    ('completions', SOURCE + 'os.chd', 'example.py'),
+    ('goto_definitions', SOURCE + 'func', 'example.py'),
+]
+
+
+def _run(method, source, path):
+    """Returns the results of a query as plain data, that can be compared."""
+    lines = source.splitlines()
+    script = Script(source, len(lines), len(lines[-1]), path)
+    return [(r.name, r.type, r.line, r.column, r.module_name)
+            for r in getattr(script, method)()]
+
+
+def _run_threads(target, number):
+    errors = []
+
+    def run():
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(number)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_queries():
+    expected = [_run(*query) for query in QUERIES]
+    assert all(expected)
+    results = []
+
+    def run_queries():
+        for i in range(len(QUERIES)):
+            # Every thread starts with another query.
+            index = (i + len(results)) % len(QUERIES)
+            results.append((index, _run(*QUERIES[index])))
+
+    _run_threads(run_queries, 8)
+    assert len(results) == 8 * len(QUERIES)
+    for index, result in results:
+        assert result == expected[index], QUERIES[index]
+
+
+def test_settings_are_not_changed():
+    """Scripts change settings only for their own evaluator."""
+    observed = set()
+    stop = threading.Event()
+
+    def observe():
+        while not stop.is_set():
+            observed.add((settings.dynamic_flow_information,
+                          settings.max_executions))
+
+    thread = threading.Thread(target=observe)
+    thread.start()
+    try:
+        for _ in range(3):
+            _run('usages', SOURCE + 'func', None)
+            _run('call_signatures', SOURCE + 'func(', None)
+    finally:
+        stop.set()
+        thread.join()
+    assert observed == set([(True, settings.max_executions)])
+
+
+def test_override_settings():
+    evaluator = Script('')._evaluator
+    max_executions = settings.max_executions
+    with evaluator.override_settings(max_executions=2):
+        assert evaluator.setting('max_executions') == 2
+        assert settings.max_executions == max_executions
+    assert evaluator.setting('max_executions') == max_executions
+
+
+def test_parsers_of_other_threads():
+    """A cached parser is never updated by other threads."""
+    grammar = load_grammar()
+    parsers = []
+
+    def parse(source):
+        parser = FastParser(grammar, u(source), 'thread.py')
+        cache.save_parser('thread.py', parser, pickling=False)
+        parsers.append(parser)
+
+    try:
+        _run_threads(lambda: parse('a = 1\n'), 1)
+        parse('b = 2\n')
+        assert parsers[1] is not parsers[0]
+        assert parsers[0].module.get_code() == 'a = 1\n'
+        # The own parsers are still updated.
+        parse('c = 3\n')
+        assert parsers[2] is parsers[1]
+    finally:
+        cache.parser_cache.pop('thread.py', None)
+
+
+def test_parsers_loaded_by_other_threads(tmpdir):
+    """Parsers that other threads got from the cache are not updated."""
+    path = str(tmpdir.join('loaded.py'))
+    with open(path, 'w') as f:
+        f.write('a = 1\n')
+    grammar = load_grammar()
+    loaded = []
+    try:
+        parser = FastParser(grammar, u('a = 1\n'), path)
+        cache.save_parser(path, parser, pickling=False)
+        _run_threads(lambda: loaded.append(cache.load_parser(path)), 1)
+        assert loaded == [parser]
+        assert FastParser(grammar, u('b = 2\n'), path) is not parser
+        assert parser.module.get_code() == 'a = 1\n'
+    finally:
+        cache.parser_cache.pop(path, None)
+
+
+def test_unpickled_parsers_belong_to_the_loading_thread():
+    parser = FastParser(load_grammar(), u('a = 1\n'), 'pickled.py')
+    idents = []
+
+    def load():
+        idents.append(pickle.loads(pickle.dumps(parser)).thread_ident)
+
+    _run_threads(load, 1)
+    assert idents[0] is not None
+    assert idents[0] != parser.thread_ident